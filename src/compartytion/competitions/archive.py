@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Type
+
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework.permissions import SAFE_METHODS
+
+from .models import (
+    Competition,
+    Rule,
+    Management,
+    Participant,
+    Applicant,
+    Match,
+    Standing,
+    ArchivedRule,
+    ArchivedManagement,
+    ArchivedParticipant,
+    ArchivedApplicant,
+    ArchivedMatch,
+    ArchivedStanding,
+)
+
+# 보관할 하위 목록과 그 보관 테이블. 참가자는 경기/순위가 참조하므로 먼저 옮긴다.
+ARCHIVES: Dict[Type[models.Model], Type[models.Model]] = {
+    Participant: ArchivedParticipant,
+    Applicant: ArchivedApplicant,
+    Management: ArchivedManagement,
+    Rule: ArchivedRule,
+    Match: ArchivedMatch,
+    Standing: ArchivedStanding,
+}
+
+
+def get_archive_after() -> timedelta:
+    return timedelta(days=getattr(settings, "COMPETITION_ARCHIVE_AFTER_DAYS", 90))
+
+
+def get_batch_size() -> int:
+    return getattr(settings, "COMPETITION_ARCHIVE_BATCH_SIZE", 100)
+
+
+def get_archivable_ids(
+    now: Optional[datetime] = None, limit: Optional[int] = None
+) -> List:
+    """완료되고 나서 보관 기준 기간이 지난, 아직 보관하지 않은 대회 id 목록"""
+    now = now or timezone.now()
+    return list(
+        Competition.objects.filter(
+            status=Competition.StatusChoices.DONE, archived_at__isnull=True
+        )
+        .alias(finished_at=Coalesce("end_at", "updated_at"))
+        .filter(finished_at__lte=now - get_archive_after())
+        .order_by("finished_at")
+        .values_list("pk", flat=True)[: limit or get_batch_size()]
+    )
+
+
+def move_rows(model: Type[models.Model], archive: Type[models.Model], ids: List):
+    """한 문장의 DELETE ... RETURNING 을 INSERT 로 이어 대회들의 행을 id 그대로 옮긴다."""
+    columns = ", ".join(
+        connection.ops.quote_name(f.column)
+        for f in model._meta.concrete_fields
+        if not f.generated
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {model._meta.db_table}
+                WHERE competition_id = ANY(%s)
+                RETURNING *
+            )
+            INSERT INTO {archive._meta.db_table} ({columns})
+            SELECT {columns} FROM moved
+            """,
+            [ids],
+        )
+        return cursor.rowcount
+
+
+def archive_competitions(competition_ids: List) -> List:
+    """
+    대회들의 하위 목록을 보관 테이블로 옮기고, 옮긴 대회 id 목록을 반환한다.
+    대회 행을 잠그고 완료/미보관 상태를 다시 확인하므로, 여러 작업자가 같은 대회를 옮기지 않는다.
+    외래 키는 커밋 때 검사되므로 테이블을 옮기는 순서와 상관없이 한 트랜잭션 안에서 일관된다.
+    """
+    with transaction.atomic():
+        ids = list(
+            Competition.objects.select_for_update(skip_locked=True)
+            .filter(
+                pk__in=competition_ids,
+                status=Competition.StatusChoices.DONE,
+                archived_at__isnull=True,
+            )
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        if not ids:
+            return []
+        for model, archive in ARCHIVES.items():
+            move_rows(model, archive, ids)
+        Competition.objects.filter(pk__in=ids).update(archived_at=timezone.now())
+    return ids
+
+
+def is_archived(competition_id) -> bool:
+    return Competition.objects.filter(
+        pk=competition_id, archived_at__isnull=False
+    ).exists()
+
+
+def get_model(model: Type[models.Model], competition) -> Type[models.Model]:
+    """
+    보관된 대회면 하위 목록을 읽을 보관 테이블의 모델을 돌려준다.
+    대회 인스턴스를 받으면 archived_at 을 보고, id 를 받으면 한 번 조회한다.
+    """
+    if isinstance(competition, Competition):
+        archived = competition.archived_at is not None
+    else:
+        archived = is_archived(competition)
+    return ARCHIVES[model] if archived else model
+
+
+class ArchiveReadMixin:
+    """
+    보관된 대회의 하위 목록을 읽기 요청에서만 보관 테이블로 돌려 읽는다.
+    쓰기 요청은 원래 테이블을 보므로 보관된 대회의 행은 찾지 못한다(404).
+    """
+
+    def get_source(self, model: Type[models.Model]) -> Type[models.Model]:
+        if self.request.method in SAFE_METHODS:
+            return get_model(model, self.kwargs["competition_pk"])
+        return model
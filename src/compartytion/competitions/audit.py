@@ -0,0 +1,48 @@
+from typing import List
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.permissions import SAFE_METHODS
+
+from .models import AuditEvent
+
+
+class AuditMixin:
+    """
+    뷰가 요청 중에 남긴 변경 기록을 모아 두었다가,
+    응답이 성공이면 요청마다 한 번의 INSERT 로 쓴다.
+    쓰기 요청은 뷰의 변경과 같은 트랜잭션에서 쓰므로, 기록을 쓰지 못하면 변경도 롤백된다.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in SAFE_METHODS:
+            return super().dispatch(request, *args, **kwargs)
+        with transaction.atomic():
+            return super().dispatch(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        self.audit_events: List[AuditEvent] = []
+        super().initial(request, *args, **kwargs)
+
+    def audit(self, competition_id, event: str, target_id=None, **data) -> None:
+        user = self.request.user
+        self.audit_events.append(
+            AuditEvent(
+                competition_id=competition_id,
+                actor_id=user.pk if user.is_authenticated else None,
+                event=event,
+                target_id=None if target_id is None else str(target_id),
+                data=data,
+            )
+        )
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        events = getattr(self, "audit_events", None)
+        if events and response.status_code < 400:
+            # 변경 피드는 최근 기록을 잠시 내주지 않으므로, 시각은 커밋 직전에 찍는다.
+            now = timezone.now()
+            for event in events:
+                event.created_at = now
+            AuditEvent.objects.bulk_create(events)
+        return response
@@ -0,0 +1,28 @@
+import heapq
+from typing import List, Sequence
+
+
+def partition_balanced(weights: Sequence[float], num_of_teams: int) -> List[int]:
+    """
+    항목들을 `num_of_teams` 개의 팀으로 나눠, 팀별 가중치 합이 비슷하도록 한다.
+    각 항목이 속할 팀의 번호(0부터)를 반환한다.
+
+    가중치가 큰 항목부터 한 번에 팀 수만큼씩 꺼내, 그중 가장 큰 항목을
+    합이 가장 작은 팀에 배정하는 greedy LPT 방식이다.
+    한 차례에 모든 팀이 하나씩 받으므로 팀 인원 차이는 최대 1명이다.
+    O(n log n + n log k)
+    """
+    if num_of_teams < 1:
+        raise ValueError("num_of_teams must be positive")
+
+    assignment = [0] * len(weights)
+    ranked = sorted(range(len(weights)), key=lambda i: weights[i], reverse=True)
+    heap = [(0.0, team) for team in range(num_of_teams)]
+
+    for start in range(0, len(ranked), num_of_teams):
+        batch = ranked[start : start + num_of_teams]
+        lightest = [heapq.heappop(heap) for _ in batch]
+        for (total, team), item in zip(lightest, batch):
+            assignment[item] = team
+            heapq.heappush(heap, (total + weights[item], team))
+    return assignment
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from functools import cache
+from typing import Any, Dict, Optional, Set
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+
+def competition_channel(competition_id) -> str:
+    return f"competition:{competition_id}"
+
+
+def format_event(event: str, data: Dict[str, Any]) -> str:
+    payload = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    async def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class BaseBroker:
+    """
+    대회 이벤트를 구독자들에게 전달하는 브로커.
+    메시지는 발행 시점에 한 번만 직렬화되고, 구독자들은 같은 문자열을 공유한다.
+    """
+
+    def publish(self, channel: str, message: str) -> None:
+        raise NotImplementedError
+
+    def subscribe(self, channel: str) -> Subscription:
+        raise NotImplementedError
+
+
+class LocalSubscription(Subscription):
+    def __init__(self, broker: "LocalBroker", channel: str, maxsize: int):
+        self.broker = broker
+        self.channel = channel
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    def push(self, message: str) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힌 구독은 정리한다.
+            self.close()
+
+    def _put(self, message: str) -> None:
+        # 느린 구독자는 가장 오래된 메시지를 버리고 최신 상태를 따라간다.
+        if self._queue.full():
+            self._queue.get_nowait()
+        self._queue.put_nowait(message)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker(BaseBroker):
+    """프로세스 내부 pub/sub. 다른 프로세스로는 메시지가 전달되지 않는다."""
+
+    def __init__(self, queue_size: Optional[int] = None):
+        self.queue_size = queue_size or getattr(
+            settings, "COMPETITION_EVENT_QUEUE_SIZE", 100
+        )
+        self._lock = threading.Lock()
+        self._channels: Dict[str, Set[LocalSubscription]] = defaultdict(set)
+
+    def publish(self, channel: str, message: str) -> None:
+        with self._lock:
+            subscriptions = list(self._channels.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.push(message)
+
+    def subscribe(self, channel: str) -> LocalSubscription:
+        subscription = LocalSubscription(self, channel, self.queue_size)
+        with self._lock:
+            self._channels[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LocalSubscription) -> None:
+        with self._lock:
+            subscriptions = self._channels.get(subscription.channel)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._channels[subscription.channel]
+
+    def num_of_subscriptions(self, channel: str) -> int:
+        with self._lock:
+            return len(self._channels.get(channel, ()))
+
+
+@cache
+def get_broker() -> BaseBroker:
+    broker_class = import_string(
+        getattr(
+            settings,
+            "COMPETITION_EVENT_BROKER",
+            "compartytion.competitions.broadcast.LocalBroker",
+        )
+    )
+    return broker_class()
+
+
+def publish_competition_event(competition_id, event: str, data: Dict[str, Any]):
+    message = format_event(event, data)
+    channel = competition_channel(competition_id)
+    transaction.on_commit(lambda: get_broker().publish(channel, message))
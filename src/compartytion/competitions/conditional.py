@@ -0,0 +1,54 @@
+import hashlib
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from .models import Competition
+
+
+def condition_on_competition(*fields: str, lookup: str = "pk", per_user=False):
+    """
+    대회의 갱신 시각(`fields`)으로 ETag/Last-Modified 를 만들어
+    If-None-Match/If-Modified-Since 조건부 GET 을 처리한다.
+    304 응답은 갱신 시각만 조회하고, 직렬화 없이 바로 반환한다.
+    """
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            values = (
+                Competition.objects.filter(pk=kwargs.get(lookup))
+                .values_list(*fields)
+                .first()
+            )
+            if values is None:
+                return view_method(self, request, *args, **kwargs)
+
+            last_modified = max(values)
+            source = [request.get_full_path(), *(v.isoformat() for v in values)]
+            if per_user:
+                source.append(str(request.user.pk))
+            etag = quote_etag(
+                hashlib.md5(
+                    "|".join(source).encode(), usedforsecurity=False
+                ).hexdigest()
+            )
+
+            response = get_conditional_response(
+                request, etag=etag, last_modified=int(last_modified.timestamp())
+            )
+            if response is None:
+                response = view_method(self, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response.headers.setdefault("ETag", etag)
+                response.headers.setdefault(
+                    "Last-Modified", http_date(last_modified.timestamp())
+                )
+            if per_user:
+                patch_vary_headers(response, ("Authorization",))
+            return response
+
+        return wrapper
+
+    return decorator
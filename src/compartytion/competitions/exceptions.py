@@ -20,6 +20,41 @@ class NotApplied(APIException):
     default_code = "NotApplied"
 
 
+class RecruitmentClosed(APIException):
+    status_code = 409
+    default_detail = _("모집이 마감된 대회입니다.")
+    default_code = "RecruitmentClosed"
+
+
+class CompetitionFull(APIException):
+    status_code = 409
+    default_detail = _("정원과 대기 인원이 모두 찬 대회입니다.")
+    default_code = "CompetitionFull"
+
+
+class ContentVersionConflict(APIException):
+    status_code = 409
+    default_detail = _("다른 사용자가 먼저 내용을 수정했습니다.")
+    default_code = "ContentVersionConflict"
+
+    def __init__(self, content_version: int):
+        super().__init__()
+        # 클라이언트가 새 판을 다시 읽지 않고도 비교할 수 있게 현재 판 번호를 함께 보낸다.
+        self.detail = {"detail": self.detail, "content_version": content_version}
+
+
+class InvalidPatch(APIException):
+    status_code = 422
+    default_detail = _("패치를 적용할 수 없습니다.")
+    default_code = "InvalidPatch"
+
+
 class InvalidRequest(APIException):
     status_code = 400
     default_code = "InvalidRequest"
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = 422
+    default_detail = _("같은 멱등 키로 다른 요청을 보낼 수 없습니다.")
+    default_code = "IdempotencyKeyReused"
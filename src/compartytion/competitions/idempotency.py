@@ -0,0 +1,118 @@
+import hashlib
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .exceptions import IdempotencyKeyReused
+from .models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = IdempotencyKey._meta.get_field("key").max_length
+
+
+def get_ttl() -> timedelta:
+    return timedelta(
+        seconds=getattr(settings, "IDEMPOTENCY_KEY_TTL_SECONDS", 24 * 60 * 60)
+    )
+
+
+def get_fingerprint(request) -> str:
+    digest = hashlib.sha256()
+    for part in (request.method, request.path):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(request.body)
+    return digest.hexdigest()
+
+
+def claim_key(key: str, account_id, fingerprint: str):
+    """
+    (계정, 키) 행을 새로 넣거나 만료된 행을 다시 차지하고, 차지했으면 id 를 반환한다.
+    같은 키로 처리 중인 요청이 있으면 유니크 인덱스에서 그 트랜잭션이 끝날 때까지 기다린다.
+    """
+    now = timezone.now()
+    table = IdempotencyKey._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} AS k
+                (key, account_id, fingerprint, created_at, expires_at)
+            VALUES (%(key)s, %(account_id)s, %(fingerprint)s, %(now)s, %(expires_at)s)
+            ON CONFLICT (account_id, key) DO UPDATE
+            SET fingerprint = EXCLUDED.fingerprint,
+                status_code = NULL,
+                body = NULL,
+                created_at = EXCLUDED.created_at,
+                expires_at = EXCLUDED.expires_at
+            WHERE k.expires_at <= %(now)s
+            RETURNING id
+            """,
+            {
+                "key": key,
+                "account_id": account_id,
+                "fingerprint": fingerprint,
+                "now": now,
+                "expires_at": now + get_ttl(),
+            },
+        )
+        row = cursor.fetchone()
+    return row and row[0]
+
+
+def idempotent(view_method):
+    """
+    Idempotency-Key 헤더가 있으면 처음 요청의 응답을 보관했다가,
+    같은 키로 다시 온 요청에는 검증, 비밀번호 해싱, INSERT 없이 그 응답을 돌려준다.
+    키 행의 INSERT 와 뷰를 한 트랜잭션에서 실행하므로, 동시에 온 재시도는 처음 요청이 끝날 때까지
+    기다렸다가 그 응답을 받고, 처음 요청이 실패해 롤백되면 키도 함께 사라진다.
+    같은 키에 다른 요청 본문이 오면 422 로 거절한다. 5xx 응답은 보관하지 않는다.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if key is None:
+            return view_method(self, request, *args, **kwargs)
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise ValidationError(
+                {
+                    HEADER: _("멱등 키는 1~%(max)d자여야 합니다.")
+                    % {"max": MAX_KEY_LENGTH}
+                }
+            )
+
+        account_id = request.user.id if request.user.is_authenticated else None
+        fingerprint = get_fingerprint(request)
+        with transaction.atomic():
+            record_id = claim_key(key, account_id, fingerprint)
+            if record_id is None:
+                record = IdempotencyKey.objects.get(account_id=account_id, key=key)
+                if record.fingerprint != fingerprint:
+                    raise IdempotencyKeyReused()
+                return Response(
+                    record.body,
+                    status=record.status_code,
+                    headers={"Idempotent-Replayed": "true"},
+                )
+
+            try:
+                response = view_method(self, request, *args, **kwargs)
+            except Exception as exc:
+                # 검증 실패 등 API 예외도 응답으로 바꿔 보관한다. 그 밖의 예외는 다시 던져 롤백한다.
+                response = self.handle_exception(exc)
+            if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                IdempotencyKey.objects.filter(pk=record_id).delete()
+            else:
+                IdempotencyKey.objects.filter(pk=record_id).update(
+                    status_code=response.status_code, body=response.data
+                )
+        return response
+
+    return wrapper
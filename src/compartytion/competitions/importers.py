@@ -0,0 +1,195 @@
+import codecs
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from .models import Competition, Participant, Applicant
+from .broadcast import publish_competition_event
+from .partitioning import get_constraint_name
+
+IMPORT_COLUMNS = [
+    "access_id",
+    "access_password",
+    "email",
+    "displayed_name",
+    "hidden_name",
+    "introduction",
+]
+
+
+def read_csv_rows(file) -> Iterator[Dict[str, str]]:
+    lines = codecs.iterdecode(file, "utf-8-sig")
+    yield from csv.DictReader(lines)
+
+
+def read_xlsx_rows(file) -> Iterator[Dict[str, str]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else "" for cell in next(rows)]
+        for row in rows:
+            yield {
+                key: "" if value is None else str(value)
+                for key, value in zip(header, row)
+            }
+    finally:
+        workbook.close()
+
+
+def read_rows(file) -> Iterator[Dict[str, str]]:
+    name = file.name.lower()
+    if name.endswith(".csv"):
+        return read_csv_rows(file)
+    if name.endswith(".xlsx"):
+        return read_xlsx_rows(file)
+    raise serializers.ValidationError(
+        {"file": _("CSV 또는 XLSX 파일만 가져올 수 있습니다.")}
+    )
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ParticipantImportSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Participant
+        fields = IMPORT_COLUMNS
+        extra_kwargs = {
+            "access_id": {"required": True, "allow_blank": False},
+            "access_password": {"required": True, "allow_blank": False},
+            "email": {"required": False, "allow_blank": True},
+            "introduction": {"required": False, "allow_blank": True},
+        }
+
+
+class ParticipantImporter:
+    """
+    파일의 행들을 청크 단위로 검증하고 참가자로 추가한다.
+    비밀번호 해싱은 스레드 풀에서 처리한다.
+    (PBKDF2 해싱은 GIL 을 놓기 때문에 스레드로도 병렬화된다.)
+    검증과 해싱은 트랜잭션 밖에서 끝내고, 대회 행은 순서 구간을 잡아
+    참가자를 넣는 동안만 잠근다.
+    검증 오류가 하나라도 있으면 아무 참가자도 추가하지 않는다.
+    """
+
+    def __init__(self, competition_id, chunk_size=None, max_workers=None):
+        self.competition_id = competition_id
+        self.chunk_size = chunk_size or getattr(
+            settings, "PARTICIPANT_IMPORT_CHUNK_SIZE", 1000
+        )
+        self.max_workers = max_workers or getattr(
+            settings, "PARTICIPANT_IMPORT_MAX_WORKERS", None
+        )
+        self.max_errors = getattr(settings, "PARTICIPANT_IMPORT_MAX_ERRORS", 100)
+        self.errors: List[Dict] = []
+        self._seen_access_ids = set()
+
+    def add_error(self, row_number: int, errors) -> None:
+        self.errors.append({"row": row_number, "errors": errors})
+
+    def validate_chunk(self, chunk: List[Tuple[int, Dict[str, str]]]) -> List[Dict]:
+        serializer = ParticipantImportSerializer(
+            data=[row for _, row in chunk], many=True
+        )
+        serializer.is_valid()
+        row_errors = serializer.errors or [{} for _ in chunk]
+
+        access_ids = [row.get("access_id") for _, row in chunk]
+        taken = set(
+            Participant.objects.filter(
+                competition_id=self.competition_id, access_id__in=access_ids
+            ).values_list("access_id", flat=True)
+        ) | set(
+            Applicant.objects.filter(
+                competition_id=self.competition_id, access_id__in=access_ids
+            ).values_list("access_id", flat=True)
+        )
+
+        for (row_number, row), errors in zip(chunk, row_errors):
+            access_id = row.get("access_id")
+            if access_id and (access_id in taken or access_id in self._seen_access_ids):
+                errors = {
+                    **errors,
+                    "access_id": [_("이미 존재하는 접속 아이디입니다.")],
+                }
+            self._seen_access_ids.add(access_id)
+            if errors:
+                self.add_error(row_number, errors)
+
+        if self.errors:
+            return []
+        return serializer.validated_data
+
+    def build_participants(
+        self, rows: List[Dict], executor: ThreadPoolExecutor
+    ) -> List[Participant]:
+        passwords = executor.map(
+            make_password, [row["access_password"] for row in rows]
+        )
+        return [
+            Participant(
+                competition_id=self.competition_id,
+                **{**row, "access_password": password},
+            )
+            for row, password in zip(rows, passwords)
+        ]
+
+    def run(self, rows: Iterable[Dict[str, str]]) -> int:
+        participants: List[Participant] = []
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            for chunk in chunked(enumerate(rows, start=2), self.chunk_size):
+                valid_rows = self.validate_chunk(chunk)
+                if len(self.errors) >= self.max_errors:
+                    break
+                if self.errors:
+                    continue
+                participants += self.build_participants(valid_rows, executor)
+        if self.errors:
+            raise serializers.ValidationError({"rows": self.errors})
+
+        num_of_created = len(participants)
+        try:
+            with transaction.atomic():
+                # 같은 대회에 대한 동시 추가를 막아 순서가 연속되도록 한다.
+                last_order = (
+                    Competition.objects.select_for_update()
+                    .values_list("last_participant_order", flat=True)
+                    .get(pk=self.competition_id)
+                )
+                for order, participant in enumerate(participants, start=last_order + 1):
+                    participant.order = order
+                Participant.objects.bulk_create(
+                    participants, batch_size=self.chunk_size
+                )
+                Competition.objects.filter(pk=self.competition_id).update(
+                    last_participant_order=last_order + num_of_created,
+                    num_of_participants=F("num_of_participants") + num_of_created,
+                    participants_updated_at=timezone.now(),
+                )
+                publish_competition_event(
+                    self.competition_id,
+                    "participant.imported",
+                    {"count": num_of_created},
+                )
+        except IntegrityError as e:
+            # 검증한 뒤 잠그기 전까지 다른 요청이 같은 접속 아이디를 썼다.
+            if get_constraint_name(e) == "unique_participant_access_id":
+                raise serializers.ValidationError(
+                    {"access_id": _("이미 존재하는 접속 아이디입니다.")}
+                )
+            raise
+        return num_of_created
@@ -0,0 +1,32 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...transitions import advance_statuses, get_batch_size
+
+
+class Command(BaseCommand):
+    help = "모집 마감/시작/종료 시각이 지난 대회들의 상태를 주기적으로 넘깁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=getattr(settings, "COMPETITION_TRANSITION_INTERVAL_SECONDS", 10),
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="한 번만 실행하고 끝냅니다."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = get_batch_size()
+        while True:
+            changed = advance_statuses(batch_size=batch_size)
+            if changed:
+                self.stdout.write(f"{len(changed)}개 대회의 상태를 바꿨습니다.")
+            if options["once"]:
+                break
+            # 한 번에 다 처리하지 못했으면 쉬지 않고 이어서 처리한다.
+            if len(changed) < batch_size:
+                time.sleep(options["interval"])
@@ -0,0 +1,39 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...archive import archive_competitions, get_archivable_ids, get_batch_size
+
+
+class Command(BaseCommand):
+    help = (
+        "끝난 지 COMPETITION_ARCHIVE_AFTER_DAYS 일이 지난 대회들의 참가자/신청자/관리자/규칙 "
+        "(과 이를 참조하는 경기/순위)을 보관 테이블로 옮깁니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=getattr(settings, "COMPETITION_ARCHIVE_INTERVAL_SECONDS", 3600),
+        )
+        parser.add_argument("--batch-size", type=int, default=get_batch_size())
+        parser.add_argument(
+            "--once", action="store_true", help="한 번만 실행하고 끝냅니다."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        while True:
+            candidates = get_archivable_ids(limit=batch_size)
+            archived = archive_competitions(candidates) if candidates else []
+            if archived:
+                self.stdout.write(f"{len(archived)}개 대회를 보관했습니다.")
+            # 한 번에 다 처리하지 못했으면 쉬지 않고 이어서 처리하지만,
+            # 남은 후보를 모두 다른 작업자가 잡고 있으면 쉬었다가 다시 본다.
+            is_idle = len(candidates) < batch_size or not archived
+            if options["once"] and is_idle:
+                break
+            if is_idle:
+                time.sleep(options["interval"])
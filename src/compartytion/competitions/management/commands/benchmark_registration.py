@@ -0,0 +1,82 @@
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+
+from ...models import Applicant, Competition
+from ...views import ApplicationViewSet
+
+
+class Command(BaseCommand):
+    help = (
+        "정원이 있는 대회에 익명 참가 신청을 동시에 보내 결과별 응답 시간을 측정합니다. "
+        "동시 요청 수는 DB 연결 수를 넘지 않게 --concurrency 로 정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=5000)
+        parser.add_argument("--concurrency", type=int, default=64)
+        parser.add_argument("--capacity", type=int, default=500)
+        parser.add_argument("--waitlist", type=int, default=100)
+
+    def handle(self, *args, **options):
+        competition = Competition.objects.create(
+            title="benchmark",
+            capacity=options["capacity"],
+            waitlist_capacity=options["waitlist"],
+        )
+        view = ApplicationViewSet.as_view({"post": "register"})
+        factory = APIRequestFactory()
+
+        def register(i):
+            request = factory.post(
+                "/api/applications/register/",
+                {
+                    "competition": competition.pk,
+                    "access_id": f"benchmark{i}",
+                    "access_password": "password",
+                    "displayed_name": f"benchmark{i}",
+                    "hidden_name": f"benchmark{i}",
+                },
+                format="json",
+            )
+            try:
+                start = time.perf_counter()
+                response = view(request)
+                elapsed = time.perf_counter() - start
+            finally:
+                connection.close()
+            outcome = response.status_code
+            if outcome == 200 and response.data["is_waitlisted"]:
+                outcome = "waitlisted"
+            return outcome, elapsed
+
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+                results = list(executor.map(register, range(options["requests"])))
+            total = time.perf_counter() - start
+
+            latencies = defaultdict(list)
+            for outcome, elapsed in results:
+                latencies[outcome].append(elapsed)
+            self.stdout.write(
+                f"{'outcome':<12}{'count':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+            )
+            for outcome, values in sorted(latencies.items(), key=str):
+                p50, p95, p99, worst = np.percentile(values, [50, 95, 99, 100]) * 1000
+                self.stdout.write(
+                    f"{outcome!s:<12}{len(values):>8}"
+                    f"{p50:>8.1f}ms{p95:>8.1f}ms{p99:>8.1f}ms{worst:>8.1f}ms"
+                )
+            self.stdout.write(
+                f"{options['requests']} requests in {total:.2f} s "
+                f"({options['requests'] / total:.0f} req/s)"
+            )
+        finally:
+            Applicant.objects.filter(competition=competition).delete()
+            competition.delete()
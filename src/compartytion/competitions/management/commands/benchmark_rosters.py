@@ -0,0 +1,76 @@
+import random
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from ...models import Applicant, Competition, Participant
+
+
+class Command(BaseCommand):
+    help = (
+        "여러 대회에 참가자/신청자를 대량으로 넣는 시간과, 대회 하나의 명단을 읽는 시간을 측정합니다. "
+        "파티션 전후를 비교하려면 마이그레이션을 되돌린 상태에서도 같은 옵션으로 실행합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--competitions", type=int, default=200)
+        parser.add_argument("--players", type=int, default=500)
+        parser.add_argument("--queries", type=int, default=2000)
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        competitions = Competition.objects.bulk_create(
+            [Competition(title=f"benchmark{i}") for i in range(options["competitions"])]
+        )
+        try:
+            for model in [Participant, Applicant]:
+                self.benchmark(model, competitions, rng, options)
+        finally:
+            ids = [competition.pk for competition in competitions]
+            with transaction.atomic():
+                Participant.objects.filter(competition_id__in=ids)._raw_delete(
+                    connection.alias
+                )
+                Applicant.objects.filter(competition_id__in=ids)._raw_delete(
+                    connection.alias
+                )
+                Competition.objects.filter(pk__in=ids)._raw_delete(connection.alias)
+
+    def benchmark(self, model, competitions, rng, options):
+        players = [
+            model(
+                competition=competition,
+                displayed_name=f"p{i}",
+                hidden_name=f"p{i}",
+                access_id=f"p{i}",
+                **({"order": i + 1} if model is Participant else {}),
+            )
+            for competition in competitions
+            for i in range(options["players"])
+        ]
+        # 실제 신청처럼 여러 대회의 행이 섞여 들어오게 한다.
+        rng.shuffle(players)
+        start = time.perf_counter()
+        with transaction.atomic():
+            model.objects.bulk_create(players, batch_size=options["batch_size"])
+        inserted = time.perf_counter() - start
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+        latencies = []
+        for _ in range(options["queries"]):
+            competition = rng.choice(competitions)
+            start = time.perf_counter()
+            list(model.objects.filter(competition=competition).order_by("id"))
+            latencies.append(time.perf_counter() - start)
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+
+        self.stdout.write(
+            f"{model._meta.db_table}: inserted {len(players)} rows in {inserted:.2f} s "
+            f"({len(players) / inserted:.0f} rows/s), roster p50 {p50:.2f} ms "
+            f"p95 {p95:.2f} ms p99 {p99:.2f} ms"
+        )
@@ -0,0 +1,79 @@
+import json
+import random
+import timeit
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from ....users.ratings import RatingPool
+
+from ...tournament.bracket import Bracket
+from ...tournament.swiss import Swiss
+from ...tournament.schedule import build_schedule
+
+
+class Command(BaseCommand):
+    help = "대진표 생성과 직렬화 속도를 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[64, 512, 4096, 16384]
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--rating-matches", type=int, default=1_000_000)
+
+    def report(self, name: str, size: int, func, repeat: int) -> None:
+        elapsed = min(timeit.repeat(func, number=1, repeat=repeat))
+        self.stdout.write(f"{name:<24}{size:>8}{elapsed * 1000:>12.2f} ms")
+
+    def handle(self, *args, **options):
+        for format in Bracket.FORMATS:
+            for size in options["sizes"]:
+                entrants = list(range(1, size + 1))
+                self.report(
+                    format,
+                    size,
+                    lambda: json.dumps(Bracket.generate(format, entrants).to_json()),
+                    options["repeat"],
+                )
+        for size in options["sizes"]:
+            swiss = Swiss.start(list(range(size)))
+            for _ in range(4):
+                swiss.pair_next_round()
+                for match in range(swiss.num_of_matches):
+                    if swiss.results[match] is None:
+                        swiss.report(match, random.randint(0, 2))
+            # 같은 순위표로 5라운드 대진을 반복해서 만든다.
+            snapshot = swiss.to_json()
+            self.report(
+                "swiss (round 5)",
+                size,
+                lambda: Swiss.from_json(snapshot).pair_next_round(),
+                options["repeat"],
+            )
+        for size in options["sizes"]:
+            num_of_groups = max(size // 8, 1)
+            self.report(
+                f"round robin ({num_of_groups} groups)",
+                size,
+                lambda: build_schedule(size, num_of_groups, rest=1, capacity=32),
+                options["repeat"],
+            )
+        # 10만 명이 10년(주 단위 520개 평가 기간) 동안 치른 경기들의 레이팅을 계산한다.
+        num_of_matches = options["rating_matches"]
+        num_of_accounts, num_of_periods = 100_000, 520
+        rng = np.random.default_rng(0)
+        periods = rng.integers(0, num_of_periods, num_of_matches)
+        home = rng.integers(0, num_of_accounts, num_of_matches)
+        away = (
+            home + rng.integers(1, num_of_accounts, num_of_matches)
+        ) % num_of_accounts
+        score = rng.choice([0.0, 0.5, 1.0], num_of_matches)
+        self.report(
+            "ratings (glicko-2, elo)",
+            num_of_matches,
+            lambda: RatingPool(np.arange(num_of_accounts)).rate(
+                periods, home, away, score
+            ),
+            1,
+        )
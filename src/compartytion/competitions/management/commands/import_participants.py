@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from ...importers import ParticipantImporter, read_rows
+
+
+class Command(BaseCommand):
+    help = "CSV/XLSX 파일의 참가자들을 대회에 추가합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("competition_id")
+        parser.add_argument("path")
+        parser.add_argument("--chunk-size", type=int, default=None)
+        parser.add_argument("--workers", type=int, default=None)
+
+    def handle(self, *args, **options):
+        importer = ParticipantImporter(
+            options["competition_id"],
+            chunk_size=options["chunk_size"],
+            max_workers=options["workers"],
+        )
+        with open(options["path"], "rb") as file:
+            try:
+                num_of_created = importer.run(read_rows(file))
+            except ValidationError as e:
+                raise CommandError(
+                    "\n".join(
+                        f"{error['row']}행: {dict(error['errors'])}"
+                        for error in e.detail["rows"]
+                    )
+                )
+        self.stdout.write(
+            self.style.SUCCESS(f"{num_of_created}명의 참가자들이 추가됐습니다.")
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ...models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = "만료된 멱등 키와 보관한 응답을 지웁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=10000)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        expired = IdempotencyKey.objects.filter(expires_at__lte=now)
+        deleted = 0
+        # 한 번에 지우는 행 수를 묶음 크기로 제한해 잠금과 WAL 을 짧게 유지한다.
+        while ids := list(
+            expired.values_list("pk", flat=True)[: options["batch_size"]]
+        ):
+            deleted += IdempotencyKey.objects.filter(pk__in=ids).delete()[0]
+        self.stdout.write(self.style.SUCCESS(f"{deleted}개의 멱등 키를 지웠습니다."))
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Competition, Standing
+from ...tournament.standings import (
+    STAT_FIELDS,
+    compute_standings,
+    get_entrant_field,
+    rebuild_standings,
+)
+
+
+class Command(BaseCommand):
+    help = "경기 결과로 대회 순위표를 처음부터 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("competition_ids", nargs="*")
+        parser.add_argument("--all", action="store_true")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="순위표를 고치지 않고 저장된 값과 다른 행만 출력합니다.",
+        )
+
+    def check(self, competition: Competition) -> int:
+        field = f"{get_entrant_field(competition.is_team_game)}_id"
+        expected = compute_standings(competition)
+        stored = {
+            row[field]: row
+            for row in Standing.objects.filter(competition_id=competition.pk).values(
+                field, *STAT_FIELDS
+            )
+        }
+        num_of_mismatches = 0
+        for entrant_id in expected.keys() | stored.keys():
+            want = expected.get(entrant_id)
+            have = stored.get(entrant_id)
+            if have is not None:
+                have = {key: have[key] for key in STAT_FIELDS}
+            if want != have:
+                num_of_mismatches += 1
+                self.stdout.write(f"{competition.pk} {entrant_id}: {have} != {want}")
+        return num_of_mismatches
+
+    def handle(self, *args, **options):
+        competitions = Competition.objects.all()
+        if not options["all"]:
+            if not options["competition_ids"]:
+                raise CommandError("대회 id 또는 --all 을 지정하세요.")
+            competitions = competitions.filter(pk__in=options["competition_ids"])
+
+        num_of_mismatches = 0
+        for competition in competitions.only(
+            "id", "is_team_game", "tournament"
+        ).iterator():
+            if options["check"]:
+                num_of_mismatches += self.check(competition)
+            else:
+                num_of_rows = rebuild_standings(competition)
+                self.stdout.write(f"{competition.pk}: {num_of_rows}행")
+
+        if num_of_mismatches:
+            raise CommandError(f"{num_of_mismatches}개 행이 다릅니다.")
+        self.stdout.write(self.style.SUCCESS("완료했습니다."))
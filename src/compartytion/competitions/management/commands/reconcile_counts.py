@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Competition
+
+
+class Command(BaseCommand):
+    help = "대회의 참가자/신청자/관리자 수 카운터를 실제 행 수와 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("competition_ids", nargs="*")
+        parser.add_argument("--all", action="store_true")
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="카운터를 고치지 않고 실제 행 수와 다른 대회만 출력합니다.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        competitions = Competition.objects.all()
+        if not options["all"]:
+            if not options["competition_ids"]:
+                raise CommandError("대회 id 또는 --all 을 지정하세요.")
+            competitions = competitions.filter(pk__in=options["competition_ids"])
+
+        # 한 번에 잠그는 대회 행 수를 묶음 크기로 제한한다.
+        ids = list(competitions.order_by("pk").values_list("pk", flat=True))
+        batch_size = options["batch_size"]
+        drifted = []
+        for start in range(0, len(ids), batch_size):
+            drifted += Competition.objects.reconcile_counts(
+                ids[start : start + batch_size], fix=not options["check"]
+            )
+        for competition_id in drifted:
+            self.stdout.write(f"{competition_id}")
+
+        if options["check"] and drifted:
+            raise CommandError(f"{len(drifted)}개 대회의 카운터가 다릅니다.")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(drifted)}개 대회의 카운터를 고쳤습니다.")
+        )
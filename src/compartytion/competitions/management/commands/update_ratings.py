@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...ratings import update_ratings
+
+
+class Command(BaseCommand):
+    help = "끝난 평가 기간들의 경기 결과로 계정 레이팅(Glicko-2, Elo)을 갱신합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="저장된 레이팅을 지우고 모든 경기 결과로 처음부터 다시 계산합니다.",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        num_of_periods, num_of_accounts = update_ratings(full=options["full"])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{num_of_periods}개 평가 기간, {num_of_accounts}개 계정을 "
+                f"{elapsed:.1f}초 만에 갱신했습니다."
+            )
+        )
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.2 on 2026-10-19 06:59
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="competition",
+            name="applicants_updated_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                verbose_name="신청자 목록 수정일",
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="participants_updated_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                editable=False,
+                verbose_name="참가자 목록 수정일",
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, verbose_name="수정일"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0002_competition_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="participant",
+            name="order",
+            field=models.PositiveIntegerField(verbose_name="순서"),
+        ),
+        migrations.AlterField(
+            model_name="team",
+            name="order",
+            field=models.PositiveIntegerField(verbose_name="순서"),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0003_participant_order_integer"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="competition",
+            name="last_participant_order",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="마지막 참가자 순서"
+            ),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE competitions_competition AS c
+            SET last_participant_order = COALESCE(
+                (
+                    SELECT MAX(p."order")
+                    FROM competitions_participant AS p
+                    WHERE p.competition_id = c.id
+                ),
+                0
+            )
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
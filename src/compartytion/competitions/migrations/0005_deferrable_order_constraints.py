@@ -0,0 +1,40 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:05
+
+import django.db.models.constraints
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0004_competition_last_participant_order"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="participant",
+            name="unique_participant_order",
+        ),
+        migrations.RemoveConstraint(
+            model_name="team",
+            name="unique_team_order",
+        ),
+        migrations.AddConstraint(
+            model_name="participant",
+            constraint=models.UniqueConstraint(
+                deferrable=django.db.models.constraints.Deferrable["DEFERRED"],
+                fields=("competition", "order"),
+                name="unique_participant_order",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="team",
+            constraint=models.UniqueConstraint(
+                deferrable=django.db.models.constraints.Deferrable["DEFERRED"],
+                fields=("competition", "order"),
+                name="unique_team_order",
+            ),
+        ),
+    ]
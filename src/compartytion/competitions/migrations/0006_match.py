@@ -0,0 +1,97 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0005_deferrable_order_constraints"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Match",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "group",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="조"),
+                ),
+                ("round", models.PositiveSmallIntegerField(verbose_name="라운드")),
+                ("slot", models.PositiveIntegerField(verbose_name="시간대")),
+                (
+                    "venue",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="경기장"),
+                ),
+                (
+                    "away",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="competitions.participant",
+                        verbose_name="원정 참가자",
+                    ),
+                ),
+                (
+                    "away_team",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="competitions.team",
+                        verbose_name="원정 팀",
+                    ),
+                ),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="matches",
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+                (
+                    "home",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="competitions.participant",
+                        verbose_name="홈 참가자",
+                    ),
+                ),
+                (
+                    "home_team",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="competitions.team",
+                        verbose_name="홈 팀",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "경기",
+                "verbose_name_plural": "경기들",
+                "ordering": ["round", "slot", "venue"],
+                "indexes": [
+                    models.Index(
+                        fields=["competition", "round", "slot"], name="match_round_idx"
+                    )
+                ],
+            },
+        ),
+    ]
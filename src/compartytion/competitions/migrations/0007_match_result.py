@@ -0,0 +1,82 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0006_match"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="away_score",
+            field=models.PositiveIntegerField(null=True, verbose_name="원정 점수"),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="bye",
+            field=models.PositiveSmallIntegerField(
+                choices=[(0, "홈"), (1, "원정"), (2, "무승부")],
+                null=True,
+                verbose_name="부전승 자리",
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="home_score",
+            field=models.PositiveIntegerField(null=True, verbose_name="홈 점수"),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="loser_to",
+            field=models.PositiveIntegerField(
+                editable=False, null=True, verbose_name="패자 진출 자리"
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="position",
+            field=models.PositiveIntegerField(
+                editable=False, null=True, verbose_name="대진표 위치"
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="reported_at",
+            field=models.DateTimeField(
+                editable=False, null=True, verbose_name="결과 입력일"
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="stage",
+            field=models.PositiveSmallIntegerField(default=0, verbose_name="단계"),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="winner",
+            field=models.PositiveSmallIntegerField(
+                choices=[(0, "홈"), (1, "원정"), (2, "무승부")],
+                null=True,
+                verbose_name="승자",
+            ),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="winner_to",
+            field=models.PositiveIntegerField(
+                editable=False, null=True, verbose_name="승자 진출 자리"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="match",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("position__isnull", False)),
+                fields=("competition", "position"),
+                name="unique_match_position",
+            ),
+        ),
+    ]
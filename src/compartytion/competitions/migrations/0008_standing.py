@@ -0,0 +1,121 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:22
+
+import django.db.models.deletion
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0007_match_result"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Standing",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "played",
+                    models.PositiveIntegerField(default=0, verbose_name="경기 수"),
+                ),
+                ("wins", models.PositiveIntegerField(default=0, verbose_name="승")),
+                ("draws", models.PositiveIntegerField(default=0, verbose_name="무")),
+                ("losses", models.PositiveIntegerField(default=0, verbose_name="패")),
+                ("points", models.IntegerField(default=0, verbose_name="승점")),
+                (
+                    "score_for",
+                    models.PositiveIntegerField(default=0, verbose_name="득점"),
+                ),
+                (
+                    "score_against",
+                    models.PositiveIntegerField(default=0, verbose_name="실점"),
+                ),
+                (
+                    "score_difference",
+                    models.GeneratedField(
+                        db_persist=True,
+                        expression=django.db.models.expressions.CombinedExpression(
+                            models.F("score_for"), "-", models.F("score_against")
+                        ),
+                        output_field=models.IntegerField(),
+                        verbose_name="득실차",
+                    ),
+                ),
+                ("buchholz", models.IntegerField(default=0, verbose_name="부크홀츠")),
+                ("head_to_head", models.IntegerField(default=0, verbose_name="승자승")),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="standings",
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+                (
+                    "participant",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="competitions.participant",
+                        verbose_name="참가자",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="competitions.team",
+                        verbose_name="참가팀",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "순위",
+                "verbose_name_plural": "순위표",
+                "ordering": [
+                    "-points",
+                    "-buchholz",
+                    "-head_to_head",
+                    "-score_difference",
+                    "-id",
+                ],
+                "indexes": [
+                    models.Index(
+                        models.F("competition"),
+                        models.OrderBy(models.F("points"), descending=True),
+                        models.OrderBy(models.F("buchholz"), descending=True),
+                        models.OrderBy(models.F("head_to_head"), descending=True),
+                        models.OrderBy(models.F("score_difference"), descending=True),
+                        models.OrderBy(models.F("id"), descending=True),
+                        name="standing_rank_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("participant__isnull", False)),
+                        fields=("competition", "participant"),
+                        name="unique_participant_standing",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("team__isnull", False)),
+                        fields=("competition", "team"),
+                        name="unique_team_standing",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:33
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0008_standing"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="competition",
+            name="end_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="종료일"),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="recruit_end_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="모집 마감일"
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="start_at",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="시작일"),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="transition_at",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        status=0,
+                        then=django.db.models.functions.comparison.Least(
+                            "recruit_end_at", "start_at", "end_at"
+                        ),
+                    ),
+                    models.When(
+                        status=1,
+                        then=django.db.models.functions.comparison.Least(
+                            "start_at", "end_at"
+                        ),
+                    ),
+                    models.When(status=2, then=models.F("end_at")),
+                ),
+                output_field=models.DateTimeField(null=True),
+                verbose_name="상태 전환 시각",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="competition",
+            index=models.Index(
+                condition=models.Q(("transition_at__isnull", False)),
+                fields=["transition_at"],
+                name="competition_transition_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0009_competition_schedule"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="competition",
+            name="num_of_applicants",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="신청자 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="num_of_managers",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="관리자 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="num_of_participants",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="참가자 수"
+            ),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE competitions_competition AS c
+            SET num_of_participants = (
+                    SELECT COUNT(*) FROM competitions_participant AS p
+                    WHERE p.competition_id = c.id
+                ),
+                num_of_applicants = (
+                    SELECT COUNT(*) FROM competitions_applicant AS a
+                    WHERE a.competition_id = c.id
+                ),
+                num_of_managers = (
+                    SELECT COUNT(*) FROM competitions_management AS m
+                    WHERE m.competition_id = c.id
+                )
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0012_idempotency_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="applicant",
+            name="is_waitlisted",
+            field=models.BooleanField(
+                default=False, editable=False, verbose_name="대기 여부"
+            ),
+        ),
+        migrations.AddField(
+            model_name="applicant",
+            name="ticket",
+            field=models.PositiveIntegerField(
+                editable=False, null=True, verbose_name="접수 번호"
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="capacity",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="정원"
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="last_ticket",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="마지막 접수 번호"
+            ),
+        ),
+        migrations.AddField(
+            model_name="competition",
+            name="waitlist_capacity",
+            field=models.PositiveIntegerField(default=0, verbose_name="대기 인원"),
+        ),
+    ]
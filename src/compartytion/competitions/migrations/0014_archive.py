@@ -0,0 +1,512 @@
+# Generated by Django 5.1.2 on 2026-10-19 08:05
+
+import django.db.models.deletion
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0013_competition_capacity"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="competition",
+            name="archived_at",
+            field=models.DateTimeField(
+                editable=False, null=True, verbose_name="보관일"
+            ),
+        ),
+        migrations.CreateModel(
+            name="ArchivedApplicant",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "access_id",
+                    models.CharField(
+                        blank=True, max_length=40, null=True, verbose_name="접속 아이디"
+                    ),
+                ),
+                (
+                    "access_password",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="접속 비밀번호",
+                    ),
+                ),
+                (
+                    "email",
+                    models.EmailField(max_length=254, null=True, verbose_name="이메일"),
+                ),
+                (
+                    "displayed_name",
+                    models.CharField(max_length=30, verbose_name="공개 이름"),
+                ),
+                (
+                    "hidden_name",
+                    models.CharField(max_length=30, verbose_name="비공개 이름"),
+                ),
+                (
+                    "introduction",
+                    models.TextField(
+                        blank=True, max_length=255, null=True, verbose_name="소개글"
+                    ),
+                ),
+                (
+                    "applied_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="신청일"),
+                ),
+                (
+                    "ticket",
+                    models.PositiveIntegerField(
+                        editable=False, null=True, verbose_name="접수 번호"
+                    ),
+                ),
+                (
+                    "is_waitlisted",
+                    models.BooleanField(
+                        default=False, editable=False, verbose_name="대기 여부"
+                    ),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="계정",
+                    ),
+                ),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "보관된 대회 신청자",
+                "verbose_name_plural": "보관된 대회 신청자들",
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedManagement",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("nickname", models.CharField(max_length=30, verbose_name="닉네임")),
+                (
+                    "is_creator",
+                    models.BooleanField(default=False, verbose_name="개최자 여부"),
+                ),
+                (
+                    "handle_rules",
+                    models.BooleanField(
+                        default=False, verbose_name="규칙 변경 가능 여부"
+                    ),
+                ),
+                (
+                    "handle_content",
+                    models.BooleanField(
+                        default=False, verbose_name="내용 변경 가능 여부"
+                    ),
+                ),
+                (
+                    "handle_applicants",
+                    models.BooleanField(
+                        default=False, verbose_name="신청자 관리 가능 여부"
+                    ),
+                ),
+                (
+                    "handle_participants",
+                    models.BooleanField(
+                        default=False, verbose_name="참가자 관리 가능 여부"
+                    ),
+                ),
+                (
+                    "accepted",
+                    models.BooleanField(default=False, verbose_name="승락 여부"),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        editable=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="계정",
+                    ),
+                ),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        editable=False,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "보관된 대회 관리자",
+                "verbose_name_plural": "보관된 대회 관리자들",
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedParticipant",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "access_id",
+                    models.CharField(
+                        blank=True, max_length=40, null=True, verbose_name="접속 아이디"
+                    ),
+                ),
+                (
+                    "access_password",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="접속 비밀번호",
+                    ),
+                ),
+                (
+                    "email",
+                    models.EmailField(max_length=254, null=True, verbose_name="이메일"),
+                ),
+                (
+                    "displayed_name",
+                    models.CharField(max_length=30, verbose_name="공개 이름"),
+                ),
+                (
+                    "hidden_name",
+                    models.CharField(max_length=30, verbose_name="비공개 이름"),
+                ),
+                (
+                    "introduction",
+                    models.TextField(
+                        blank=True, max_length=255, null=True, verbose_name="소개글"
+                    ),
+                ),
+                ("order", models.PositiveIntegerField(verbose_name="순서")),
+                (
+                    "joined_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="참가일"),
+                ),
+                (
+                    "last_login_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="최근 접속일"),
+                ),
+                (
+                    "account",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="계정",
+                    ),
+                ),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="competitions.team",
+                        verbose_name="소속 팀",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "보관된 대회 참가자",
+                "verbose_name_plural": "보관된 대회 참가자들",
+                "ordering": ["order"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedMatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "stage",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="단계"),
+                ),
+                (
+                    "group",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="조"),
+                ),
+                ("round", models.PositiveSmallIntegerField(verbose_name="라운드")),
+                ("slot", models.PositiveIntegerField(verbose_name="시간대")),
+                (
+                    "venue",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="경기장"),
+                ),
+                (
+                    "position",
+                    models.PositiveIntegerField(
+                        editable=False, null=True, verbose_name="대진표 위치"
+                    ),
+                ),
+                (
+                    "bye",
+                    models.PositiveSmallIntegerField(
+                        choices=[(0, "홈"), (1, "원정"), (2, "무승부")],
+                        null=True,
+                        verbose_name="부전승 자리",
+                    ),
+                ),
+                (
+                    "home_score",
+                    models.PositiveIntegerField(null=True, verbose_name="홈 점수"),
+                ),
+                (
+                    "away_score",
+                    models.PositiveIntegerField(null=True, verbose_name="원정 점수"),
+                ),
+                (
+                    "winner",
+                    models.PositiveSmallIntegerField(
+                        choices=[(0, "홈"), (1, "원정"), (2, "무승부")],
+                        null=True,
+                        verbose_name="승자",
+                    ),
+                ),
+                (
+                    "winner_to",
+                    models.PositiveIntegerField(
+                        editable=False, null=True, verbose_name="승자 진출 자리"
+                    ),
+                ),
+                (
+                    "loser_to",
+                    models.PositiveIntegerField(
+                        editable=False, null=True, verbose_name="패자 진출 자리"
+                    ),
+                ),
+                (
+                    "reported_at",
+                    models.DateTimeField(
+                        editable=False, null=True, verbose_name="결과 입력일"
+                    ),
+                ),
+                (
+                    "away_team",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="competitions.team",
+                        verbose_name="원정 팀",
+                    ),
+                ),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+                (
+                    "home_team",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="competitions.team",
+                        verbose_name="홈 팀",
+                    ),
+                ),
+                (
+                    "away",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="competitions.archivedparticipant",
+                        verbose_name="원정 참가자",
+                    ),
+                ),
+                (
+                    "home",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="competitions.archivedparticipant",
+                        verbose_name="홈 참가자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "보관된 경기",
+                "verbose_name_plural": "보관된 경기들",
+                "ordering": ["round", "slot", "venue"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedRule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content", models.CharField(verbose_name="내용")),
+                ("order", models.PositiveSmallIntegerField(verbose_name="순서")),
+                ("depth", models.PositiveSmallIntegerField(verbose_name="깊이")),
+                (
+                    "added_at",
+                    models.DateTimeField(editable=False, verbose_name="갱신일"),
+                ),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "보관된 규칙",
+                "verbose_name_plural": "보관된 규칙들",
+                "ordering": ["order"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedStanding",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "played",
+                    models.PositiveIntegerField(default=0, verbose_name="경기 수"),
+                ),
+                ("wins", models.PositiveIntegerField(default=0, verbose_name="승")),
+                ("draws", models.PositiveIntegerField(default=0, verbose_name="무")),
+                ("losses", models.PositiveIntegerField(default=0, verbose_name="패")),
+                ("points", models.IntegerField(default=0, verbose_name="승점")),
+                (
+                    "score_for",
+                    models.PositiveIntegerField(default=0, verbose_name="득점"),
+                ),
+                (
+                    "score_against",
+                    models.PositiveIntegerField(default=0, verbose_name="실점"),
+                ),
+                (
+                    "score_difference",
+                    models.GeneratedField(
+                        db_persist=True,
+                        expression=django.db.models.expressions.CombinedExpression(
+                            models.F("score_for"), "-", models.F("score_against")
+                        ),
+                        output_field=models.IntegerField(),
+                        verbose_name="득실차",
+                    ),
+                ),
+                ("buchholz", models.IntegerField(default=0, verbose_name="부크홀츠")),
+                ("head_to_head", models.IntegerField(default=0, verbose_name="승자승")),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+                (
+                    "participant",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="competitions.archivedparticipant",
+                        verbose_name="참가자",
+                    ),
+                ),
+                (
+                    "team",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="competitions.team",
+                        verbose_name="참가팀",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "보관된 순위",
+                "verbose_name_plural": "보관된 순위표",
+                "ordering": [
+                    "-points",
+                    "-buchholz",
+                    "-head_to_head",
+                    "-score_difference",
+                    "-id",
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.1.2 on 2026-10-19 08:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import compartytion.competitions.partitioning
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0014_archive"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="match",
+            name="away",
+            field=models.ForeignKey(
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="competitions.participant",
+                verbose_name="원정 참가자",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="match",
+            name="home",
+            field=models.ForeignKey(
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="competitions.participant",
+                verbose_name="홈 참가자",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="standing",
+            name="participant",
+            field=models.ForeignKey(
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="competitions.participant",
+                verbose_name="참가자",
+            ),
+        ),
+        # 파티션 테이블을 가리키는 외래 키 제약은 둘 수 없으므로 위에서 먼저 지운다.
+        compartytion.competitions.partitioning.HashPartition(
+            model_name="participant", column="competition_id", partitions=16
+        ),
+        compartytion.competitions.partitioning.HashPartition(
+            model_name="applicant", column="competition_id", partitions=16
+        ),
+    ]
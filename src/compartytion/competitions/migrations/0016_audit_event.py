@@ -0,0 +1,104 @@
+# Generated by Django 5.1.2 on 2026-10-19 08:20
+
+import django.contrib.postgres.indexes
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0015_partition_players"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event", models.CharField(max_length=50, verbose_name="변경 종류")),
+                (
+                    "target_id",
+                    models.CharField(max_length=64, null=True, verbose_name="대상 id"),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        verbose_name="변경 내용",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="기록일"
+                    ),
+                ),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="변경한 계정",
+                    ),
+                ),
+                (
+                    "competition",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        db_index=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="competitions.competition",
+                        verbose_name="대회",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "변경 기록",
+                "verbose_name_plural": "변경 기록들",
+                "indexes": [
+                    models.Index(
+                        fields=["competition", "id"], name="audit_competition_idx"
+                    ),
+                    django.contrib.postgres.indexes.BrinIndex(
+                        fields=["created_at"], name="audit_created_at_brin"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunSQL(
+            """
+            CREATE FUNCTION competitions_auditevent_append_only() RETURNS trigger AS $$
+            BEGIN
+                RAISE EXCEPTION 'competitions_auditevent is append-only';
+            END;
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER competitions_auditevent_append_only
+            BEFORE UPDATE OR DELETE ON competitions_auditevent
+            FOR EACH STATEMENT EXECUTE FUNCTION competitions_auditevent_append_only();
+            """,
+            """
+            DROP TRIGGER competitions_auditevent_append_only ON competitions_auditevent;
+            DROP FUNCTION competitions_auditevent_append_only();
+            """,
+        ),
+    ]
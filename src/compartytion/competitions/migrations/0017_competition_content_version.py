@@ -0,0 +1,20 @@
+# Generated by Django 5.1.2 on 2026-10-19 08:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0016_audit_event"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="competition",
+            name="content_version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="내용 판 번호"
+            ),
+        ),
+    ]
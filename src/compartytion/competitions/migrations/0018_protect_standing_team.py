@@ -0,0 +1,36 @@
+# Generated by Django 5.1.2 on 2026-10-19 09:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("competitions", "0017_competition_content_version"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="archivedstanding",
+            name="team",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="competitions.team",
+                verbose_name="참가팀",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="standing",
+            name="team",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="competitions.team",
+                verbose_name="참가팀",
+            ),
+        ),
+    ]
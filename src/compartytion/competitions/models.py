@@ -1,10 +1,142 @@
+from typing import List, Optional, Tuple
 from uuid import uuid4
 from django.conf import settings
 from django.contrib.auth.hashers import make_password, check_password
-from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, connection, transaction
+from django.contrib.postgres.indexes import BrinIndex
+from django.db.models.functions import Least
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from ..users.tracking import get_tracker
+
+
+class CompetitionManager(models.Manager):
+    def touch(self, competition_id, *fields: str, **counts: int) -> int:
+        """
+        대회 본문이나 하위 목록이 바뀌었음을 기록한다.
+        조건부 GET 에서 쓰는 갱신 시각을 현재 시각으로 바꾸고,
+        `counts` 로 받은 만큼 하위 목록의 행 수 카운터를 F() 로 더한다.
+        카운터를 바꿀 때는 행을 넣거나 지운 트랜잭션 안에서 불러야 한다.
+        """
+        now = timezone.now()
+        fields = fields or ("updated_at",)
+        values = {f: now for f in fields}
+        values.update({f: models.F(f) + n for f, n in counts.items() if n})
+        return self.filter(pk=competition_id).update(**values)
+
+    def set_content(self, competition_id, content, version: int) -> Optional[int]:
+        """
+        본문의 판(content_version)이 아직 `version` 일 때만 본문을 바꾸고 새 판 번호를 반환한다.
+        그 사이에 다른 요청이 본문을 바꿨으면 아무것도 바꾸지 않고 None 을 반환한다.
+        """
+        updated = self.filter(pk=competition_id, content_version=version).update(
+            content=content,
+            content_version=version + 1,
+            updated_at=timezone.now(),
+        )
+        return version + 1 if updated else None
+
+    def admit(self, competition_id) -> Optional[Tuple[int, bool]]:
+        """
+        정원이 있는 대회에 한 명을 받을 자리가 있으면 접수 번호를 발급하고 (번호, 대기 여부)를 반환한다.
+        참가자와 신청자(대기 포함) 수가 정원보다 적으면 신청, 정원 이상이면 대기이며,
+        대기 인원까지 찼으면 None 을 반환한다.
+        신청자를 넣는 트랜잭션 안에서 불러야 한다. 대회 행의 잠금이 INSERT 와 카운터 증가까지 이어지고,
+        INSERT 가 실패해 롤백되면 발급한 번호도 함께 돌려진다.
+        """
+        table = self.model._meta.db_table
+        occupied = "num_of_participants + num_of_applicants"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table} SET last_ticket = last_ticket + 1
+                WHERE id = %s AND {occupied} < capacity + waitlist_capacity
+                RETURNING last_ticket, {occupied} >= capacity
+                """,
+                [competition_id],
+            )
+            return cursor.fetchone()
+
+    def promote_waitlist(self, competition_id) -> List[int]:
+        """
+        정원에 빈자리가 생긴 만큼 대기 중인 신청자를 접수 번호 순으로 신청자로 올리고 그 id 목록을 반환한다.
+        자리를 비우거나 정원을 늘린 트랜잭션 안에서, 대회 행을 잠근 뒤에 불러야 한다.
+        """
+        table = self.model._meta.db_table
+        applicant_table = Applicant._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {applicant_table} SET is_waitlisted = false
+                WHERE competition_id = %(id)s AND id IN (
+                    SELECT a.id FROM {applicant_table} AS a
+                    WHERE a.competition_id = %(id)s AND a.is_waitlisted
+                    ORDER BY a.ticket, a.id
+                    LIMIT (
+                        SELECT GREATEST(
+                            c.capacity - c.num_of_participants - c.num_of_applicants
+                            + (SELECT COUNT(*) FROM {applicant_table} AS w
+                               WHERE w.competition_id = %(id)s AND w.is_waitlisted),
+                            0
+                        )
+                        FROM {table} AS c WHERE c.id = %(id)s
+                    )
+                )
+                RETURNING id
+                """,
+                {"id": competition_id},
+            )
+            promoted = [row[0] for row in cursor.fetchall()]
+        if promoted:
+            self.touch(competition_id, "applicants_updated_at")
+        return promoted
+
+    def reconcile_counts(self, competition_ids: List, fix: bool = True) -> List:
+        """
+        행 수 카운터를 실제 행 수와 맞추고, 값이 달랐던 대회 id 목록을 반환한다.
+        대회 행을 먼저 잠근 뒤 다음 문장에서 세므로, 카운터를 고치는 중인
+        트랜잭션이 끝날 때까지 기다렸다가 그 결과까지 보고 센다.
+        `fix` 가 거짓이면 고치지 않고 다른 대회만 찾는다.
+        보관된 대회의 하위 목록은 보관 테이블에 있으므로 건너뛴다.
+        """
+        counters = {
+            "num_of_participants": Participant._meta.db_table,
+            "num_of_applicants": Applicant._meta.db_table,
+            "num_of_managers": Management._meta.db_table,
+        }
+        table = self.model._meta.db_table
+        counted = ", ".join(
+            f"(SELECT COUNT(*) FROM {t} WHERE competition_id = c.id) AS {f}"
+            for f, t in counters.items()
+        )
+        drifted = " OR ".join(f"c.{f} <> x.{f}" for f in counters)
+        if fix:
+            sql = f"""
+                UPDATE {table} AS c
+                SET {", ".join(f"{f} = x.{f}" for f in counters)}
+                FROM (SELECT c.id, {counted} FROM {table} AS c
+                      WHERE c.id = ANY(%s) AND c.archived_at IS NULL) AS x
+                WHERE c.id = x.id AND ({drifted})
+                RETURNING c.id
+            """
+        else:
+            sql = f"""
+                SELECT c.id FROM {table} AS c
+                JOIN (SELECT c.id, {counted} FROM {table} AS c
+                      WHERE c.id = ANY(%s) AND c.archived_at IS NULL) AS x ON x.id = c.id
+                WHERE {drifted}
+            """
+        with transaction.atomic(), connection.cursor() as cursor:
+            if fix:
+                cursor.execute(
+                    f"SELECT 1 FROM {table} WHERE id = ANY(%s) ORDER BY id FOR UPDATE",
+                    [list(competition_ids)],
+                )
+            cursor.execute(sql, [list(competition_ids)])
+            return [row[0] for row in cursor.fetchall()]
+
 
 class Competition(models.Model):
     class StatusChoices(models.IntegerChoices):
@@ -16,6 +148,13 @@ class Competition(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
     title = models.CharField(_("대회명"), max_length=255)
     created_at = models.DateTimeField(_("생성일"), auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(_("수정일"), auto_now=True, editable=False)
+    participants_updated_at = models.DateTimeField(
+        _("참가자 목록 수정일"), default=timezone.now, editable=False
+    )
+    applicants_updated_at = models.DateTimeField(
+        _("신청자 목록 수정일"), default=timezone.now, editable=False
+    )
     creator = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         verbose_name=_("개최자"),
@@ -37,23 +176,124 @@ class Competition(models.Model):
     )
     tournament = models.JSONField(_("토너먼트"), default=dict, null=True)
     content = models.JSONField(_("내용"), default=dict, null=True)
+    content_version = models.PositiveIntegerField(
+        _("내용 판 번호"), default=0, editable=False
+    )
     is_team_game = models.BooleanField(_("팀 게임 여부"), default=False)
+    last_participant_order = models.PositiveIntegerField(
+        _("마지막 참가자 순서"), default=0, editable=False
+    )
+    num_of_participants = models.PositiveIntegerField(
+        _("참가자 수"), default=0, editable=False
+    )
+    num_of_applicants = models.PositiveIntegerField(
+        _("신청자 수"), default=0, editable=False
+    )
+    num_of_managers = models.PositiveIntegerField(
+        _("관리자 수"), default=0, editable=False
+    )
+    # 정원이 없으면 접수 번호를 발급하지 않고 모두 받는다.
+    # 정원은 참가자와 대기하지 않는 신청자 수로 채워지며, 자리가 비면 대기자를 올린다.
+    capacity = models.PositiveIntegerField(_("정원"), null=True, blank=True)
+    waitlist_capacity = models.PositiveIntegerField(_("대기 인원"), default=0)
+    last_ticket = models.PositiveIntegerField(
+        _("마지막 접수 번호"), default=0, editable=False
+    )
+    # 완료된 지 오래돼 하위 목록을 보관 테이블로 옮긴 시각
+    archived_at = models.DateTimeField(_("보관일"), null=True, editable=False)
+    recruit_end_at = models.DateTimeField(_("모집 마감일"), null=True, blank=True)
+    start_at = models.DateTimeField(_("시작일"), null=True, blank=True)
+    end_at = models.DateTimeField(_("종료일"), null=True, blank=True)
+    # 지금 상태에서 다음 상태로 넘어갈 가장 이른 시각. 넘어갈 일이 없으면 NULL 이다.
+    transition_at = models.GeneratedField(
+        expression=models.Case(
+            models.When(
+                status=StatusChoices.RECRUIT,
+                then=Least("recruit_end_at", "start_at", "end_at"),
+            ),
+            models.When(status=StatusChoices.READY, then=Least("start_at", "end_at")),
+            models.When(status=StatusChoices.PLAY, then=models.F("end_at")),
+        ),
+        output_field=models.DateTimeField(null=True),
+        db_persist=True,
+        verbose_name=_("상태 전환 시각"),
+    )
+
+    objects = CompetitionManager()
+
+    # 시각이 지나면 넘어가는 상태
+    TRANSITIONS = {
+        "recruit_end_at": StatusChoices.READY,
+        "start_at": StatusChoices.PLAY,
+        "end_at": StatusChoices.DONE,
+    }
 
     class Meta:
         verbose_name = _("대회")
         verbose_name_plural = _("대회들")
         get_latest_by = "created_at"
+        indexes = [
+            models.Index(
+                fields=["transition_at"],
+                condition=models.Q(transition_at__isnull=False),
+                name="competition_transition_idx",
+            ),
+        ]
+
+    def is_full(self) -> bool:
+        return (
+            self.capacity is not None
+            and self.num_of_participants + self.num_of_applicants
+            >= self.capacity + self.waitlist_capacity
+        )
+
+    def is_recruiting(self, now=None) -> bool:
+        now = now or timezone.now()
+        return self.status == self.StatusChoices.RECRUIT and (
+            self.transition_at is None or self.transition_at > now
+        )
 
 
 class RuleManager(models.Manager):
     def get_latest(self, competition_id: str):
+        """순서마다 가장 깊은(최근) 판의 규칙들"""
+        table = self.model._meta.db_table
         return self.raw(
-            "SELECT * FROM competitions_rule AS r1 WHERE r1.competition_id = %s AND r1.depth = (SELECT MAX(r2.depth) FROM competitions_rule AS r2  WHERE r1.order = r2.order) ORDER BY r1.order",
+            f"SELECT * FROM {table} AS r1 WHERE r1.competition_id = %s AND r1.depth = (SELECT MAX(r2.depth) FROM {table} AS r2 WHERE r2.competition_id = r1.competition_id AND r1.order = r2.order) ORDER BY r1.order",
             [competition_id],
         )
 
+    def add_versions(self, competition_id: str, rules: List[dict]) -> List["Rule"]:
+        """
+        규칙들을 순서마다 새 판(depth + 1)으로 추가한다.
+        대회 행을 잠그므로 동시에 고쳐도 같은 판이 두 번 생기지 않는다.
+        """
+        with transaction.atomic():
+            Competition.objects.select_for_update().only("pk").get(pk=competition_id)
+            depths = dict(
+                self.filter(
+                    competition_id=competition_id,
+                    order__in=[rule["order"] for rule in rules],
+                )
+                .values("order")
+                .annotate(depth=models.Max("depth"))
+                .values_list("order", "depth")
+            )
+            added_at = timezone.now()
+            return self.bulk_create(
+                [
+                    self.model(
+                        competition_id=competition_id,
+                        depth=depths.get(rule["order"], -1) + 1,
+                        added_at=added_at,
+                        **rule,
+                    )
+                    for rule in rules
+                ]
+            )
+
 
-class Rule(models.Model):
+class AbstractRule(models.Model):
     content = models.CharField(_("내용"))
     order = models.PositiveSmallIntegerField(_("순서"))
     depth = models.PositiveSmallIntegerField(_("깊이"))
@@ -67,13 +307,18 @@ class Rule(models.Model):
 
     objects = RuleManager()
 
+    class Meta:
+        abstract = True
+
+
+class Rule(AbstractRule):
     class Meta:
         verbose_name = _("규칙")
         verbose_name_plural = _("규칙들")
         ordering = ["order"]
 
 
-class Management(models.Model):
+class AbstractManagement(models.Model):
     account = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         verbose_name=_("계정"),
@@ -91,6 +336,11 @@ class Management(models.Model):
     handle_participants = models.BooleanField(_("참가자 관리 가능 여부"), default=False)
     accepted = models.BooleanField(_("승락 여부"), default=False)
 
+    class Meta:
+        abstract = True
+
+
+class Management(AbstractManagement):
     class Meta:
         verbose_name = _("대회 관리자")
         verbose_name_plural = _("대회 관리자들")
@@ -105,7 +355,7 @@ class Team(models.Model):
     competition = models.ForeignKey(
         Competition, verbose_name=_("대회"), on_delete=models.PROTECT
     )
-    order = models.PositiveSmallIntegerField(_("순서"))
+    order = models.PositiveIntegerField(_("순서"))
     name = models.CharField(_("팀명"), max_length=30)
     introduction = models.TextField(_("팀 소개글"), null=True, blank=True)
 
@@ -115,10 +365,19 @@ class Team(models.Model):
         ordering = ["order"]
         constraints = [
             models.UniqueConstraint(
-                fields=["competition", "order"], name="unique_team_order"
+                fields=["competition", "order"],
+                name="unique_team_order",
+                deferrable=models.Deferrable.DEFERRED,
             ),
         ]
 
+    @property
+    def members(self):
+        # 보관된 대회의 팀은 보관 테이블에서 미리 읽어 둔 참가자들을 멤버로 갖는다.
+        if hasattr(self, "archived_members"):
+            return self.archived_members
+        return self.participant_set.all()
+
 
 class AbstractPlayer(models.Model):
     account = models.ForeignKey(
@@ -149,32 +408,454 @@ class AbstractPlayer(models.Model):
         return check_password(raw_password, self.access_password)
 
 
-class Participant(AbstractPlayer):
+class ParticipantManager(models.Manager):
+    def accept_applicants(self, competition_id, applicant_ids) -> List[int]:
+        """
+        신청자들을 한 문장의 INSERT ... SELECT 로 참가자로 옮긴다.
+        대회 행의 순서 카운터를 잠근 채 늘리므로,
+        동시에 승인해도 순서가 겹치거나 비지 않는다.
+        대기 중인 신청자는 정원에 자리가 없으므로 옮기지 않는다.
+        """
+        participant_fields = {f.name for f in Participant._meta.concrete_fields}
+        columns = [
+            f.column
+            for f in Applicant._meta.concrete_fields
+            if not f.primary_key and f.name in participant_fields
+        ]
+        column_list = ", ".join(connection.ops.quote_name(c) for c in columns)
+        sql = f"""
+            WITH moved AS (
+                DELETE FROM {Applicant._meta.db_table}
+                WHERE competition_id = %(competition_id)s AND id = ANY(%(ids)s)
+                    AND NOT is_waitlisted
+                RETURNING *
+            ), counter AS (
+                UPDATE {Competition._meta.db_table}
+                SET last_participant_order = last_participant_order
+                        + (SELECT COUNT(*) FROM moved),
+                    num_of_participants = num_of_participants
+                        + (SELECT COUNT(*) FROM moved),
+                    num_of_applicants = num_of_applicants
+                        - (SELECT COUNT(*) FROM moved),
+                    participants_updated_at = %(now)s,
+                    applicants_updated_at = %(now)s
+                WHERE id = %(competition_id)s
+                RETURNING last_participant_order - (SELECT COUNT(*) FROM moved) AS base
+            )
+            INSERT INTO {Participant._meta.db_table}
+                ({column_list}, "order", joined_at, last_login_at)
+            SELECT {column_list},
+                counter.base + ROW_NUMBER() OVER (ORDER BY moved.applied_at, moved.id),
+                %(now)s, %(now)s
+            FROM moved CROSS JOIN counter
+            RETURNING id
+        """
+        with transaction.atomic(), connection.cursor() as cursor:
+            # 대회 행을 먼저 잠가 동시 승인들이 신청자 행을 서로 엇갈려 잠그지 않게 한다.
+            cursor.execute(
+                f"SELECT 1 FROM {Competition._meta.db_table} WHERE id = %s FOR UPDATE",
+                [competition_id],
+            )
+            cursor.execute(
+                sql,
+                {
+                    "competition_id": competition_id,
+                    "ids": list(applicant_ids),
+                    "now": timezone.now(),
+                },
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class AbstractParticipant(AbstractPlayer):
     team = models.ForeignKey(
         Team, verbose_name=_("소속 팀"), null=True, on_delete=models.SET_NULL
     )
-    order = models.PositiveSmallIntegerField(_("순서"))
+    order = models.PositiveIntegerField(_("순서"))
     joined_at = models.DateTimeField(_("참가일"), auto_now_add=True, editable=False)
     last_login_at = models.DateTimeField(_("최근 접속일"), auto_now_add=True)
 
+    class Meta:
+        abstract = True
+
+
+class Participant(AbstractParticipant):
+    """
+    대회 참가자. 테이블은 competition_id 의 해시로 나눈 파티션 테이블이므로
+    (competitions.partitioning) 기본 키가 (id, competition_id) 이고 이를 가리키는 외래 키 제약은 없다.
+    """
+
     class Meta:
         verbose_name = _("대회 참가자")
         verbose_name_plural = _("대회 참가자들")
         ordering = ["order"]
         constraints = [
             models.UniqueConstraint(
-                fields=["competition", "order"], name="unique_participant_order"
-            )
+                fields=["competition", "order"],
+                name="unique_participant_order",
+                deferrable=models.Deferrable.DEFERRED,
+            ),
+            models.UniqueConstraint(
+                fields=["competition", "account"],
+                condition=models.Q(account__isnull=False),
+                name="unique_participant_account",
+            ),
+            models.UniqueConstraint(
+                fields=["competition", "access_id"],
+                condition=models.Q(account__isnull=True),
+                name="unique_participant_access_id",
+            ),
         ]
 
+    objects = ParticipantManager()
+
     def update_last_login(self):
-        self.last_login_at = timezone.now()
-        self.save()
+        self.last_login_at = participant_logins.touch(self.pk)
+
 
+# 토큰 발급마다 참가자 행 전체를 save() 하지 않고 마지막 접속 시각을 모아서 쓴다.
+participant_logins = get_tracker(Participant, "last_login_at")
 
-class Applicant(AbstractPlayer):
+
+class AbstractApplicant(AbstractPlayer):
     applied_at = models.DateTimeField(_("신청일"), auto_now_add=True, editable=False)
+    ticket = models.PositiveIntegerField(_("접수 번호"), null=True, editable=False)
+    is_waitlisted = models.BooleanField(_("대기 여부"), default=False, editable=False)
+
+    class Meta:
+        abstract = True
+
+
+class Applicant(AbstractApplicant):
+    """대회 신청자. 참가자와 같이 competition_id 의 해시로 나눈 파티션 테이블에 둔다."""
 
     class Meta:
         verbose_name = _("대회 신청자")
         verbose_name_plural = _("대회 신청자들")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["competition", "account"],
+                condition=models.Q(account__isnull=False),
+                name="unique_applicant_account",
+            ),
+            models.UniqueConstraint(
+                fields=["competition", "access_id"],
+                condition=models.Q(account__isnull=True),
+                name="unique_applicant_access_id",
+            ),
+        ]
+
+
+class AbstractMatch(models.Model):
+    """
+    대회의 경기 한 건. 팀 게임이면 home_team/away_team, 아니면 home/away 를 쓴다.
+    slot 은 경기 시간대의 순번이고, venue 는 그 시간대 안에서의 경기장 번호이다.
+    대진표/스위스 경기는 position 이 tournament 배열에서의 경기 인덱스이고,
+    winner_to/loser_to 는 승자/패자가 들어갈 자리(2 * position + 0(홈)/1(원정))이다.
+    """
+
+    class SideChoices(models.IntegerChoices):
+        HOME = 0, _("홈")
+        AWAY = 1, _("원정")
+        DRAW = 2, _("무승부")
+
+    competition = models.ForeignKey(
+        Competition,
+        verbose_name=_("대회"),
+        on_delete=models.CASCADE,
+        related_name="matches",
+    )
+    stage = models.PositiveSmallIntegerField(_("단계"), default=0)
+    group = models.PositiveSmallIntegerField(_("조"), default=0)
+    round = models.PositiveSmallIntegerField(_("라운드"))
+    slot = models.PositiveIntegerField(_("시간대"))
+    venue = models.PositiveSmallIntegerField(_("경기장"), default=0)
+    position = models.PositiveIntegerField(_("대진표 위치"), null=True, editable=False)
+    home = models.ForeignKey(
+        Participant,
+        verbose_name=_("홈 참가자"),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        db_constraint=False,
+    )
+    away = models.ForeignKey(
+        Participant,
+        verbose_name=_("원정 참가자"),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        db_constraint=False,
+    )
+    home_team = models.ForeignKey(
+        Team,
+        verbose_name=_("홈 팀"),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    away_team = models.ForeignKey(
+        Team,
+        verbose_name=_("원정 팀"),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    bye = models.PositiveSmallIntegerField(
+        _("부전승 자리"), null=True, choices=SideChoices
+    )
+    home_score = models.PositiveIntegerField(_("홈 점수"), null=True)
+    away_score = models.PositiveIntegerField(_("원정 점수"), null=True)
+    winner = models.PositiveSmallIntegerField(_("승자"), null=True, choices=SideChoices)
+    winner_to = models.PositiveIntegerField(
+        _("승자 진출 자리"), null=True, editable=False
+    )
+    loser_to = models.PositiveIntegerField(
+        _("패자 진출 자리"), null=True, editable=False
+    )
+    reported_at = models.DateTimeField(_("결과 입력일"), null=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+
+class Match(AbstractMatch):
+    class Meta:
+        verbose_name = _("경기")
+        verbose_name_plural = _("경기들")
+        ordering = ["round", "slot", "venue"]
+        indexes = [
+            models.Index(
+                fields=["competition", "round", "slot"], name="match_round_idx"
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["competition", "position"],
+                condition=models.Q(position__isnull=False),
+                name="unique_match_position",
+            ),
+        ]
+
+
+class AbstractStanding(models.Model):
+    """
+    대회 순위표의 한 줄. 경기 결과가 입력될 때마다 해당 행들만 갱신된다.
+    buchholz 는 상대한 참가자(팀)들의 승점 합이고,
+    head_to_head 는 승점이 같은 상대들에게서 얻은 승점이다.
+    """
+
+    competition = models.ForeignKey(
+        Competition,
+        verbose_name=_("대회"),
+        on_delete=models.CASCADE,
+        related_name="standings",
+    )
+    participant = models.ForeignKey(
+        Participant,
+        verbose_name=_("참가자"),
+        null=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_constraint=False,
+    )
+    # 팀을 지우면서 순위 기록까지 사라지지 않도록 막는다.
+    team = models.ForeignKey(
+        Team,
+        verbose_name=_("참가팀"),
+        null=True,
+        on_delete=models.PROTECT,
+        related_name="+",
+    )
+    played = models.PositiveIntegerField(_("경기 수"), default=0)
+    wins = models.PositiveIntegerField(_("승"), default=0)
+    draws = models.PositiveIntegerField(_("무"), default=0)
+    losses = models.PositiveIntegerField(_("패"), default=0)
+    points = models.IntegerField(_("승점"), default=0)
+    score_for = models.PositiveIntegerField(_("득점"), default=0)
+    score_against = models.PositiveIntegerField(_("실점"), default=0)
+    score_difference = models.GeneratedField(
+        expression=models.F("score_for") - models.F("score_against"),
+        output_field=models.IntegerField(),
+        db_persist=True,
+        verbose_name=_("득실차"),
+    )
+    buchholz = models.IntegerField(_("부크홀츠"), default=0)
+    head_to_head = models.IntegerField(_("승자승"), default=0)
+
+    class Meta:
+        abstract = True
+
+
+class Standing(AbstractStanding):
+    class Meta:
+        verbose_name = _("순위")
+        verbose_name_plural = _("순위표")
+        ordering = ["-points", "-buchholz", "-head_to_head", "-score_difference", "-id"]
+        indexes = [
+            models.Index(
+                "competition",
+                models.F("points").desc(),
+                models.F("buchholz").desc(),
+                models.F("head_to_head").desc(),
+                models.F("score_difference").desc(),
+                models.F("id").desc(),
+                name="standing_rank_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["competition", "participant"],
+                condition=models.Q(participant__isnull=False),
+                name="unique_participant_standing",
+            ),
+            models.UniqueConstraint(
+                fields=["competition", "team"],
+                condition=models.Q(team__isnull=False),
+                name="unique_team_standing",
+            ),
+        ]
+
+
+class ArchivedRule(AbstractRule):
+    competition = models.ForeignKey(
+        Competition, verbose_name=_("대회"), on_delete=models.CASCADE, related_name="+"
+    )
+
+    class Meta:
+        verbose_name = _("보관된 규칙")
+        verbose_name_plural = _("보관된 규칙들")
+        ordering = ["order"]
+
+
+class ArchivedManagement(AbstractManagement):
+    class Meta:
+        verbose_name = _("보관된 대회 관리자")
+        verbose_name_plural = _("보관된 대회 관리자들")
+
+
+class ArchivedParticipant(AbstractParticipant):
+    class Meta:
+        verbose_name = _("보관된 대회 참가자")
+        verbose_name_plural = _("보관된 대회 참가자들")
+        ordering = ["order"]
+
+
+class ArchivedApplicant(AbstractApplicant):
+    class Meta:
+        verbose_name = _("보관된 대회 신청자")
+        verbose_name_plural = _("보관된 대회 신청자들")
+
+
+class ArchivedMatch(AbstractMatch):
+    competition = models.ForeignKey(
+        Competition, verbose_name=_("대회"), on_delete=models.CASCADE, related_name="+"
+    )
+    home = models.ForeignKey(
+        ArchivedParticipant,
+        verbose_name=_("홈 참가자"),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    away = models.ForeignKey(
+        ArchivedParticipant,
+        verbose_name=_("원정 참가자"),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+
+    class Meta:
+        verbose_name = _("보관된 경기")
+        verbose_name_plural = _("보관된 경기들")
+        ordering = ["round", "slot", "venue"]
+
+
+class ArchivedStanding(AbstractStanding):
+    competition = models.ForeignKey(
+        Competition, verbose_name=_("대회"), on_delete=models.CASCADE, related_name="+"
+    )
+    participant = models.ForeignKey(
+        ArchivedParticipant,
+        verbose_name=_("참가자"),
+        null=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    class Meta:
+        verbose_name = _("보관된 순위")
+        verbose_name_plural = _("보관된 순위표")
+        ordering = ["-points", "-buchholz", "-head_to_head", "-score_difference", "-id"]
+
+
+class IdempotencyKey(models.Model):
+    """
+    Idempotency-Key 헤더로 들어온 생성 요청의 응답을 (계정, 키)마다 보관한다.
+    같은 키로 다시 들어온 요청은 보관한 응답을 그대로 돌려주며, expires_at 이 지나면 버린다.
+    익명 요청은 account 가 NULL 인 채로 같은 키 공간을 쓴다.
+    """
+
+    key = models.CharField(_("키"), max_length=255)
+    account = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("계정"),
+        null=True,
+        on_delete=models.CASCADE,
+    )
+    fingerprint = models.CharField(_("요청 지문"), max_length=64)
+    status_code = models.PositiveSmallIntegerField(_("응답 코드"), null=True)
+    body = models.JSONField(_("응답 본문"), null=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(_("생성일"), default=timezone.now)
+    expires_at = models.DateTimeField(_("만료일"), db_index=True)
+
+    class Meta:
+        verbose_name = _("멱등 키")
+        verbose_name_plural = _("멱등 키들")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "key"],
+                name="unique_idempotency_key",
+                nulls_distinct=False,
+            )
+        ]
+
+
+class AuditEvent(models.Model):
+    """
+    대회를 바꾼 요청의 기록. 한 번 쓴 행은 고치거나 지우지 않는다(트리거가 막는다).
+    행은 시간 순서대로만 쌓이므로 created_at 은 BRIN 인덱스로 충분하고,
+    대회별 변경분은 id 를 커서로 이어 읽는다.
+    대회나 계정이 지워져도 기록은 남도록 외래 키 제약을 두지 않는다.
+    """
+
+    competition = models.ForeignKey(
+        Competition,
+        verbose_name=_("대회"),
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        verbose_name=_("변경한 계정"),
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        related_name="+",
+    )
+    event = models.CharField(_("변경 종류"), max_length=50)
+    target_id = models.CharField(_("대상 id"), max_length=64, null=True)
+    data = models.JSONField(_("변경 내용"), default=dict, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(_("기록일"), default=timezone.now)
+
+    class Meta:
+        verbose_name = _("변경 기록")
+        verbose_name_plural = _("변경 기록들")
+        indexes = [
+            models.Index(fields=["competition", "id"], name="audit_competition_idx"),
+            BrinIndex(fields=["created_at"], name="audit_created_at_brin"),
+        ]
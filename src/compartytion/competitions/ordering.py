@@ -0,0 +1,137 @@
+from typing import Dict, Iterable, List, Type
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from .models import Competition, Participant
+from .broadcast import publish_competition_event
+
+
+def lock_competition(competition_id) -> None:
+    Competition.objects.select_for_update().filter(pk=competition_id).values_list(
+        "id", flat=True
+    ).get()
+
+
+def get_ordered_ids(model: Type[models.Model], competition_id) -> List[int]:
+    return list(
+        model.objects.filter(competition_id=competition_id)
+        .order_by("order")
+        .values_list("id", flat=True)
+    )
+
+
+def apply_moves(ordered_ids: List[int], moves: Iterable[Dict[str, int]]) -> List[int]:
+    """`moves` 의 각 항목을 차례로 적용해, id 를 1부터 시작하는 위치로 옮긴다."""
+    ordered_ids = list(ordered_ids)
+    for move in moves:
+        try:
+            ordered_ids.remove(move["id"])
+        except ValueError:
+            raise serializers.ValidationError(
+                {"moves": _("대회에 속하지 않은 항목이 포함되어 있습니다.")}
+            )
+        ordered_ids.insert(move["order"] - 1, move["id"])
+    return ordered_ids
+
+
+def rewrite_orders(
+    model: Type[models.Model], competition_id, ordered_ids: List[int]
+) -> int:
+    """
+    `ordered_ids` 의 순서대로 order 를 1부터 다시 매긴다.
+    순서 유니크 제약이 지연(DEFERRED) 되어 있으므로, 배열 두 개를 unnest 한
+    UPDATE ... FROM 한 문장으로 바뀐 행들만 갱신한다.
+    """
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table} AS t
+            SET "order" = v.new_order
+            FROM unnest(%s::bigint[], %s::integer[]) AS v(id, new_order)
+            WHERE t.id = v.id AND t.competition_id = %s AND t."order" <> v.new_order
+            """,
+            [
+                ordered_ids,
+                list(range(1, len(ordered_ids) + 1)),
+                competition_id,
+            ],
+        )
+        return cursor.rowcount
+
+
+def compact_orders(model: Type[models.Model], competition_id) -> int:
+    """삭제로 생긴 빈 순서를 메워 order 를 1..n 으로 만든다."""
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table} AS t
+            SET "order" = r.new_order
+            FROM (
+                SELECT id, ROW_NUMBER() OVER (ORDER BY "order", id) AS new_order
+                FROM {table}
+                WHERE competition_id = %s
+            ) AS r
+            WHERE t.id = r.id AND t."order" <> r.new_order
+            """,
+            [competition_id],
+        )
+        return cursor.rowcount
+
+
+class Reorderer:
+    """
+    대회의 참가자/팀 순서를 한꺼번에 바꾼다.
+    대회 행을 잠가 승인이나 가져오기와 동시에 순서가 바뀌지 않게 한다.
+    """
+
+    def __init__(self, model: Type[models.Model], competition_id):
+        self.model = model
+        self.competition_id = competition_id
+
+    def after_rewrite(self, num_of_rows: int) -> None:
+        pass
+
+    def reorder(self, order: List[int] = None, moves: List[Dict] = None) -> int:
+        with transaction.atomic():
+            lock_competition(self.competition_id)
+            current = get_ordered_ids(self.model, self.competition_id)
+            if order is not None:
+                if len(order) != len(current) or set(order) != set(current):
+                    raise serializers.ValidationError(
+                        {"order": _("모든 항목을 한 번씩 포함해야 합니다.")}
+                    )
+                ordered_ids = order
+            else:
+                ordered_ids = apply_moves(current, moves)
+            num_of_updated = rewrite_orders(
+                self.model, self.competition_id, ordered_ids
+            )
+            self.after_rewrite(len(ordered_ids))
+        return num_of_updated
+
+    def compact(self) -> int:
+        with transaction.atomic():
+            lock_competition(self.competition_id)
+            num_of_updated = compact_orders(self.model, self.competition_id)
+            self.after_rewrite(
+                self.model.objects.filter(competition_id=self.competition_id).count()
+            )
+        return num_of_updated
+
+
+class ParticipantReorderer(Reorderer):
+    def __init__(self, competition_id):
+        super().__init__(Participant, competition_id)
+
+    def after_rewrite(self, num_of_rows: int) -> None:
+        # 순서가 1..n 으로 다시 매겨졌으므로 카운터도 맞춘다.
+        Competition.objects.filter(pk=self.competition_id).update(
+            last_participant_order=num_of_rows,
+            participants_updated_at=timezone.now(),
+        )
+        publish_competition_event(self.competition_id, "participant.reordered", {})
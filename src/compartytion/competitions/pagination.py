@@ -0,0 +1,198 @@
+import base64
+import binascii
+import json
+from datetime import timedelta
+from typing import Any, List
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Max, Min, Q, QuerySet
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class RoundPagination(BasePagination):
+    """
+    경기 목록을 라운드 단위로 나눈다. `?round=` 로 라운드를 고르며 기본값은 첫 라운드이다.
+    라운드 범위는 (competition, round) 인덱스로 구한다.
+    """
+
+    page_query_param = "round"
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None):
+        self.request = request
+        bounds = queryset.order_by().aggregate(first=Min("round"), last=Max("round"))
+        self.first, self.last = bounds["first"], bounds["last"]
+        if self.first is None:
+            self.round = None
+            return []
+        try:
+            self.round = int(
+                request.query_params.get(self.page_query_param, self.first)
+            )
+        except ValueError:
+            raise NotFound(_("잘못된 라운드입니다."))
+        return list(queryset.filter(round=self.round))
+
+    def get_round_link(self, round):
+        if self.round is None or not self.first <= round <= self.last:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, round)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "round": self.round,
+                "last_round": self.last,
+                "next": self.get_round_link((self.round or 0) + 1),
+                "previous": self.get_round_link((self.round or 0) - 1),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "round": {"type": "integer", "nullable": True},
+                "last_round": {"type": "integer", "nullable": True},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class KeysetPagination(BasePagination):
+    """
+    마지막 행의 정렬 키 값들을 커서로 넘겨 다음 페이지를 OFFSET 없이 읽는다.
+    정렬은 뷰의 `ordering` 을 따르며, 마지막 키는 유일해야 한다.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size_setting = "STANDINGS_PAGE_SIZE"
+    max_page_size = 500
+
+    def get_page_size(self, request) -> int:
+        page_size = getattr(settings, self.page_size_setting, 50)
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            pass
+        return max(1, min(page_size, self.max_page_size))
+
+    def encode_cursor(self, values: List[Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def decode_cursor(self, cursor: str, model) -> List[Any]:
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError):
+            raise NotFound(_("잘못된 커서입니다."))
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(_("잘못된 커서입니다."))
+        # 값의 형식이 정렬 필드와 맞지 않으면 쿼리를 만들 때 500 이 나므로 미리 바꿔 본다.
+        try:
+            values = [
+                model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (ValidationError, TypeError):
+            raise NotFound(_("잘못된 커서입니다."))
+        if None in values:
+            raise NotFound(_("잘못된 커서입니다."))
+        return values
+
+    def after(self, values: List[Any]) -> Q:
+        """(k1, k2, ...) 가 커서보다 뒤에 오는 행들. 첫 키의 범위 조건은 인덱스 범위 탐색에 쓰인다."""
+        condition, equal = Q(), Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        first = self.ordering[0]
+        bound = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{bound}": values[0]}) & condition
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None):
+        self.request = request
+        self.ordering = list(view.ordering)
+        queryset = queryset.order_by(*self.ordering)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(
+                self.after(self.decode_cursor(cursor, queryset.model))
+            )
+
+        page_size = self.get_page_size(request)
+        rows = list(queryset[: page_size + 1])
+        self.page = rows[:page_size]
+        self.has_next = len(rows) > page_size
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        values = [getattr(last, field.lstrip("-")) for field in self.ordering]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(values)
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class ChangeFeedPagination(KeysetPagination):
+    """
+    변경 기록을 id 순서로 이어 읽는다. 마지막 페이지에서도 `cursor` 를 돌려주므로,
+    클라이언트는 그 값을 저장해 두었다가 다음에 그 뒤의 변경분만 읽을 수 있다.
+    id 는 INSERT 때 발급되고 커밋 순서와 다를 수 있으므로, id 가 N+1 인 기록을 내준 뒤에
+    N 이 커밋되면 커서 뒤로 영영 빠진다. 그래서 AUDIT_FEED_SETTLE_SECONDS 보다 최근의 기록은
+    내주지 않는다. 기록은 커밋 직전에 시각을 찍고 쓰므로, 커밋이 그보다 늦지 않으면 빠지는 기록이 없다.
+    """
+
+    page_size_setting = "AUDIT_FEED_PAGE_SIZE"
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None):
+        self.cursor = request.query_params.get(self.cursor_query_param)
+        settle = timedelta(seconds=getattr(settings, "AUDIT_FEED_SETTLE_SECONDS", 5))
+        queryset = queryset.filter(created_at__lt=timezone.now() - settle)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_cursor(self):
+        if not self.page:
+            return self.cursor
+        last = self.page[-1]
+        return self.encode_cursor(
+            [getattr(last, field.lstrip("-")) for field in self.ordering]
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            {"next": self.get_next_link(), "cursor": self.get_cursor(), "results": data}
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response = super().get_paginated_response_schema(schema)
+        response["properties"]["cursor"] = {"type": "string", "nullable": True}
+        return response
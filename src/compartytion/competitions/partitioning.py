@@ -0,0 +1,212 @@
+import re
+from typing import Optional
+
+from django.db import models
+from django.db.migrations.operations.base import Operation
+
+# 파티션 테이블과 그 인덱스 이름 끝에 붙는 파티션 번호
+PARTITION_SUFFIX = re.compile(r"_p\d+$")
+
+
+def get_constraint_name(error: Exception) -> Optional[str]:
+    """
+    IntegrityError 를 일으킨 제약 조건의 이름을 반환한다.
+    파티션 테이블에서는 파티션의 인덱스 이름이 오므로 파티션 번호를 떼어 부모 이름으로 돌린다.
+    """
+    name = getattr(getattr(error.__cause__, "diag", None), "constraint_name", None)
+    return PARTITION_SUFFIX.sub("", name) if name else name
+
+
+def rebuild_table(
+    schema_editor, model, column: Optional[str] = None, partitions: int = 0
+):
+    """
+    모델의 테이블을 `column` 의 해시로 `partitions` 개로 나눈 파티션 테이블로 다시 만든다.
+    `column` 이 없으면 보통 테이블로 되돌린다. 행의 id 와 다음 id 는 그대로 이어진다.
+
+    파티션 테이블의 기본 키와 유니크 제약은 파티션 키를 포함해야 하므로
+    기본 키는 (id, column) 이 되고, 이 테이블을 가리키는 외래 키 제약은 둘 수 없다.
+    모델의 인덱스/제약은 다시 만들고, 파티션의 인덱스에는 부모 이름 뒤에 _p<번호> 를 붙인다.
+    """
+    connection = schema_editor.connection
+    qn = schema_editor.quote_name
+    table = model._meta.db_table
+    old_table = f"{table}_old"
+    pk_column = model._meta.pk.column
+    columns = ", ".join(
+        qn(f.column) for f in model._meta.concrete_fields if not f.generated
+    )
+
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+        cursor.execute(
+            f"SELECT last_value, is_called FROM {pg_serial_sequence(cursor, table, pk_column)}"
+        )
+        last_value, is_called = cursor.fetchone()
+
+    # 옛 테이블의 이름과 인덱스/시퀀스 이름을 비워 새 테이블이 같은 이름을 쓰게 한다.
+    schema_editor.execute(f"ALTER TABLE {qn(table)} RENAME TO {qn(old_table)}")
+    for name, info in constraints.items():
+        if info["primary_key"] or info["unique"] or info["foreign_key"]:
+            schema_editor.execute(
+                f"ALTER TABLE {qn(old_table)} DROP CONSTRAINT IF EXISTS {qn(name)}"
+            )
+        elif info["index"]:
+            schema_editor.execute(f"DROP INDEX IF EXISTS {qn(name)}")
+    schema_editor.execute(
+        f"ALTER TABLE {qn(old_table)} ALTER COLUMN {qn(pk_column)} DROP IDENTITY IF EXISTS"
+    )
+    schema_editor.execute(
+        f"ALTER TABLE {qn(old_table)} ALTER COLUMN {qn(pk_column)} DROP DEFAULT"
+    )
+    schema_editor.execute(f"DROP SEQUENCE IF EXISTS {qn(f'{table}_{pk_column}_seq')}")
+
+    schema_editor.execute(
+        f"""
+        CREATE TABLE {qn(table)} (
+            LIKE {qn(old_table)}
+            INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED
+            INCLUDING STORAGE INCLUDING COMMENTS
+        )
+        {f"PARTITION BY HASH ({qn(column)})" if column else ""}
+        """
+    )
+    if column:
+        for remainder in range(partitions):
+            schema_editor.execute(
+                f"""
+                CREATE TABLE {qn(f"{table}_p{remainder}")} PARTITION OF {qn(table)}
+                FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})
+                """
+            )
+        # PostgreSQL 16 까지는 파티션 테이블에 IDENTITY 열을 둘 수 없다.
+        sequence = qn(f"{table}_{pk_column}_seq")
+        schema_editor.execute(
+            f"CREATE SEQUENCE {sequence} OWNED BY {qn(table)}.{qn(pk_column)}"
+        )
+        schema_editor.execute(
+            f"""
+            ALTER TABLE {qn(table)} ALTER COLUMN {qn(pk_column)}
+            SET DEFAULT nextval('{sequence}')
+            """
+        )
+    else:
+        schema_editor.execute(
+            f"""
+            ALTER TABLE {qn(table)} ALTER COLUMN {qn(pk_column)}
+            ADD GENERATED BY DEFAULT AS IDENTITY
+            """
+        )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT setval(%s, %s, %s)",
+            [pg_serial_sequence(cursor, table, pk_column), last_value, is_called],
+        )
+
+    schema_editor.execute(
+        f"INSERT INTO {qn(table)} ({columns}) SELECT {columns} FROM {qn(old_table)}"
+    )
+    schema_editor.execute(f"DROP TABLE {qn(old_table)}")
+
+    pk_columns = [pk_column, column] if column else [pk_column]
+    schema_editor.execute(
+        f"""
+        ALTER TABLE {qn(table)} ADD CONSTRAINT {qn(f"{table}_pkey")}
+        PRIMARY KEY ({", ".join(qn(c) for c in pk_columns)})
+        """
+    )
+    for field in model._meta.local_fields:
+        if field.remote_field and field.db_constraint:
+            schema_editor.execute(
+                schema_editor._create_fk_sql(
+                    model, field, "_fk_%(to_table)s_%(to_column)s"
+                )
+            )
+    for sql in schema_editor._model_indexes_sql(model):
+        schema_editor.execute(sql)
+    for constraint in model._meta.constraints:
+        # 검사 제약은 LIKE ... INCLUDING CONSTRAINTS 로 이미 옮겨졌다.
+        if not isinstance(constraint, models.CheckConstraint):
+            schema_editor.add_constraint(model, constraint)
+    if column:
+        rename_partition_indexes(schema_editor, table)
+
+
+def pg_serial_sequence(cursor, table: str, column: str) -> str:
+    cursor.execute("SELECT pg_get_serial_sequence(%s, %s)", [table, column])
+    return cursor.fetchone()[0]
+
+
+def rename_partition_indexes(schema_editor, table: str):
+    """파티션마다 자동으로 붙은 인덱스 이름을 <부모 인덱스 이름>_p<번호> 로 바꾼다."""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child_index.relname, parent_index.relname, partition.relname
+            FROM pg_inherits AS parts
+            JOIN pg_class AS partition ON partition.oid = parts.inhrelid
+            JOIN pg_index AS child ON child.indrelid = partition.oid
+            JOIN pg_class AS child_index ON child_index.oid = child.indexrelid
+            JOIN pg_inherits AS attached ON attached.inhrelid = child.indexrelid
+            JOIN pg_class AS parent_index ON parent_index.oid = attached.inhparent
+            WHERE parts.inhparent = %s::regclass
+            """,
+            [table],
+        )
+        rows = cursor.fetchall()
+    max_length = schema_editor.connection.ops.max_name_length()
+    for child_index, parent_index, partition in rows:
+        suffix = PARTITION_SUFFIX.search(partition).group()
+        name = parent_index[: max_length - len(suffix)] + suffix
+        schema_editor.execute(
+            f"ALTER INDEX {schema_editor.quote_name(child_index)} "
+            f"RENAME TO {schema_editor.quote_name(name)}"
+        )
+
+
+class HashPartition(Operation):
+    """
+    모델의 테이블을 `column` 의 해시 파티션 테이블로 바꾸는 마이그레이션 작업.
+    모델 상태는 바꾸지 않으며, 되돌리면 보통 테이블로 돌아간다.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name: str, column: str, partitions: int):
+        self.model_name = model_name
+        self.column = column
+        self.partitions = partitions
+
+    def deconstruct(self):
+        return (
+            self.__class__.__qualname__,
+            [],
+            {
+                "model_name": self.model_name,
+                "column": self.column,
+                "partitions": self.partitions,
+            },
+        )
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            rebuild_table(schema_editor, model, self.column, self.partitions)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            rebuild_table(schema_editor, model)
+
+    def describe(self):
+        return (
+            f"Hash partition {self.model_name} by {self.column} "
+            f"into {self.partitions} partitions"
+        )
+
+    @property
+    def migration_name_fragment(self):
+        return f"partition_{self.model_name.lower()}"
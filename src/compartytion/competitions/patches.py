@@ -0,0 +1,140 @@
+import copy
+from typing import Any, List
+
+from rest_framework.parsers import JSONParser
+
+
+class JSONPatchParser(JSONParser):
+    media_type = "application/json-patch+json"
+
+
+class MergePatchParser(JSONParser):
+    media_type = "application/merge-patch+json"
+
+
+class PatchError(ValueError):
+    pass
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """RFC 7386 JSON Merge Patch. null 인 키는 지우고, 객체는 재귀로 합친다."""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
+
+
+def parse_pointer(pointer: Any) -> List[str]:
+    """RFC 6901 JSON Pointer 를 토큰 목록으로 나눈다."""
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise PatchError(f"잘못된 경로입니다: {pointer!r}")
+    if not pointer:
+        return []
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")
+    ]
+
+
+def get_index(container: list, token: str, append: bool = False) -> int:
+    if append and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise PatchError(f"잘못된 배열 인덱스입니다: {token!r}")
+    index = int(token)
+    if index > len(container) or (not append and index == len(container)):
+        raise PatchError(f"배열 범위를 벗어났습니다: {token!r}")
+    return index
+
+
+def resolve(document: Any, tokens: List[str]) -> Any:
+    for token in tokens:
+        if isinstance(document, dict):
+            if token not in document:
+                raise PatchError(f"없는 키입니다: {token!r}")
+            document = document[token]
+        elif isinstance(document, list):
+            document = document[get_index(document, token)]
+        else:
+            raise PatchError(f"값 안으로 들어갈 수 없습니다: {token!r}")
+    return document
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    # 파이썬에서는 True == 1 이지만 JSON 에서는 서로 다른 값이다.
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(json_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(json_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def add(document: Any, tokens: List[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent = resolve(document, tokens[:-1])
+    if isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    elif isinstance(parent, list):
+        parent.insert(get_index(parent, tokens[-1], append=True), value)
+    else:
+        raise PatchError(f"값을 넣을 수 없는 경로입니다: {tokens!r}")
+    return document
+
+
+def remove(document: Any, tokens: List[str]) -> Any:
+    if not tokens:
+        raise PatchError("문서 전체는 지울 수 없습니다.")
+    parent = resolve(document, tokens[:-1])
+    resolve(parent, tokens[-1:])
+    if isinstance(parent, dict):
+        del parent[tokens[-1]]
+    else:
+        del parent[get_index(parent, tokens[-1])]
+    return document
+
+
+def apply_json_patch(document: Any, operations: Any) -> Any:
+    """
+    RFC 6902 JSON Patch 를 문서의 복사본에 차례로 적용해 반환한다.
+    하나라도 실패하면 PatchError 를 일으키고 원래 문서는 그대로 둔다.
+    """
+    if not isinstance(operations, list):
+        raise PatchError("JSON Patch 는 연산들의 배열이어야 합니다.")
+    document = copy.deepcopy(document)
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise PatchError("연산은 객체여야 합니다.")
+        op = operation.get("op")
+        path = parse_pointer(operation.get("path"))
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise PatchError(f"{op} 연산에는 value 가 필요합니다.")
+        if op == "add":
+            document = add(document, path, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            document = remove(document, path)
+        elif op == "replace":
+            resolve(document, path)
+            if path:
+                document = remove(document, path)
+            document = add(document, path, copy.deepcopy(operation["value"]))
+        elif op in ("move", "copy"):
+            source = parse_pointer(operation.get("from"))
+            value = copy.deepcopy(resolve(document, source))
+            if op == "move":
+                if path[: len(source)] == source and path != source:
+                    raise PatchError("값을 자기 안으로 옮길 수 없습니다.")
+                document = remove(document, source)
+            document = add(document, path, value)
+        elif op == "test":
+            if not json_equal(resolve(document, path), operation["value"]):
+                raise PatchError(f"test 연산이 실패했습니다: {operation['path']!r}")
+        else:
+            raise PatchError(f"알 수 없는 연산입니다: {op!r}")
+    return document
@@ -2,7 +2,8 @@ from typing import Dict
 from rest_framework.request import Request
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
-from .models import Competition, Management
+from .archive import get_model
+from .models import Competition, Management, Participant
 
 
 class IsCreator(BasePermission):
@@ -12,12 +13,35 @@ class IsCreator(BasePermission):
 
 class IsManager(BasePermission):
     def has_object_permission(self, request: Request, view, obj: Competition) -> bool:
-        return request.user in obj.managers.all()
+        if not request.user.is_authenticated:
+            return False
+        return (
+            get_model(Management, obj)
+            .objects.filter(competition=obj, account_id=request.user.id)
+            .exists()
+        )
 
 
 class IsParticipant(BasePermission):
     def has_object_permission(self, request: Request, view, obj: Competition) -> bool:
-        return request.user in obj.participant_set.all()
+        if not request.user.is_authenticated:
+            return False
+        return (
+            get_model(Participant, obj)
+            .objects.filter(competition=obj, account_id=request.user.id)
+            .exists()
+        )
+
+
+class CanEditContent(BasePermission):
+    def has_object_permission(self, request: Request, view, obj: Competition) -> bool:
+        if not request.user.is_authenticated:
+            return False
+        if obj.creator_id == request.user.id:
+            return True
+        return Management.objects.filter(
+            competition=obj, account_id=request.user.id, handle_content=True
+        ).exists()
 
 
 class ManagementPermission(BasePermission):
@@ -33,9 +57,11 @@ class ManagementPermission(BasePermission):
             if request.user == competition.creator:
                 return True
             if request.method in SAFE_METHODS:
-                return Management.objects.filter(
-                    competition=competition, account=request.user
-                ).exists()
+                return (
+                    get_model(Management, competition)
+                    .objects.filter(competition=competition, account=request.user)
+                    .exists()
+                )
             else:
                 if not self._handle_method_name:
                     return False
@@ -51,3 +77,11 @@ class ManagementPermission(BasePermission):
 
 class ApplicantManagementPermission(ManagementPermission):
     _handle_method_name = "handle_applicants"
+
+
+class ParticipantManagementPermission(ManagementPermission):
+    _handle_method_name = "handle_participants"
+
+
+class RuleManagementPermission(ManagementPermission):
+    _handle_method_name = "handle_rules"
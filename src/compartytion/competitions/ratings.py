@@ -0,0 +1,91 @@
+from typing import Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from ..users.models import Rating
+from ..users.ratings import RatingPool, index_accounts
+from .models import Match, Participant
+
+HOME, AWAY, DRAW = Match.SideChoices.values
+
+
+def get_period_seconds() -> int:
+    return getattr(settings, "RATING_PERIOD_SECONDS", 7 * 24 * 60 * 60)
+
+
+def current_period() -> int:
+    return int(timezone.now().timestamp()) // get_period_seconds()
+
+
+def fetch_results(
+    since: int, until: int, chunk_size: int = 200000
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    평가 기간 [since, until) 에 결과가 입력된 개인전 경기들을
+    (평가 기간, 홈 계정, 원정 계정, 홈 점수) 배열로 읽는다.
+    수백만 행도 메모리에 튜플로 쌓이지 않도록 서버 쪽 커서에서 묶음으로 받아 배열로 옮긴다.
+    계정이 없는 참가자나 같은 계정끼리의 경기는 빼고, 팀 경기는 계산하지 않는다.
+    """
+    participant = Participant._meta.db_table
+    sql = f"""
+        SELECT floor(extract(epoch FROM m.reported_at) / %(seconds)s)::bigint,
+            h.account_id, a.account_id,
+            CASE m.winner WHEN {HOME} THEN 1.0 WHEN {AWAY} THEN 0.0 ELSE 0.5 END
+        FROM {Match._meta.db_table} AS m
+        JOIN {participant} AS h ON h.id = m.home_id
+        JOIN {participant} AS a ON a.id = m.away_id
+        WHERE m.winner IS NOT NULL AND m.bye IS NULL
+            AND m.reported_at >= to_timestamp(%(since)s * %(seconds)s)
+            AND m.reported_at < to_timestamp(%(until)s * %(seconds)s)
+            AND h.account_id IS NOT NULL AND a.account_id IS NOT NULL
+            AND h.account_id <> a.account_id
+    """
+    chunks = []
+    with transaction.atomic(), connection.chunked_cursor() as cursor:
+        cursor.execute(
+            sql, {"seconds": get_period_seconds(), "since": since, "until": until}
+        )
+        while rows := cursor.fetchmany(chunk_size):
+            chunks.append(np.array(rows, dtype=np.float64))
+    if not chunks:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty, np.empty(0)
+    results = np.concatenate(chunks)
+    periods, home, away = results[:, :3].astype(np.int64).T
+    return periods, home, away, results[:, 3]
+
+
+def update_ratings(full: bool = False, until: Optional[int] = None) -> Tuple[int, int]:
+    """
+    끝난 평가 기간들의 경기 결과로 계정 레이팅을 갱신한다.
+    `full` 이면 모든 레이팅을 지우고 처음부터 다시 계산하고,
+    아니면 마지막으로 반영한 평가 기간 다음부터 이어서 계산한다.
+    진행 중인 평가 기간은 끝날 때까지 반영하지 않는다. (처리한 기간 수, 갱신한 계정 수)
+    """
+    until = current_period() if until is None else until
+    with transaction.atomic():
+        # 갱신 작업끼리만 막고 레이팅 조회는 막지 않는다.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"LOCK TABLE {Rating._meta.db_table} IN SHARE ROW EXCLUSIVE MODE"
+            )
+        if full:
+            Rating.objects.all().delete()
+            since = 0
+        else:
+            last = Rating.objects.aggregate(last=Max("period"))["last"]
+            since = 0 if last is None else last + 1
+
+        periods, home, away, score = fetch_results(since, until)
+        if not len(periods):
+            return 0, 0
+        account_ids, (home, away) = index_accounts(home, away)
+        pool = RatingPool(account_ids)
+        if not full:
+            pool.load()
+        num_of_periods = pool.rate(periods, home, away, score)
+        return num_of_periods, pool.save()
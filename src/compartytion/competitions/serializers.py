@@ -1,15 +1,44 @@
 from django.contrib.auth.models import AnonymousUser
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Q
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 
-from .models import Competition, Rule, Management, Applicant, Participant
-from .exceptions import AlreadyApplied, NotApplied, AlreadyBeParticipant, InvalidRequest
+from .models import (
+    AuditEvent,
+    Competition,
+    Rule,
+    Management,
+    Applicant,
+    Participant,
+    Team,
+    Match,
+    Standing,
+)
+from .archive import get_model
+from .partitioning import get_constraint_name
+from .tournament.bracket import Bracket
+from .tournament.entrants import ORDER, RATING
+from .exceptions import (
+    AlreadyApplied,
+    NotApplied,
+    AlreadyBeParticipant,
+    CompetitionFull,
+    InvalidRequest,
+    RecruitmentClosed,
+)
 from ..users.models import Profile
 from ..users.serializers import SimpleAccountSerializer
 
 
 class RuleListSerializer(serializers.ListSerializer):
+    def validate(self, attrs):
+        orders = [rule["order"] for rule in attrs]
+        if len(set(orders)) != len(orders):
+            raise serializers.ValidationError(_("규칙 순서가 겹칩니다."))
+        return attrs
+
     def create(self, validated_data):
         rules = [Rule(**item) for item in validated_data]
         return Rule.objects.bulk_create(rules)
@@ -24,6 +53,15 @@ class RuleSerializer(serializers.ModelSerializer):
         list_serializer_class = RuleListSerializer
 
 
+class AuditEventSerializer(serializers.ModelSerializer):
+    actor = SimpleAccountSerializer(read_only=True)
+
+    class Meta:
+        model = AuditEvent
+        fields = ["id", "event", "actor", "target_id", "data", "created_at"]
+        read_only_fields = fields
+
+
 class SimpleParticipantSerializer(serializers.ModelSerializer):
     account = SimpleAccountSerializer(many=False)
 
@@ -45,9 +83,11 @@ class ParticipantSerializer(SimpleParticipantSerializer):
             "hidden_name",
             "introduction",
             "order",
+            "team",
             "joined_at",
             "last_login_at",
         ]
+        read_only_fields = ["team"]
         extra_kwargs = {
             "access_id": {"write_only": True},
             "access_password": {"write_only": True},
@@ -55,8 +95,138 @@ class ParticipantSerializer(SimpleParticipantSerializer):
         }
 
 
+class ParticipantImportFileSerializer(serializers.Serializer):
+    file = serializers.FileField()
+
+
+class TeamSerializer(serializers.ModelSerializer):
+    members = SimpleParticipantSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Team
+        fields = ["id", "order", "name", "introduction", "members"]
+        read_only_fields = ["order"]
+
+
+class TeamAutoAssignSerializer(serializers.Serializer):
+    num_of_teams = serializers.IntegerField(min_value=1)
+    attribute = serializers.ChoiceField(
+        choices=[("seed", _("시드")), ("rating", _("레이팅"))], default="seed"
+    )
+
+
+class SeedingSerializer(serializers.Serializer):
+    seeding = serializers.ChoiceField(
+        choices=[(ORDER, _("참가 순서")), (RATING, _("레이팅"))], default=ORDER
+    )
+
+
+class BracketGenerateSerializer(SeedingSerializer):
+    format = serializers.ChoiceField(
+        choices=[
+            (Bracket.SINGLE_ELIMINATION, _("싱글 엘리미네이션")),
+            (Bracket.DOUBLE_ELIMINATION, _("더블 엘리미네이션")),
+        ]
+    )
+
+
+class ScheduleGenerateSerializer(SeedingSerializer):
+    num_of_groups = serializers.IntegerField(min_value=1, default=1)
+    rest = serializers.IntegerField(min_value=0, default=0)
+    capacity = serializers.IntegerField(min_value=1, default=None, allow_null=True)
+
+
+class MatchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Match
+        fields = [
+            "id",
+            "group",
+            "round",
+            "slot",
+            "venue",
+            "home",
+            "away",
+            "home_team",
+            "away_team",
+            "stage",
+            "position",
+            "bye",
+            "home_score",
+            "away_score",
+            "winner",
+            "reported_at",
+        ]
+        read_only_fields = fields
+
+
+class MatchReportSerializer(serializers.Serializer):
+    home_score = serializers.IntegerField(min_value=0)
+    away_score = serializers.IntegerField(min_value=0)
+    winner = serializers.ChoiceField(
+        choices=Match.SideChoices.choices, required=False, allow_null=True
+    )
+
+    def validate(self, attrs):
+        # 동점일 때만 승자를 따로 정할 수 있다. (승부차기 등)
+        home_score, away_score = attrs["home_score"], attrs["away_score"]
+        winner = attrs.get("winner")
+        if winner is not None and home_score != away_score:
+            if winner != (
+                Match.SideChoices.HOME
+                if home_score > away_score
+                else Match.SideChoices.AWAY
+            ):
+                raise InvalidRequest(_("점수와 승자가 맞지 않습니다."))
+        return attrs
+
+
+class StandingSerializer(serializers.ModelSerializer):
+    name = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Standing
+        fields = [
+            "participant",
+            "team",
+            "name",
+            "played",
+            "wins",
+            "draws",
+            "losses",
+            "points",
+            "score_for",
+            "score_against",
+            "score_difference",
+            "buchholz",
+            "head_to_head",
+        ]
+
+    def get_name(self, obj: Standing) -> str:
+        if obj.team_id is not None:
+            return obj.team.name
+        return obj.participant.displayed_name
+
+
+class OrderMoveSerializer(serializers.Serializer):
+    id = serializers.IntegerField(min_value=1)
+    order = serializers.IntegerField(min_value=1)
+
+
+class ReorderSerializer(serializers.Serializer):
+    order = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), required=False
+    )
+    moves = OrderMoveSerializer(many=True, required=False)
+
+    def validate(self, data):
+        if ("order" in data) == ("moves" in data):
+            raise InvalidRequest(_("order 와 moves 중 하나만 입력해주세요."))
+        return data
+
+
 class ManagementSerializer(serializers.ModelSerializer):
-    account = SimpleAccountSerializer(many=False)
+    account = SimpleAccountSerializer(many=False, read_only=True)
 
     class Meta:
         model = Management
@@ -72,20 +242,15 @@ class ManagementSerializer(serializers.ModelSerializer):
             "accepted",
         ]
         extra_kwargs = {
+            "competition": {"read_only": True},
             "nickname": {"read_only": True},
             "accepted": {"read_only": True},
         }
 
     def update(self, instance, validated_data):
-        try:
-            creator_id = Competition.objects.get(id=instance.competition).creator_id
-            if creator_id == validated_data["account"]:
-                raise serializers.ValidationError({"account": _("수정할 수 없습니다.")})
-        except Competition.DoesNotExist:
-            raise serializers.ValidationError(
-                {"competition": _("대회를 찾을 수 없습니다.")}
-            )
-
+        # 개최자 자신의 관리 권한은 고칠 수 없다.
+        if instance.account_id == instance.competition.creator_id:
+            raise serializers.ValidationError({"account": _("수정할 수 없습니다.")})
         return super().update(instance, validated_data)
 
 
@@ -95,6 +260,20 @@ class ManagementNicknameSerializer(serializers.ModelSerializer):
         fields = ["id", "nickname"]
 
 
+def validate_schedule(data, instance=None):
+    """모집 마감일, 시작일, 종료일이 그 순서인지 확인한다. (비어 있는 시각은 건너뛴다.)"""
+    times = [
+        data.get(field, getattr(instance, field, None))
+        for field in Competition.TRANSITIONS
+    ]
+    times = [time for time in times if time is not None]
+    if times != sorted(times):
+        raise serializers.ValidationError(
+            _("모집 마감일, 시작일, 종료일 순서로 입력해주세요.")
+        )
+    return data
+
+
 class CompetitionCreateSerializer(serializers.ModelSerializer):
     creator = serializers.HiddenField(default=serializers.CurrentUserDefault())
     managers = serializers.ListField(child=serializers.CharField())
@@ -109,8 +288,16 @@ class CompetitionCreateSerializer(serializers.ModelSerializer):
             "introduction",
             "is_team_game",
             "managers",
+            "recruit_end_at",
+            "start_at",
+            "end_at",
+            "capacity",
+            "waitlist_capacity",
         ]
 
+    def validate(self, data):
+        return validate_schedule(data)
+
     def create(self, validated_data):
         managers_data = validated_data.pop("managers")
         creator = self.validated_data["creator"]
@@ -118,34 +305,38 @@ class CompetitionCreateSerializer(serializers.ModelSerializer):
         while creator_username in managers_data:
             managers_data.remove(creator_username)
 
-        competition = Competition.objects.create(**validated_data)
-        Management.objects.create(
-            competition=competition,
-            account_id=creator.id,
-            nickname="개최자",
-            is_creator=True,
-            handle_rules=True,
-            handle_content=True,
-            handle_applicants=True,
-            handle_participants=True,
-            accepted=True,
-        )
-
-        if managers_data is not None:
-            account_ids = Profile.objects.filter(
-                username__in=managers_data
-            ).values_list("account_id", flat=True)
-            Management.objects.bulk_create(
-                [
-                    Management(
-                        account_id=account_id,
-                        nickname=_(f"관리자 {idx}"),
-                        competition=competition,
-                    )
-                    for idx, account_id in enumerate(account_ids, start=1)
-                ]
+        with transaction.atomic():
+            competition = Competition.objects.create(**validated_data)
+            Management.objects.create(
+                competition=competition,
+                account_id=creator.id,
+                nickname="개최자",
+                is_creator=True,
+                handle_rules=True,
+                handle_content=True,
+                handle_applicants=True,
+                handle_participants=True,
+                accepted=True,
             )
 
+            if managers_data is not None:
+                account_ids = Profile.objects.filter(
+                    username__in=managers_data
+                ).values_list("account_id", flat=True)
+                managements = Management.objects.bulk_create(
+                    [
+                        Management(
+                            account_id=account_id,
+                            nickname=_(f"관리자 {idx}"),
+                            competition=competition,
+                        )
+                        for idx, account_id in enumerate(account_ids, start=1)
+                    ]
+                )
+                Competition.objects.touch(
+                    competition.pk, num_of_managers=len(managements)
+                )
+
         return competition
 
 
@@ -161,21 +352,24 @@ class AddManagerOnCompetitionSerializer(serializers.Serializer):
                 {"usernames": _("이미 초대된 관리자가 포함되어 있습니다.")}
             )
 
-        num_of_managers = instance.managers.count()
         account_ids = Profile.objects.filter(username__in=usernames).values_list(
             "account_id", flat=True
         )
 
-        Management.objects.bulk_create(
-            [
-                Management(
-                    account_id=account_id,
-                    nickname=_(f"관리자 {idx}"),
-                    competition=instance,
-                )
-                for idx, account_id in enumerate(account_ids, start=num_of_managers + 1)
-            ]
-        )
+        with transaction.atomic():
+            managements = Management.objects.bulk_create(
+                [
+                    Management(
+                        account_id=account_id,
+                        nickname=_(f"관리자 {idx}"),
+                        competition=instance,
+                    )
+                    for idx, account_id in enumerate(
+                        account_ids, start=instance.num_of_managers + 1
+                    )
+                ]
+            )
+            Competition.objects.touch(instance.pk, num_of_managers=len(managements))
         return instance
 
 
@@ -192,6 +386,13 @@ class SimpleCompetitionSerializer(serializers.ModelSerializer):
             "status",
             "is_team_game",
             "introduction",
+            "recruit_end_at",
+            "start_at",
+            "end_at",
+            "num_of_participants",
+            "num_of_applicants",
+            "num_of_managers",
+            "capacity",
         ]
         read_only_fields = ["is_team_game"]
 
@@ -207,9 +408,9 @@ class SimpleCompetitionSerializer(serializers.ModelSerializer):
 class CompetitionSerializer(SimpleCompetitionSerializer):
     creator = SimpleAccountSerializer(many=False)
     is_manager = serializers.SerializerMethodField()
-    num_of_participants = serializers.SerializerMethodField()
-    num_of_applicants = serializers.SerializerMethodField()
     participants = serializers.SerializerMethodField()
+    # 수정할 때 보내면, 본문이 그 판일 때만 바꾼다.
+    content_version = serializers.IntegerField(min_value=0, required=False)
 
     class Meta:
         model = Competition
@@ -220,37 +421,99 @@ class CompetitionSerializer(SimpleCompetitionSerializer):
             "creator",
             "status",
             "content",
+            "content_version",
             "is_team_game",
             "num_of_participants",
             "num_of_applicants",
+            "num_of_managers",
             "is_manager",
             "participants",
+            "recruit_end_at",
+            "start_at",
+            "end_at",
+            "capacity",
+            "waitlist_capacity",
         ]
         read_only_fields = ["creator", "is_team_game", "status"]
 
-    def get_is_manager(self, obj) -> bool:
-        if self.context["request"].user == obj.creator:
-            return True
-        if self.context["request"].user in obj.managers.all():
-            return True
-        return False
+    def validate(self, data):
+        return validate_schedule(data, self.instance)
 
-    def get_num_of_participants(self, obj: Competition) -> int:
-        return obj.participant_set.count()
+    def update(self, instance, validated_data):
+        # 다른 요청이 바꾼 본문을 읽어 둔 옛 값으로 덮어쓰지 않도록 받은 필드만 쓴다.
+        for field, value in validated_data.items():
+            setattr(instance, field, value)
+        with transaction.atomic():
+            instance.save(update_fields=[*validated_data, "updated_at"])
+            # 정원을 늘렸으면 늘어난 자리만큼 대기자를 올린다.
+            if "capacity" in validated_data:
+                Competition.objects.promote_waitlist(instance.pk)
+        return instance
 
-    def get_num_of_applicants(self, obj: Competition) -> int:
-        return obj.applicant_set.count()
+    def get_is_manager(self, obj) -> bool:
+        user = self.context["request"].user
+        if not user.is_authenticated:
+            return False
+        if user.id == obj.creator_id:
+            return True
+        return (
+            get_model(Management, obj)
+            .objects.filter(competition=obj, account_id=user.id)
+            .exists()
+        )
 
     @extend_schema_field(
         serializers.ListSerializer(child=SimpleParticipantSerializer())
     )
     def get_participants(self, obj: Competition):
-        participants = Participant.objects.filter(competition=obj)
+        participants = get_model(Participant, obj).objects.filter(competition=obj)
         return [SimpleParticipantSerializer(instance=p).data for p in participants]
 
 
+class ApplicableCompetitionField(serializers.PrimaryKeyRelatedField):
+    """
+    신청할 대회를 읽으면서 요청자가 이미 신청했거나 참가 중인지를 같은 쿼리의 EXISTS 로 함께 구한다.
+    EXISTS 는 (대회, 계정)/(대회, 접속 아이디) 부분 유니크 인덱스를 타므로 명단 크기와 무관하다.
+    """
+
+    def get_queryset(self):
+        user = self.context["request"].user
+        if user.is_authenticated:
+            player = Q(account_id=user.id)
+        else:
+            player = Q(
+                account__isnull=True,
+                access_id=self.parent.initial_data.get("access_id"),
+            )
+        return (
+            super()
+            .get_queryset()
+            .annotate(
+                is_applied=Exists(
+                    Applicant.objects.filter(player, competition=OuterRef("pk"))
+                ),
+                is_participating=Exists(
+                    Participant.objects.filter(player, competition=OuterRef("pk"))
+                ),
+            )
+        )
+
+
 class ApplicationSerializer(serializers.ModelSerializer):
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
+    # 신청 가능 여부만 보므로 무거운 JSON 열은 읽지 않는다.
+    competition = ApplicableCompetitionField(
+        queryset=Competition.objects.only(
+            "id",
+            "status",
+            "transition_at",
+            "creator_id",
+            "capacity",
+            "waitlist_capacity",
+            "num_of_participants",
+            "num_of_applicants",
+        )
+    )
 
     class Meta:
         model = Applicant
@@ -266,10 +529,17 @@ class ApplicationSerializer(serializers.ModelSerializer):
             "applied_at",
         ]
         extra_kwargs = {"access_password": {"write_only": True}}
+        # 중복 신청은 검증의 EXISTS 와 부분 유니크 인덱스로 막으므로 DRF 의 유니크 검사 쿼리는 끈다.
+        validators = []
 
     def validate(self, data):
         competition = data["competition"]
         user = data["user"]
+        if not competition.is_recruiting():
+            raise RecruitmentClosed()
+        # 마지막으로 읽은 인원 수로 이미 다 찼으면 해싱이나 잠금 없이 바로 거절한다.
+        if competition.is_full():
+            raise CompetitionFull()
         access_id = data.get("access_id")
         access_password = data.get("access_password")
         if isinstance(user, AnonymousUser):
@@ -289,48 +559,49 @@ class ApplicationSerializer(serializers.ModelSerializer):
                     {"access_password": _("접속 비밀번호를 입력해주세요.")}
                 )
 
-            if (
-                Applicant.objects.filter(
-                    competition=competition,
-                    account_id__isnull=True,
-                    access_id=access_id,
-                ).exists()
-                or Participant.objects.filter(
-                    competition=competition,
-                    account_id__isnull=True,
-                    access_id=access_id,
-                ).exists()
-            ):
+            if competition.is_applied or competition.is_participating:
                 raise serializers.ValidationError(
                     {"access_id": _("이미 존재하는 접속 아이디입니다.")}
                 )
         else:
             data.pop("access_id", None)
             data.pop("access_password", None)
-            if Competition.objects.filter(
-                id=competition.id, creator_id=user.id
-            ).exists():
+            if competition.creator_id == user.id:
                 raise InvalidRequest(_("대회 개최자는 참가 신청을 할 수 없습니다."))
-            authenticated_applicant_ids = Applicant.objects.filter(
-                competition=competition, account_id__isnull=False
-            ).values_list("account_id", flat=True)
-            if user.id in authenticated_applicant_ids:
+            if competition.is_applied:
                 raise AlreadyApplied()
-            authenticated_participant_ids = Participant.objects.filter(
-                competition=competition, account_id__isnull=False
-            ).values_list("account_id", flat=True)
-            if user.id in authenticated_participant_ids:
+            if competition.is_participating:
                 raise AlreadyBeParticipant()
         return data
 
     def create(self, validated_data):
         user = validated_data.pop("user")
+        competition = validated_data["competition"]
+        # 해싱은 대회 행을 잠그기 전에 끝낸다.
         if isinstance(user, AnonymousUser):
             applicant = Applicant(**validated_data)
             applicant.set_password(validated_data.get("access_password"))
         else:
             applicant = Applicant(**validated_data, account_id=user.id)
-        applicant.save()
+        # 자리 확인, INSERT, 신청자 수 카운터가 한 트랜잭션이므로 INSERT 가 실패하면 자리도 돌려진다.
+        # 검증 뒤에 같은 신청이 먼저 들어왔으면 유니크 인덱스가 막으므로 검증 실패와 같게 응답한다.
+        try:
+            with transaction.atomic():
+                if competition.capacity is not None:
+                    admission = Competition.objects.admit(competition.pk)
+                    if admission is None:
+                        raise CompetitionFull()
+                    applicant.ticket, applicant.is_waitlisted = admission
+                applicant.save()
+        except IntegrityError as e:
+            constraint = get_constraint_name(e)
+            if constraint == "unique_applicant_account":
+                raise AlreadyApplied()
+            if constraint == "unique_applicant_access_id":
+                raise serializers.ValidationError(
+                    {"access_id": _("이미 존재하는 접속 아이디입니다.")}
+                )
+            raise
         return applicant
 
 
@@ -352,12 +623,16 @@ class ApplicantSerializer(serializers.ModelSerializer):
             "hidden_name",
             "introduction",
             "applied_at",
+            "ticket",
+            "is_waitlisted",
         ]
         extra_kwargs = {
             "access_password": {"write_only": True},
             "access_id": {"write_only": True},
             "competition": {"write_only": True},
         }
+        # 기존 신청을 찾는 용도이므로 유니크 검사를 하지 않는다.
+        validators = []
         read_only_fields = [
             "id",
             "email",
@@ -365,6 +640,8 @@ class ApplicantSerializer(serializers.ModelSerializer):
             "hidden_name",
             "introduction",
             "applied_at",
+            "ticket",
+            "is_waitlisted",
         ]
 
     def validate(self, data):
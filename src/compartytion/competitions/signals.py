@@ -0,0 +1,102 @@
+from typing import Dict, Iterable, Optional
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Competition, Participant, Applicant, Rule, Management
+from .broadcast import publish_competition_event
+
+# 관전자에게 공개해도 되는 필드들만 이벤트에 담는다.
+PUBLIC_FIELDS: Dict[type, tuple] = {
+    Competition: ("title", "status", "introduction", "content", "is_team_game"),
+    Participant: ("displayed_name", "order", "team_id", "account_id"),
+    Applicant: (),
+    Rule: ("content", "order", "depth"),
+}
+
+
+def get_changed_fields(
+    instance, update_fields: Optional[Iterable[str]] = None
+) -> Dict[str, object]:
+    fields = PUBLIC_FIELDS[instance.__class__]
+    if update_fields is not None:
+        update_fields = set(update_fields)
+        fields = [
+            f
+            for f in fields
+            if f in update_fields or f.removesuffix("_id") in update_fields
+        ]
+    return {f: getattr(instance, f) for f in fields}
+
+
+# 하위 목록이 바뀌면 조건부 GET 에 쓰이는 대회의 갱신 시각을 함께 바꾼다.
+TOUCHED_FIELDS: Dict[type, str] = {
+    Participant: "participants_updated_at",
+    Applicant: "applicants_updated_at",
+    Management: "updated_at",
+}
+
+# 행이 하나씩 추가/삭제될 때 함께 고치는 대회의 행 수 카운터
+COUNTER_FIELDS: Dict[type, str] = {
+    Participant: "num_of_participants",
+    Applicant: "num_of_applicants",
+    Management: "num_of_managers",
+}
+
+
+def get_competition_id(instance):
+    if isinstance(instance, Competition):
+        return instance.pk
+    return instance.competition_id
+
+
+@receiver(post_save, sender=Competition)
+@receiver(post_save, sender=Participant)
+@receiver(post_save, sender=Applicant)
+@receiver(post_save, sender=Rule)
+def publish_saved(sender, instance, created, update_fields=None, **kwargs):
+    changed = get_changed_fields(instance, None if created else update_fields)
+    if not created and update_fields is not None and not changed:
+        return
+    publish_competition_event(
+        get_competition_id(instance),
+        f"{sender._meta.model_name}.{'created' if created else 'updated'}",
+        {"id": instance.pk, "fields": changed},
+    )
+
+
+@receiver(post_delete, sender=Competition)
+@receiver(post_delete, sender=Participant)
+@receiver(post_delete, sender=Applicant)
+@receiver(post_delete, sender=Rule)
+def publish_deleted(sender, instance, **kwargs):
+    publish_competition_event(
+        get_competition_id(instance),
+        f"{sender._meta.model_name}.deleted",
+        {"id": instance.pk},
+    )
+
+
+@receiver(post_save, sender=Participant)
+@receiver(post_save, sender=Applicant)
+@receiver(post_save, sender=Management)
+@receiver(post_delete, sender=Participant)
+@receiver(post_delete, sender=Applicant)
+@receiver(post_delete, sender=Management)
+def touch_competition(sender, instance, signal, created=False, **kwargs):
+    # post_delete 는 Collector 의 트랜잭션 안에서 불리지만, post_save 는 그렇지 않으므로
+    # 행을 만드는 쪽에서 transaction.atomic 으로 감싸야 카운터가 정확하다.
+    count = 1 if created else -1 if signal is post_delete else 0
+    Competition.objects.touch(
+        instance.competition_id,
+        TOUCHED_FIELDS[sender],
+        **{COUNTER_FIELDS[sender]: count},
+    )
+
+
+@receiver(post_delete, sender=Participant)
+@receiver(post_delete, sender=Applicant)
+def promote_waitlist(sender, instance, **kwargs):
+    # touch_competition 이 대회 행을 잠그고 카운터를 줄인 뒤라, 빈자리만큼 대기자를 올린다.
+    if not getattr(instance, "is_waitlisted", False):
+        Competition.objects.promote_waitlist(instance.competition_id)
@@ -0,0 +1,105 @@
+from typing import Callable, Dict, List
+
+from django.db import transaction
+from django.db.models import Max, Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from .exceptions import InvalidRequest
+from .models import Competition, Match, Participant, Standing, Team
+from ..users.models import Rating
+from .balancing import partition_balanced
+from .ordering import lock_competition
+
+
+def seed_weights(participants: List[Participant]) -> List[float]:
+    # 순서가 앞설수록(시드가 높을수록) 강한 참가자로 본다.
+    num_of_participants = len(participants)
+    return [float(num_of_participants - i) for i in range(num_of_participants)]
+
+
+def rating_weights(participants: List[Participant]) -> List[float]:
+    # 레이팅이 없는 참가자(계정 없음, 경기 기록 없음)는 기본 레이팅으로 본다.
+    default = Rating._meta.get_field("rating").default
+    ratings = dict(
+        Rating.objects.filter(
+            account_id__in=[p.account_id for p in participants if p.account_id]
+        ).values_list("account_id", "rating")
+    )
+    return [ratings.get(p.account_id, default) for p in participants]
+
+
+WEIGHT_FUNCTIONS: Dict[str, Callable[[List[Participant]], List[float]]] = {
+    "seed": seed_weights,
+    "rating": rating_weights,
+}
+
+
+def create_team(competition_id, **data) -> Team:
+    with transaction.atomic():
+        lock_competition(competition_id)
+        last_order = (
+            Team.objects.filter(competition_id=competition_id).aggregate(
+                last_order=Max("order")
+            )["last_order"]
+            or 0
+        )
+        return Team.objects.create(
+            competition_id=competition_id, order=last_order + 1, **data
+        )
+
+
+def delete_team(team: Team) -> None:
+    """경기나 순위표에 들어간 팀을 지우면 기록이 사라지므로 그런 팀은 지우지 않는다."""
+    with transaction.atomic():
+        # 대진표/일정을 만드는 작업과 겹치지 않도록 대회 행을 잠근다.
+        lock_competition(team.competition_id)
+        if (
+            Match.objects.filter(Q(home_team=team) | Q(away_team=team)).exists()
+            or Standing.objects.filter(team=team).exists()
+        ):
+            raise InvalidRequest(_("경기나 순위표에 들어간 팀은 삭제할 수 없습니다."))
+        team.delete()
+
+
+def assign_teams(competition_id, num_of_teams: int, attribute: str = "seed") -> int:
+    """
+    참가자들을 `attribute` 기준으로 균형 잡힌 `num_of_teams` 개 팀에 나눈다.
+    팀이 모자라면 새로 만들고, 결과는 bulk_update 로 한꺼번에 저장한다.
+    """
+    with transaction.atomic():
+        lock_competition(competition_id)
+        participants = list(
+            Participant.objects.filter(competition_id=competition_id)
+            .only("id", "order", "team_id", "account_id")
+            .order_by("order")
+        )
+        teams = list(
+            Team.objects.filter(competition_id=competition_id).order_by("order")
+        )
+        last_order = teams[-1].order if teams else 0
+        teams = teams[:num_of_teams]
+        if len(teams) < num_of_teams:
+            teams += Team.objects.bulk_create(
+                [
+                    Team(
+                        competition_id=competition_id,
+                        order=order,
+                        name=f"팀 {order}",
+                    )
+                    for order in range(
+                        last_order + 1, last_order + 1 + num_of_teams - len(teams)
+                    )
+                ]
+            )
+
+        weights = WEIGHT_FUNCTIONS[attribute](participants)
+        for participant, team in zip(
+            participants, partition_balanced(weights, num_of_teams)
+        ):
+            participant.team = teams[team]
+        Participant.objects.bulk_update(participants, ["team"], batch_size=1000)
+        Competition.objects.filter(pk=competition_id).update(
+            participants_updated_at=timezone.now()
+        )
+    return len(participants)
@@ -0,0 +1,256 @@
+from datetime import timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .archive import archive_competitions, get_archivable_ids
+from .permissions import IsManager, IsParticipant
+from .models import (
+    Applicant,
+    ArchivedApplicant,
+    ArchivedManagement,
+    ArchivedMatch,
+    ArchivedParticipant,
+    ArchivedRule,
+    ArchivedStanding,
+    Competition,
+    Management,
+    Match,
+    Participant,
+    Rule,
+    Standing,
+    Team,
+)
+from ..users.models import Account
+
+DONE = Competition.StatusChoices.DONE
+
+
+@override_settings(COMPETITION_ARCHIVE_AFTER_DAYS=30)
+class ArchiveTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = Account.objects.create_user(
+            email="creator@example.com", password="password", username="creator"
+        )
+        cls.manager = Account.objects.create_user(
+            email="manager@example.com", password="password", username="manager"
+        )
+
+    def setUp(self):
+        long_ago = timezone.now() - timedelta(days=31)
+        self.competition = self.create_competition(end_at=long_ago)
+        self.recent = self.create_competition(end_at=timezone.now())
+        self.ongoing = self.create_competition(
+            status=Competition.StatusChoices.PLAY, end_at=long_ago
+        )
+
+    def create_competition(self, status=DONE, **fields):
+        competition = Competition.objects.create(
+            creator=self.creator, title="competition", status=status, **fields
+        )
+        Management.objects.create(competition=competition, account=self.manager)
+        home, away = [
+            Participant.objects.create(
+                competition=competition,
+                order=i,
+                displayed_name=f"p{i}",
+                hidden_name=f"p{i}",
+            )
+            for i in range(2)
+        ]
+        Applicant.objects.create(
+            competition=competition, displayed_name="a", hidden_name="a"
+        )
+        Rule.objects.create(
+            competition=competition,
+            content="rule",
+            order=0,
+            depth=0,
+            added_at=timezone.now(),
+        )
+        Match.objects.create(
+            competition=competition,
+            round=1,
+            slot=0,
+            home=home,
+            away=away,
+            winner=Match.SideChoices.HOME,
+        )
+        Standing.objects.create(competition=competition, participant=home, points=3)
+        return competition
+
+    def get(self, path):
+        return self.client.get(
+            f"/api/competitions/{self.competition.pk}/{path}",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.creator)}"},
+        )
+
+    def test_archivable_ids(self):
+        self.assertEqual(get_archivable_ids(), [self.competition.pk])
+
+    def test_archive_moves_rows_with_ids(self):
+        participant_ids = list(
+            Participant.objects.filter(competition=self.competition).values_list(
+                "pk", flat=True
+            )
+        )
+        self.assertEqual(
+            archive_competitions([self.competition.pk]), [self.competition.pk]
+        )
+        for model, archive in [
+            (Participant, ArchivedParticipant),
+            (Applicant, ArchivedApplicant),
+            (Management, ArchivedManagement),
+            (Rule, ArchivedRule),
+            (Match, ArchivedMatch),
+            (Standing, ArchivedStanding),
+        ]:
+            self.assertFalse(
+                model.objects.filter(competition=self.competition).exists()
+            )
+            self.assertTrue(
+                archive.objects.filter(competition=self.competition).exists()
+            )
+            self.assertEqual(model.objects.count(), archive.objects.count() * 2)
+        self.assertEqual(
+            list(ArchivedParticipant.objects.values_list("pk", flat=True)),
+            participant_ids,
+        )
+        match = ArchivedMatch.objects.get()
+        self.assertEqual([match.home_id, match.away_id], participant_ids)
+        self.assertEqual(ArchivedStanding.objects.get().score_difference, 0)
+
+        self.competition.refresh_from_db()
+        self.assertIsNotNone(self.competition.archived_at)
+        self.assertEqual(get_archivable_ids(), [])
+        # 이미 보관했거나 완료되지 않은 대회는 다시 확인해서 건너뛴다.
+        self.assertEqual(
+            archive_competitions([self.competition.pk, self.ongoing.pk]), []
+        )
+
+    def test_reads_from_archive(self):
+        archive_competitions([self.competition.pk])
+        for path, count in [
+            ("participants/", 2),
+            ("applicants/", 1),
+            ("managers/", 1),
+            ("matches/", 1),
+            ("standings/", 1),
+        ]:
+            res = self.get(path)
+            self.assertEqual(res.status_code, status.HTTP_200_OK, path)
+            data = res.data["results"] if "results" in res.data else res.data
+            self.assertEqual(len(data), count, path)
+
+        res = self.client.get(f"/api/competitions/{self.competition.pk}/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [p["displayed_name"] for p in res.data["participants"]], ["p0", "p1"]
+        )
+
+    def test_team_members_from_archive(self):
+        Competition.objects.filter(pk=self.competition.pk).update(is_team_game=True)
+        team = Team.objects.create(competition=self.competition, order=1, name="A")
+        Participant.objects.filter(competition=self.competition).update(team=team)
+        archive_competitions([self.competition.pk])
+        res = self.get("teams/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        data = res.data["results"] if "results" in res.data else res.data
+        self.assertEqual(
+            [m["displayed_name"] for m in data[0]["members"]], ["p0", "p1"]
+        )
+
+    def test_archived_manager_can_read(self):
+        archive_competitions([self.competition.pk])
+        res = self.client.get(
+            f"/api/competitions/{self.competition.pk}/participants/",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.manager)}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_archived_roles(self):
+        player = Account.objects.create_user(
+            email="player@example.com", password="password", username="player"
+        )
+        Participant.objects.filter(competition=self.competition, order=0).update(
+            account=player
+        )
+        archive_competitions([self.competition.pk])
+        self.competition.refresh_from_db()
+
+        res = self.client.get(
+            f"/api/competitions/{self.competition.pk}/",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.manager)}"},
+        )
+        self.assertTrue(res.data["is_manager"])
+        for permission, account, expected in [
+            (IsManager, self.manager, True),
+            (IsManager, player, False),
+            (IsParticipant, player, True),
+            (IsParticipant, self.manager, False),
+        ]:
+            request = SimpleNamespace(user=account)
+            self.assertEqual(
+                permission().has_object_permission(request, None, self.competition),
+                expected,
+            )
+
+    def test_writes_do_not_reach_archive(self):
+        archive_competitions([self.competition.pk])
+        applicant = ArchivedApplicant.objects.get()
+        res = self.client.delete(
+            f"/api/competitions/{self.competition.pk}/applicants/{applicant.pk}/",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.creator)}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(ArchivedApplicant.objects.filter(pk=applicant.pk).exists())
+
+    def test_command(self):
+        out = StringIO()
+        call_command("archive_competitions", once=True, batch_size=1, stdout=out)
+        self.assertIn("1개 대회를 보관했습니다.", out.getvalue())
+        self.assertEqual(
+            list(
+                Competition.objects.filter(archived_at__isnull=False).values_list(
+                    "pk", flat=True
+                )
+            ),
+            [self.competition.pk],
+        )
+
+    def test_command_sleeps_when_candidates_are_locked(self):
+        # 후보가 한 배치를 채워도 모두 다른 작업자가 잡고 있으면 곧바로 다시 돌지 않는다.
+        command = "compartytion.competitions.management.commands.archive_competitions"
+        with patch(f"{command}.archive_competitions", return_value=[]), patch(
+            f"{command}.time.sleep", side_effect=InterruptedError
+        ) as sleep:
+            with self.assertRaises(InterruptedError):
+                call_command("archive_competitions", batch_size=1, stdout=StringIO())
+            sleep.assert_called_once()
+            call_command(
+                "archive_competitions", once=True, batch_size=1, stdout=StringIO()
+            )
+            sleep.assert_called_once()
+
+    def test_reconcile_skips_archived(self):
+        archive_competitions([self.competition.pk])
+        self.assertEqual(
+            Competition.objects.reconcile_counts([self.competition.pk]), []
+        )
+        self.competition.refresh_from_db()
+        self.assertEqual(
+            (
+                self.competition.num_of_participants,
+                self.competition.num_of_applicants,
+                self.competition.num_of_managers,
+            ),
+            (2, 1, 1),
+        )
@@ -0,0 +1,278 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError, connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import (
+    Applicant,
+    AuditEvent,
+    Competition,
+    Management,
+    Participant,
+    Rule,
+)
+from .pagination import ChangeFeedPagination
+from ..users.models import Account
+
+
+@override_settings(AUDIT_FEED_SETTLE_SECONDS=0)
+class AuditTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = Account.objects.create_user(
+            email="creator@example.com", password="password", username="creator"
+        )
+        cls.manager = Account.objects.create_user(
+            email="manager@example.com", password="password", username="manager"
+        )
+        cls.stranger = Account.objects.create_user(
+            email="stranger@example.com", password="password", username="stranger"
+        )
+
+    def setUp(self):
+        self.auth = {"Authorization": f"Bearer {AccessToken.for_user(self.creator)}"}
+        res = self.client.post(
+            "/api/competitions/",
+            {"title": "competition", "managers": ["manager"]},
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.competition = Competition.objects.get()
+        self.url = f"/api/competitions/{self.competition.pk}"
+
+    def changes(self, cursor=None, account=None):
+        res = self.client.get(
+            f"{self.url}/changes/",
+            {"cursor": cursor} if cursor else {},
+            headers={
+                "Authorization": f"Bearer {AccessToken.for_user(account or self.creator)}"
+            },
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.data
+
+    def events(self):
+        return list(AuditEvent.objects.order_by("id").values_list("event", flat=True))
+
+    def test_changes_since_cursor(self):
+        feed = self.changes()
+        self.assertEqual([e["event"] for e in feed["results"]], ["competition.created"])
+        self.assertEqual(feed["results"][0]["actor"]["id"], self.creator.pk)
+        self.assertIsNone(feed["next"])
+
+        res = self.client.patch(
+            f"{self.url}/", {"title": "renamed"}, format="json", headers=self.auth
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        feed = self.changes(feed["cursor"])
+        self.assertEqual([e["event"] for e in feed["results"]], ["competition.updated"])
+        self.assertEqual(feed["results"][0]["data"], {"fields": ["title"]})
+
+        # 새 변경이 없으면 같은 커서를 돌려준다.
+        self.assertEqual(self.changes(feed["cursor"])["cursor"], feed["cursor"])
+
+        res = self.client.get(
+            f"{self.url}/changes/",
+            {"cursor": ChangeFeedPagination().encode_cursor(["x"])},
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(AUDIT_FEED_SETTLE_SECONDS=60)
+    def test_recent_changes_are_held_back(self):
+        # 방금 쓴 기록보다 번호가 앞선 기록이 아직 커밋되지 않았을 수 있으므로 내주지 않는다.
+        feed = self.changes()
+        self.assertEqual(feed["results"], [])
+        self.assertIsNone(feed["cursor"])
+        later = timezone.now() + timedelta(minutes=2)
+        with mock.patch(
+            "compartytion.competitions.pagination.timezone.now", return_value=later
+        ):
+            feed = self.changes()
+        self.assertEqual([e["event"] for e in feed["results"]], ["competition.created"])
+
+    def test_managers_can_read_changes(self):
+        self.assertEqual(len(self.changes(account=self.manager)["results"]), 1)
+        res = self.client.get(
+            f"{self.url}/changes/",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.stranger)}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_management_changes(self):
+        management = Management.objects.get(account=self.manager)
+        res = self.client.patch(
+            f"{self.url}/managers/{management.pk}/",
+            {"handle_rules": True},
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        res = self.client.delete(
+            f"{self.url}/managers/{management.pk}/", headers=self.auth
+        )
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        updated, deleted = AuditEvent.objects.order_by("id")[1:]
+        self.assertEqual(updated.event, "management.updated")
+        self.assertEqual(updated.target_id, str(management.pk))
+        self.assertEqual(updated.data, {"fields": {"handle_rules": True}})
+        self.assertEqual(deleted.event, "management.deleted")
+        self.assertEqual(deleted.data, {"account_id": self.manager.pk})
+
+    def test_accept(self):
+        applicant = Applicant.objects.create(
+            competition=self.competition, displayed_name="a", hidden_name="a"
+        )
+        res = self.client.post(
+            f"{self.url}/applicants/accept/",
+            [applicant.pk],
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        event = AuditEvent.objects.get(event="applicant.accepted")
+        self.assertEqual(event.data["applicant_ids"], [applicant.pk])
+        self.assertEqual(len(event.data["participant_ids"]), 1)
+
+    def test_roster_changes(self):
+        applicant = Applicant.objects.create(
+            competition=self.competition, displayed_name="a", hidden_name="a"
+        )
+        res = self.client.delete(
+            f"{self.url}/applicants/{applicant.pk}/", headers=self.auth
+        )
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        event = AuditEvent.objects.get(event="applicant.deleted")
+        self.assertEqual(event.target_id, str(applicant.pk))
+        self.assertEqual(event.actor_id, self.creator.pk)
+
+        participants = [
+            Participant.objects.create(
+                competition=self.competition,
+                order=order,
+                displayed_name=f"p{order}",
+                hidden_name=f"p{order}",
+            )
+            for order in (1, 3)
+        ]
+        res = self.client.post(
+            f"{self.url}/participants/compact/", format="json", headers=self.auth
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        res = self.client.post(
+            f"{self.url}/participants/reorder/",
+            {"order": [participants[1].pk, participants[0].pk]},
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        res = self.client.post(
+            f"{self.url}/participants/import/",
+            {
+                "file": SimpleUploadedFile(
+                    "participants.csv",
+                    b"access_id,access_password,displayed_name,hidden_name\n"
+                    b"id1,password,d,h\n",
+                )
+            },
+            format="multipart",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        events = AuditEvent.objects.filter(event__startswith="participant.")
+        self.assertEqual(
+            list(events.order_by("id").values_list("event", "data")),
+            [
+                ("participant.compacted", {"count": 1}),
+                ("participant.reordered", {"count": 2}),
+                ("participant.imported", {"count": 1}),
+            ],
+        )
+
+    def test_rules_are_versioned_and_batched(self):
+        rules = [{"order": 0, "content": "first"}, {"order": 1, "content": "second"}]
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(
+                f"{self.url}/rules/", rules, format="json", headers=self.auth
+            )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        inserts = [
+            q["sql"]
+            for q in queries.captured_queries
+            if q["sql"].startswith('INSERT INTO "competitions_auditevent"')
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(self.events()[1:], ["rule.created", "rule.created"])
+
+        res = self.client.post(
+            f"{self.url}/rules/",
+            [{"order": 1, "content": "changed"}],
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.data[0]["depth"], 1)
+        res = self.client.get(f"{self.url}/rules/")
+        self.assertEqual(
+            [(r["order"], r["depth"], r["content"]) for r in res.data],
+            [(0, 0, "first"), (1, 1, "changed")],
+        )
+        self.assertEqual(Rule.objects.count(), 3)
+
+    def test_rules_require_permission(self):
+        res = self.client.post(
+            f"{self.url}/rules/",
+            [{"order": 0, "content": "rule"}],
+            format="json",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.manager)}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        Management.objects.filter(account=self.manager).update(handle_rules=True)
+        res = self.client.post(
+            f"{self.url}/rules/",
+            [{"order": 0, "content": "rule"}],
+            format="json",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.manager)}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            AuditEvent.objects.get(event="rule.created").actor_id, self.manager.pk
+        )
+
+    def test_failed_request_is_not_recorded(self):
+        res = self.client.post(
+            f"{self.url}/rules/",
+            [{"order": 0, "content": "a"}, {"order": 0, "content": "b"}],
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.events(), ["competition.created"])
+
+    def test_change_rolls_back_without_audit(self):
+        self.client.raise_request_exception = False
+        with mock.patch.object(
+            AuditEvent.objects, "bulk_create", side_effect=DatabaseError
+        ):
+            res = self.client.patch(
+                f"{self.url}/", {"title": "renamed"}, format="json", headers=self.auth
+            )
+        self.assertEqual(res.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.title, "competition")
+        self.assertEqual(self.events(), ["competition.created"])
+
+    def test_append_only(self):
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            AuditEvent.objects.update(event="forged")
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            AuditEvent.objects.all()._raw_delete(connection.alias)
+        self.assertEqual(self.events(), ["competition.created"])
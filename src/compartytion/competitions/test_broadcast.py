@@ -0,0 +1,121 @@
+import asyncio
+import json
+import threading
+from uuid import uuid4
+
+from django.test import TestCase, SimpleTestCase
+
+from .broadcast import LocalBroker, format_event, get_broker, competition_channel
+from .models import Competition, Participant
+from ..users.models import Account
+
+
+class LocalBrokerTestCase(SimpleTestCase):
+    def test_fan_out_from_other_thread(self):
+        async def scenario():
+            broker = LocalBroker(queue_size=10)
+            subscriptions = [broker.subscribe("channel") for _ in range(3)]
+            other = broker.subscribe("other")
+            thread = threading.Thread(target=broker.publish, args=("channel", "hi"))
+            thread.start()
+            thread.join()
+            received = [await s.get(timeout=1) for s in subscriptions]
+            self.assertEqual(received, ["hi", "hi", "hi"])
+            self.assertIsNone(await other.get(timeout=0.01))
+
+            for s in subscriptions:
+                s.close()
+            self.assertEqual(broker.num_of_subscriptions("channel"), 0)
+            self.assertEqual(broker.num_of_subscriptions("other"), 1)
+
+        asyncio.run(scenario())
+
+    def test_slow_subscriber_keeps_latest_messages(self):
+        async def scenario():
+            broker = LocalBroker(queue_size=2)
+            subscription = broker.subscribe("channel")
+            for i in range(5):
+                broker.publish("channel", str(i))
+            await asyncio.sleep(0)
+            self.assertEqual(await subscription.get(timeout=1), "3")
+            self.assertEqual(await subscription.get(timeout=1), "4")
+
+        asyncio.run(scenario())
+
+    def test_format_event(self):
+        message = format_event("competition.updated", {"id": 1, "fields": {}})
+        event, data, *_ = message.split("\n")
+        self.assertEqual(event, "event: competition.updated")
+        self.assertEqual(json.loads(data.removeprefix("data: "))["id"], 1)
+        self.assertTrue(message.endswith("\n\n"))
+
+
+class CompetitionEventSignalTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.competition = Competition.objects.create(
+            creator=creator, title="Test Competition"
+        )
+
+    def setUp(self):
+        self.published = []
+        broker = get_broker()
+        original = broker.publish
+        broker.publish = lambda channel, message: self.published.append(
+            (channel, message)
+        )
+        self.addCleanup(setattr, broker, "publish", original)
+
+    def test_publish_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.competition.status = Competition.StatusChoices.READY
+            self.competition.save(update_fields=["status"])
+        self.assertEqual(len(self.published), 1)
+        channel, message = self.published[0]
+        self.assertEqual(channel, competition_channel(self.competition.pk))
+        self.assertIn("event: competition.updated", message)
+        self.assertIn('"fields": {"status": 1}', message)
+
+    def test_private_fields_are_not_published(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Participant.objects.create(
+                competition=self.competition,
+                order=1,
+                displayed_name="public",
+                hidden_name="secret",
+                access_id="access",
+            )
+        (_, message) = self.published[0]
+        self.assertIn("event: participant.created", message)
+        self.assertIn("public", message)
+        self.assertNotIn("secret", message)
+        self.assertNotIn("access", message)
+
+    def test_rollback_does_not_publish(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.competition.save()
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.published, [])
+
+
+class CompetitionEventViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.competition = Competition.objects.create(title="Test Competition")
+
+    async def test_stream_headers(self):
+        res = await self.async_client.get(
+            f"/api/competitions/{self.competition.pk}/events/"
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res["Content-Type"], "text/event-stream")
+        stream = aiter(res.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b"retry:"))
+        await stream.aclose()
+
+    async def test_unknown_competition(self):
+        res = await self.async_client.get(f"/api/competitions/{uuid4()}/events/")
+        self.assertEqual(res.status_code, 404)
@@ -0,0 +1,130 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Applicant, Competition, Management, Participant
+from ..users.models import Account
+
+
+class CompetitionCounterTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = Account.objects.create_user(
+            email="creator@example.com", password="password", username="creator"
+        )
+        cls.user = Account.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        for i in range(3):
+            Account.objects.create_user(
+                email=f"manager{i}@example.com",
+                password="password",
+                username=f"manager{i}",
+            )
+
+    def setUp(self):
+        self.auth = {"Authorization": f"Bearer {AccessToken.for_user(self.creator)}"}
+        res = self.client.post(
+            "/api/competitions/",
+            {"title": "competition", "managers": ["manager0", "manager1"]},
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.competition = Competition.objects.get()
+
+    def assertCounts(self, participants, applicants, managers):
+        self.assertEqual(
+            Competition.objects.values_list(
+                "num_of_participants", "num_of_applicants", "num_of_managers"
+            ).get(pk=self.competition.pk),
+            (participants, applicants, managers),
+        )
+        self.assertEqual(
+            Competition.objects.reconcile_counts([self.competition.pk]), []
+        )
+
+    def register(self, user):
+        return self.client.post(
+            "/api/applications/register/",
+            {
+                "competition": self.competition.pk,
+                "displayed_name": "d_name",
+                "hidden_name": "h_name",
+            },
+            headers={"Authorization": f"Bearer {AccessToken.for_user(user)}"},
+        )
+
+    def test_managers(self):
+        self.assertCounts(0, 0, 3)
+        res = self.client.post(
+            f"/api/competitions/{self.competition.pk}/invite_managers/",
+            {"usernames": ["manager2"]},
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            Management.objects.get(account__email__startswith="manager2").nickname,
+            "관리자 4",
+        )
+        self.assertCounts(0, 0, 4)
+        Management.objects.filter(account__email__startswith="manager0").get().delete()
+        self.assertCounts(0, 0, 3)
+
+    def test_applicants_and_participants(self):
+        self.assertEqual(self.register(self.user).status_code, status.HTTP_200_OK)
+        self.assertCounts(0, 1, 3)
+
+        applicant = Applicant.objects.get()
+        res = self.client.post(
+            f"/api/competitions/{self.competition.pk}/applicants/accept/",
+            [applicant.pk],
+            format="json",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertCounts(1, 0, 3)
+
+        self.register(Account.objects.get(email="manager2@example.com"))
+        res = self.client.delete(
+            f"/api/competitions/{self.competition.pk}/applicants/"
+            f"{Applicant.objects.get().pk}/",
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertCounts(1, 0, 3)
+
+        Participant.objects.get().delete()
+        self.assertCounts(0, 0, 3)
+
+    def test_reconcile(self):
+        Competition.objects.filter(pk=self.competition.pk).update(
+            num_of_participants=7, num_of_managers=0
+        )
+        with self.assertRaises(CommandError):
+            call_command("reconcile_counts", "--all", "--check", stdout=StringIO())
+        out = StringIO()
+        call_command("reconcile_counts", str(self.competition.pk), stdout=out)
+        self.assertIn(str(self.competition.pk), out.getvalue())
+        self.assertCounts(0, 0, 3)
+
+    def test_list_without_count_queries(self):
+        for i in range(5):
+            self.client.post(
+                "/api/competitions/",
+                {"title": f"competition {i}", "managers": []},
+                format="json",
+                headers=self.auth,
+            )
+        # 인증과 목록 조회 두 번뿐, 대회 수에 따라 늘지 않는다.
+        with self.assertNumQueries(2):
+            res = self.client.get("/api/competitions/me/", headers=self.auth)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        counts = {row["title"]: row["num_of_managers"] for row in res.data}
+        self.assertEqual(counts["competition"], 3)
+        self.assertEqual(counts["competition 0"], 1)
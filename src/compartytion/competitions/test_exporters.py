@@ -0,0 +1,108 @@
+import csv
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from . import exporters
+from .models import Competition, Participant, Applicant
+from ..users.models import Account
+
+
+class RosterExportTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        player = Account.objects.create_user(
+            email="user2@example", password="password", username="user2"
+        )
+        cls.competition = Competition.objects.create(
+            creator=creator, title="Test Competition"
+        )
+        cls.token = AccessToken.for_user(creator)
+        Participant.objects.create(
+            competition=cls.competition,
+            account=player,
+            order=2,
+            displayed_name="두번째",
+            hidden_name="hidden2",
+        )
+        Participant.objects.create(
+            competition=cls.competition,
+            order=1,
+            displayed_name="첫번째",
+            hidden_name="hidden1",
+            access_id="access1",
+            access_password="secret",
+        )
+        Applicant.objects.create(
+            competition=cls.competition,
+            displayed_name="applicant",
+            hidden_name="applicant",
+        )
+        cls.url = f"/api/competitions/{cls.competition.id}"
+
+    def get(self, url):
+        return self.client.get(url, headers={"Authorization": f"Bearer {self.token}"})
+
+    def test_export_participants_csv(self):
+        res = self.get(f"{self.url}/participants/export_csv/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertIn("participants.csv", res["Content-Disposition"])
+
+        content = b"".join(res.streaming_content).decode("utf-8-sig")
+        rows = list(csv.DictReader(StringIO(content)))
+        self.assertEqual([row["displayed_name"] for row in rows], ["첫번째", "두번째"])
+        self.assertEqual(rows[1]["username"], "user2")
+        for column in ["access_id", "access_password", "email"]:
+            self.assertNotIn(column, rows[0])
+        self.assertNotIn("secret", content)
+        self.assertNotIn("access1", content)
+
+    def test_export_applicants_ndjson(self):
+        res = self.get(f"{self.url}/applicants/export_ndjson/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        lines = b"".join(res.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 1)
+        row = json.loads(lines[0])
+        self.assertEqual(row["displayed_name"], "applicant")
+        self.assertNotIn("email", row)
+        self.assertNotIn("access_id", row)
+
+    @override_settings(EXPORT_CHUNK_SIZE=1)
+    async def test_export_streams_under_asgi(self):
+        encoded = []
+
+        class CountingEncoder(DjangoJSONEncoder):
+            def encode(self, o):
+                encoded.append(o)
+                return super().encode(o)
+
+        with patch.object(exporters, "DjangoJSONEncoder", CountingEncoder):
+            res = await self.async_client.get(
+                f"{self.url}/participants/export_ndjson/",
+                headers={"Authorization": f"Bearer {self.token}"},
+            )
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertTrue(res.is_async)
+
+            # 청크를 하나씩 읽으므로 첫 행을 받을 때는 아직 두 번째 행을 읽지 않았다.
+            stream = aiter(res.streaming_content)
+            first = await anext(stream)
+            self.assertEqual(len(encoded), 1)
+            rest = [chunk async for chunk in stream]
+        self.assertEqual(json.loads(first)["displayed_name"], "첫번째")
+        self.assertEqual(json.loads(b"".join(rest))["displayed_name"], "두번째")
+
+    def test_export_requires_management(self):
+        res = self.client.get(f"{self.url}/participants/export_csv/")
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,164 @@
+import threading
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Applicant, Competition, IdempotencyKey
+from ..users.models import Account
+
+
+class IdempotencyKeyTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create_user(
+            email="user1@example.com", password="password", username="user1"
+        )
+        cls.other_account = Account.objects.create_user(
+            email="user2@example.com", password="password", username="user2"
+        )
+
+    def create(self, key, account=None, title="competition"):
+        token = AccessToken.for_user(account or self.account)
+        return self.client.post(
+            "/api/competitions/",
+            {"title": title, "managers": []},
+            format="json",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Idempotency-Key": key,
+            },
+        )
+
+    def test_replay_returns_original_response(self):
+        first = self.create("key-1")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        second = self.create("key-1")
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.headers["Idempotent-Replayed"], "true")
+        self.assertEqual(Competition.objects.count(), 1)
+
+        self.assertEqual(self.create("key-2").status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Competition.objects.count(), 2)
+
+    def test_without_key(self):
+        self.client.post(
+            "/api/competitions/",
+            {"title": "competition", "managers": []},
+            format="json",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(self.account)}"},
+        )
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_keys_are_scoped_by_account(self):
+        self.create("key")
+        res = self.create("key", account=self.other_account)
+        self.assertNotIn("Idempotent-Replayed", res.headers)
+        self.assertEqual(Competition.objects.count(), 2)
+
+    def test_reused_key_with_different_body(self):
+        self.create("key")
+        res = self.create("key", title="other")
+        self.assertEqual(res.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Competition.objects.count(), 1)
+
+    def test_error_response_is_replayed(self):
+        first = self.create("key", title="")
+        self.assertEqual(first.status_code, status.HTTP_400_BAD_REQUEST)
+        second = self.create("key", title="")
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.headers["Idempotent-Replayed"], "true")
+
+    def test_expired_key_is_reused(self):
+        self.create("key")
+        IdempotencyKey.objects.update(expires_at=timezone.now())
+        res = self.create("key")
+        self.assertNotIn("Idempotent-Replayed", res.headers)
+        self.assertEqual(Competition.objects.count(), 2)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+
+    def test_invalid_key(self):
+        res = self.create("k" * 256)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Competition.objects.exists())
+
+    def test_replayed_registration_skips_password_hashing(self):
+        competition = Competition.objects.create(title="competition")
+        data = {
+            "competition": competition.pk,
+            "access_id": "access",
+            "access_password": "password",
+            "displayed_name": "d_name",
+            "hidden_name": "h_name",
+        }
+        headers = {"Idempotency-Key": "key"}
+        res = self.client.post("/api/applications/register/", data, headers=headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        with mock.patch("compartytion.competitions.models.make_password") as hasher:
+            res = self.client.post("/api/applications/register/", data, headers=headers)
+        hasher.assert_not_called()
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.headers["Idempotent-Replayed"], "true")
+        self.assertEqual(Applicant.objects.count(), 1)
+
+    def test_purge(self):
+        self.create("key-1")
+        self.create("key-2")
+        IdempotencyKey.objects.filter(key="key-1").update(expires_at=timezone.now())
+        call_command("purge_idempotency_keys", batch_size=1, stdout=StringIO())
+        self.assertEqual(
+            list(IdempotencyKey.objects.values_list("key", flat=True)), ["key-2"]
+        )
+
+
+class ConcurrentIdempotencyKeyTestCase(TransactionTestCase):
+    NUM_OF_THREADS = 8
+
+    def test_concurrent_retries_create_once(self):
+        account = Account.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        token = AccessToken.for_user(account)
+        barrier = threading.Barrier(self.NUM_OF_THREADS)
+        responses = []
+
+        def create():
+            try:
+                barrier.wait()
+                responses.append(
+                    APIClient().post(
+                        "/api/competitions/",
+                        {"title": "competition", "managers": []},
+                        format="json",
+                        headers={
+                            "Authorization": f"Bearer {token}",
+                            "Idempotency-Key": "key",
+                        },
+                    )
+                )
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=create) for _ in range(self.NUM_OF_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            [res.status_code for res in responses],
+            [status.HTTP_201_CREATED] * self.NUM_OF_THREADS,
+        )
+        self.assertEqual(
+            sum("Idempotent-Replayed" in res.headers for res in responses),
+            self.NUM_OF_THREADS - 1,
+        )
+        self.assertEqual(Competition.objects.count(), 1)
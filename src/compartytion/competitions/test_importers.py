@@ -0,0 +1,143 @@
+from io import BytesIO
+from unittest.mock import patch
+
+from django.contrib.auth.hashers import make_password
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from openpyxl import Workbook
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .importers import ParticipantImporter
+from .models import Competition, Participant
+from ..users.models import Account
+
+CSV_HEADER = "access_id,access_password,email,displayed_name,hidden_name\n"
+NAMES = {"displayed_name": "d", "hidden_name": "h"}
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    PARTICIPANT_IMPORT_CHUNK_SIZE=2,
+)
+class ParticipantImportTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.competition = Competition.objects.create(
+            creator=creator, title="Test Competition", last_participant_order=1
+        )
+        cls.token = AccessToken.for_user(creator)
+        Participant.objects.create(
+            competition=cls.competition,
+            order=1,
+            displayed_name="participant1",
+            hidden_name="participant1",
+            access_id="existing",
+        )
+        cls.url = f"/api/competitions/{cls.competition.id}/participants/import/"
+
+    def upload(self, name: str, content: bytes):
+        return self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile(name, content)},
+            format="multipart",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+
+    def test_import_csv(self):
+        rows = "".join(
+            f"id{i},password{i},user{i}@example.com,d{i},h{i}\n" for i in range(5)
+        )
+        res = self.upload("participants.csv", (CSV_HEADER + rows).encode())
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        participants = Participant.objects.filter(competition=self.competition)
+        self.assertEqual(
+            list(participants.values_list("order", flat=True)), [1, 2, 3, 4, 5, 6]
+        )
+        imported = participants.get(access_id="id3")
+        self.assertEqual(imported.order, 5)
+        self.assertTrue(imported.check_password("password3"))
+
+    def test_import_xlsx(self):
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["access_id", "access_password", "displayed_name", "hidden_name"])
+        sheet.append(["xlsx1", "password", "d", "h"])
+        output = BytesIO()
+        workbook.save(output)
+
+        res = self.upload("participants.xlsx", output.getvalue())
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Participant.objects.get(access_id="xlsx1").order, 2)
+
+    def test_invalid_rows_are_rolled_back(self):
+        rows = (
+            "new1,password,,d,h\n"
+            "new2,password,,d,h\n"
+            "existing,password,,d,h\n"
+            "new1,password,,d,h\n"
+            "new3,,,d,h\n"
+        )
+        res = self.upload("participants.csv", (CSV_HEADER + rows).encode())
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([e["row"] for e in res.data["rows"]], ["4", "5", "6"])
+        self.assertEqual(
+            Participant.objects.filter(competition=self.competition).count(), 1
+        )
+
+    def test_hashes_before_locking_competition(self):
+        rows = [
+            {"access_id": f"id{i}", "access_password": "password", **NAMES}
+            for i in range(5)
+        ]
+        # 해싱은 다른 스레드에서 하므로, 이 스레드의 쿼리를 공유 목록에 기록해 비교한다.
+        executed, hashed_at = [], []
+
+        def log(execute, sql, params, many, context):
+            executed.append(sql)
+            return execute(sql, params, many, context)
+
+        def hash_password(password):
+            hashed_at.append(len(executed))
+            return make_password(password)
+
+        with connection.execute_wrapper(log), patch(
+            "compartytion.competitions.importers.make_password", hash_password
+        ):
+            ParticipantImporter(self.competition.id).run(rows)
+
+        locked_at = next(i for i, sql in enumerate(executed) if "FOR UPDATE" in sql)
+        self.assertEqual(len(hashed_at), 5)
+        self.assertLessEqual(max(hashed_at), locked_at)
+        orders = Participant.objects.filter(competition=self.competition).values_list(
+            "order", flat=True
+        )
+        self.assertEqual(sorted(orders), list(range(1, 7)))
+
+    def test_access_id_taken_after_validation(self):
+        importer = ParticipantImporter(self.competition.id)
+        build_participants = importer.build_participants
+
+        def build_and_race(rows, executor):
+            Participant.objects.create(
+                competition=self.competition, order=2, access_id="new1", **NAMES
+            )
+            return build_participants(rows, executor)
+
+        importer.build_participants = build_and_race
+        with self.assertRaises(ValidationError) as raised:
+            importer.run([{"access_id": "new1", "access_password": "pw", **NAMES}])
+        self.assertIn("access_id", raised.exception.detail)
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.last_participant_order, 1)
+
+    def test_unsupported_file(self):
+        res = self.upload("participants.txt", b"hello")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
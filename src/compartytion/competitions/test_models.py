@@ -0,0 +1,117 @@
+import threading
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from .models import Competition, Participant, Applicant, participant_logins
+
+
+def create_applicants(competition, count, start=0):
+    # bulk_create 는 시그널을 보내지 않으므로 카운터를 직접 맞춘다.
+    Competition.objects.touch(competition.pk, num_of_applicants=count)
+    return Applicant.objects.bulk_create(
+        [
+            Applicant(
+                competition=competition,
+                displayed_name=f"applicant{i}",
+                hidden_name=f"applicant{i}",
+            )
+            for i in range(start, start + count)
+        ]
+    )
+
+
+class AcceptApplicantsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.competition = Competition.objects.create(title="Test Competition")
+        cls.applicants = create_applicants(cls.competition, 5)
+        cls.other_competition = Competition.objects.create(title="Other")
+        cls.other_applicants = create_applicants(cls.other_competition, 1)
+
+    def test_accept_moves_rows_in_applied_order(self):
+        ids = [a.id for a in self.applicants[:3]]
+        participant_ids = Participant.objects.accept_applicants(
+            self.competition.id, ids
+        )
+        self.assertEqual(len(participant_ids), 3)
+        participants = Participant.objects.filter(competition=self.competition)
+        self.assertEqual(
+            list(participants.values_list("order", "displayed_name")),
+            [(1, "applicant0"), (2, "applicant1"), (3, "applicant2")],
+        )
+        self.assertFalse(Applicant.objects.filter(id__in=ids).exists())
+
+        Participant.objects.accept_applicants(
+            self.competition.id, [self.applicants[4].id]
+        )
+        self.assertEqual(participants.get(displayed_name="applicant4").order, 4)
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.last_participant_order, 4)
+
+    def test_accept_ignores_other_competitions(self):
+        participant_ids = Participant.objects.accept_applicants(
+            self.competition.id, [self.other_applicants[0].id]
+        )
+        self.assertEqual(participant_ids, [])
+        self.assertTrue(Applicant.objects.filter(id=self.other_applicants[0].id))
+
+
+class ConcurrentAcceptApplicantsTestCase(TransactionTestCase):
+    NUM_OF_THREADS = 8
+    NUM_OF_APPLICANTS = 400
+
+    def test_concurrent_accepts_keep_orders_unique_and_contiguous(self):
+        competition = Competition.objects.create(title="Test Competition")
+        ids = [a.id for a in create_applicants(competition, self.NUM_OF_APPLICANTS)]
+        barrier = threading.Barrier(self.NUM_OF_THREADS)
+        errors = []
+
+        def accept(thread_index):
+            # 스레드들이 서로 겹치는 신청자 묶음을 동시에 승인한다.
+            chunk = ids[thread_index::4] + ids[thread_index :: self.NUM_OF_THREADS]
+            try:
+                barrier.wait()
+                Participant.objects.accept_applicants(competition.id, chunk)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=accept, args=(i,))
+            for i in range(self.NUM_OF_THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        orders = list(
+            Participant.objects.filter(competition=competition).values_list(
+                "order", flat=True
+            )
+        )
+        self.assertEqual(orders, list(range(1, self.NUM_OF_APPLICANTS + 1)))
+        self.assertFalse(Applicant.objects.filter(competition=competition).exists())
+        competition.refresh_from_db()
+        self.assertEqual(competition.last_participant_order, self.NUM_OF_APPLICANTS)
+
+
+@override_settings(LAST_LOGIN_FLUSH_INTERVAL_SECONDS=3600)
+class ParticipantLastLoginTestCase(TestCase):
+    def test_update_last_login_does_not_overwrite_other_columns(self):
+        competition = Competition.objects.create(title="Test Competition")
+        participant = Participant.objects.create(
+            competition=competition, order=1, displayed_name="old", hidden_name="p"
+        )
+        # 관리자가 그 사이에 바꾼 이름을 오래된 인스턴스가 덮어쓰지 않는다.
+        Participant.objects.filter(pk=participant.pk).update(displayed_name="new")
+        with self.assertNumQueries(0):
+            participant.update_last_login()
+        participant_logins.flush()
+        self.assertEqual(
+            Participant.objects.values_list("displayed_name", "last_login_at").get(),
+            ("new", participant.last_login_at),
+        )
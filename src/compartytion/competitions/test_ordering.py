@@ -0,0 +1,85 @@
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Competition, Participant
+from .ordering import apply_moves
+from ..users.models import Account
+
+
+class ApplyMovesTestCase(APITestCase):
+    def test_moves_are_applied_in_sequence(self):
+        self.assertEqual(
+            apply_moves([1, 2, 3, 4], [{"id": 4, "order": 1}, {"id": 1, "order": 4}]),
+            [4, 2, 3, 1],
+        )
+
+
+class ParticipantReorderTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.competition = Competition.objects.create(
+            creator=creator,
+            title="Test Competition",
+            last_participant_order=5,
+            num_of_participants=5,
+        )
+        cls.token = AccessToken.for_user(creator)
+        cls.participants = Participant.objects.bulk_create(
+            [
+                Participant(
+                    competition=cls.competition,
+                    order=i,
+                    displayed_name=f"p{i}",
+                    hidden_name=f"p{i}",
+                )
+                for i in range(1, 6)
+            ]
+        )
+        cls.url = f"/api/competitions/{cls.competition.id}/participants"
+
+    def post(self, url, data=None):
+        return self.client.post(
+            url, data, headers={"Authorization": f"Bearer {self.token}"}
+        )
+
+    def names(self):
+        return list(
+            Participant.objects.filter(competition=self.competition).values_list(
+                "displayed_name", flat=True
+            )
+        )
+
+    def test_reorder_with_full_ordering(self):
+        ids = [p.id for p in reversed(self.participants)]
+        res = self.post(f"{self.url}/reorder/", {"order": ids})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.names(), ["p5", "p4", "p3", "p2", "p1"])
+
+    def test_reorder_with_moves(self):
+        moves = [{"id": self.participants[4].id, "order": 1}]
+        res = self.post(f"{self.url}/reorder/", {"moves": moves})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.names(), ["p5", "p1", "p2", "p3", "p4"])
+
+    def test_reorder_requires_every_participant(self):
+        ids = [p.id for p in self.participants[:4]]
+        res = self.post(f"{self.url}/reorder/", {"order": ids})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.names(), ["p1", "p2", "p3", "p4", "p5"])
+
+    def test_compact_closes_gaps(self):
+        Participant.objects.filter(
+            id__in=[self.participants[0].id, self.participants[2].id]
+        ).delete()
+        res = self.post(f"{self.url}/compact/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        orders = Participant.objects.filter(competition=self.competition).values_list(
+            "order", "displayed_name"
+        )
+        self.assertEqual(list(orders), [(1, "p2"), (2, "p4"), (3, "p5")])
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.last_participant_order, 3)
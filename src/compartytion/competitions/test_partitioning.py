@@ -0,0 +1,64 @@
+import re
+
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+
+from .models import Applicant, Competition, Participant
+from .partitioning import get_constraint_name
+from ..users.models import Account
+
+
+class HashPartitionTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        cls.competition = Competition.objects.create(title="competition")
+
+    def test_tables_are_partitioned(self):
+        with connection.cursor() as cursor:
+            for model in [Participant, Applicant]:
+                cursor.execute(
+                    """
+                    SELECT COUNT(*) FROM pg_inherits
+                    WHERE inhparent = %s::regclass
+                    """,
+                    [model._meta.db_table],
+                )
+                self.assertEqual(cursor.fetchone()[0], 16)
+
+    def test_ids_are_generated(self):
+        first, second = [
+            Participant.objects.create(
+                competition=self.competition,
+                order=i,
+                displayed_name="d_name",
+                hidden_name="h_name",
+            )
+            for i in range(2)
+        ]
+        self.assertEqual(second.pk, first.pk + 1)
+
+    def test_constraint_name_of_partition(self):
+        Applicant.objects.create(
+            competition=self.competition,
+            account=self.account,
+            displayed_name="d_name",
+            hidden_name="h_name",
+        )
+        with self.assertRaises(IntegrityError) as cm, transaction.atomic():
+            Applicant.objects.create(
+                competition=self.competition,
+                account=self.account,
+                displayed_name="d_name",
+                hidden_name="h_name",
+            )
+        self.assertEqual(get_constraint_name(cm.exception), "unique_applicant_account")
+
+    def test_roster_query_reads_one_partition(self):
+        queryset = Participant.objects.filter(competition=self.competition)
+        plan = queryset.explain()
+        self.assertEqual(
+            len(set(re.findall(r"competitions_participant_p\d+", plan))), 1, plan
+        )
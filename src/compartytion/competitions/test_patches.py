@@ -0,0 +1,220 @@
+import json
+import threading
+
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Competition, Management
+from .patches import PatchError, apply_json_patch, apply_merge_patch
+from ..users.models import Account
+
+
+class JSONPatchTestCase(SimpleTestCase):
+    def test_operations(self):
+        document = {"foo": ["bar", "baz"], "qux": {"a": 1}}
+        patched = apply_json_patch(
+            document,
+            [
+                {"op": "add", "path": "/foo/1", "value": "new"},
+                {"op": "add", "path": "/foo/-", "value": "end"},
+                {"op": "remove", "path": "/foo/0"},
+                {"op": "replace", "path": "/qux/a", "value": 2},
+                {"op": "copy", "from": "/qux", "path": "/copied"},
+                {"op": "move", "from": "/copied/a", "path": "/moved"},
+                {"op": "add", "path": "/a~1b", "value": True},
+                {"op": "test", "path": "/moved", "value": 2},
+            ],
+        )
+        self.assertEqual(
+            patched,
+            {
+                "foo": ["new", "baz", "end"],
+                "qux": {"a": 2},
+                "copied": {},
+                "moved": 2,
+                "a/b": True,
+            },
+        )
+        # 원래 문서는 바뀌지 않는다.
+        self.assertEqual(document, {"foo": ["bar", "baz"], "qux": {"a": 1}})
+
+    def test_errors(self):
+        for operations in [
+            {"op": "add"},
+            [{"op": "remove", "path": "/missing"}],
+            [{"op": "add", "path": "/list/5", "value": 1}],
+            [{"op": "replace", "path": "/list/01", "value": 1}],
+            [{"op": "test", "path": "/flag", "value": 1}],
+            [{"op": "move", "from": "/obj", "path": "/obj/inner"}],
+            [{"op": "add", "path": "no-slash", "value": 1}],
+            [{"op": "unknown", "path": "/flag"}],
+        ]:
+            with self.assertRaises(PatchError, msg=operations):
+                apply_json_patch({"list": [1], "flag": True, "obj": {}}, operations)
+
+    def test_merge_patch(self):
+        self.assertEqual(
+            apply_merge_patch(
+                {"a": "b", "c": {"d": "e", "f": "g"}, "l": [1]},
+                {"a": "z", "c": {"f": None}, "l": [2], "n": {"x": None}},
+            ),
+            {"a": "z", "c": {"d": "e"}, "l": [2], "n": {}},
+        )
+        self.assertEqual(apply_merge_patch({"a": 1}, ["x"]), ["x"])
+
+
+class ContentVersionTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = Account.objects.create_user(
+            email="creator@example.com", password="password", username="creator"
+        )
+        cls.manager = Account.objects.create_user(
+            email="manager@example.com", password="password", username="manager"
+        )
+
+    def setUp(self):
+        self.competition = Competition.objects.create(
+            creator=self.creator, title="competition", content={"rules": ["a"]}
+        )
+        self.url = f"/api/competitions/{self.competition.pk}/"
+        self.auth = {"Authorization": f"Bearer {AccessToken.for_user(self.creator)}"}
+
+    def refresh(self):
+        self.competition.refresh_from_db()
+        return self.competition
+
+    def test_compare_and_swap(self):
+        res = self.client.patch(
+            self.url,
+            {"content": {"rules": ["b"]}, "content_version": 0},
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.refresh().content_version, 1)
+
+        # 옛 판을 보고 고친 요청은 덮어쓰지 않는다.
+        res = self.client.patch(
+            self.url,
+            {"content": {"rules": ["c"]}, "content_version": 0, "title": "other"},
+            headers=self.auth,
+        )
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(res.data["content_version"], 1)
+        competition = self.refresh()
+        self.assertEqual(
+            (competition.content, competition.title),
+            ({"rules": ["b"]}, "competition"),
+        )
+
+    def test_other_fields_do_not_touch_content(self):
+        Competition.objects.set_content(self.competition.pk, {"rules": ["new"]}, 0)
+        # self.competition 은 옛 본문을 들고 있지만 제목만 바꾼다.
+        res = self.client.patch(self.url, {"title": "renamed"}, headers=self.auth)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        competition = self.refresh()
+        self.assertEqual(competition.content, {"rules": ["new"]})
+        self.assertEqual(competition.title, "renamed")
+
+    def patch(self, data, content_type, account=None, **headers):
+        return self.client.generic(
+            "PATCH",
+            f"{self.url}content/",
+            data=json.dumps(data),
+            content_type=content_type,
+            headers={
+                "Authorization": f"Bearer {AccessToken.for_user(account or self.creator)}",
+                **headers,
+            },
+        )
+
+    def test_json_patch(self):
+        res = self.patch(
+            [{"op": "add", "path": "/rules/-", "value": "b"}],
+            "application/json-patch+json",
+            **{"If-Match": '"0"'},
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            res.data, {"content": {"rules": ["a", "b"]}, "content_version": 1}
+        )
+        self.assertEqual(res.headers["ETag"], '"1"')
+
+        res = self.patch(
+            [{"op": "remove", "path": "/rules/0"}],
+            "application/json-patch+json",
+            **{"If-Match": '"0"'},
+        )
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(res.data["content_version"], 1)
+
+        res = self.patch(
+            [{"op": "test", "path": "/rules/0", "value": "x"}],
+            "application/json-patch+json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(self.refresh().content, {"rules": ["a", "b"]})
+
+    def test_merge_patch_without_if_match_applies_to_latest(self):
+        Competition.objects.set_content(
+            self.competition.pk, {"rules": ["a"], "prize": 1}, 0
+        )
+        res = self.patch({"prize": None, "notice": "n"}, "application/merge-patch+json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["content"], {"rules": ["a"], "notice": "n"})
+        self.assertEqual(res.data["content_version"], 2)
+
+    def test_content_permission(self):
+        Management.objects.create(competition=self.competition, account=self.manager)
+        res = self.patch({"a": 1}, "application/merge-patch+json", self.manager)
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+        Management.objects.update(handle_content=True)
+        res = self.patch({"a": 1}, "application/merge-patch+json", self.manager)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+class ConcurrentContentTestCase(TransactionTestCase):
+    NUM_OF_THREADS = 8
+
+    def test_one_writer_wins_per_version(self):
+        account = Account.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        competition = Competition.objects.create(creator=account, title="c")
+        token = AccessToken.for_user(account)
+        barrier = threading.Barrier(self.NUM_OF_THREADS)
+        responses = []
+
+        def edit(i):
+            try:
+                barrier.wait()
+                responses.append(
+                    APIClient().patch(
+                        f"/api/competitions/{competition.pk}/",
+                        {"content": {"writer": i}, "content_version": 0},
+                        format="json",
+                        headers={"Authorization": f"Bearer {token}"},
+                    )
+                )
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=edit, args=(i,)) for i in range(self.NUM_OF_THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        codes = sorted(res.status_code for res in responses)
+        self.assertEqual(
+            codes,
+            [status.HTTP_200_OK]
+            + [status.HTTP_409_CONFLICT] * (self.NUM_OF_THREADS - 1),
+        )
+        competition.refresh_from_db()
+        self.assertEqual(competition.content_version, 1)
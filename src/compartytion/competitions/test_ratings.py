@@ -0,0 +1,210 @@
+import random
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Competition, Match, Participant
+from .ratings import current_period, update_ratings
+from ..users.models import Account, Rating
+from ..users.ratings import SCALE, RatingPool
+
+HOME, AWAY, DRAW = Match.SideChoices.values
+
+
+class RatingPoolTestCase(SimpleTestCase):
+    def test_glicko2_example(self):
+        # Glickman 의 Glicko-2 설명서 예제
+        pool = RatingPool(np.arange(4))
+        for i, (rating, deviation) in enumerate(
+            [(1500, 200), (1400, 30), (1550, 100), (1700, 300)]
+        ):
+            pool.mu[i] = (rating - 1500) / SCALE
+            pool.phi[i] = deviation / SCALE
+        pool.rate_period(
+            0, np.array([0, 0, 0]), np.array([1, 2, 3]), np.array([1.0, 0.0, 0.0])
+        )
+        rows = pool.rows()
+        self.assertAlmostEqual(rows["rating"][0], 1464.06, places=1)
+        self.assertAlmostEqual(rows["deviation"][0], 151.52, places=1)
+        self.assertAlmostEqual(rows["volatility"][0], 0.05999, places=4)
+        self.assertEqual(rows["num_of_games"].tolist(), [3, 1, 1, 1])
+
+    def test_period_is_order_independent(self):
+        rng = np.random.default_rng(1)
+        periods = rng.integers(0, 5, 500)
+        home = rng.integers(0, 50, 500)
+        away = (home + rng.integers(1, 50, 500)) % 50
+        score = rng.choice([0.0, 0.5, 1.0], 500)
+
+        pool = RatingPool(np.arange(50))
+        self.assertEqual(pool.rate(periods, home, away, score), 5)
+        shuffled = RatingPool(np.arange(50))
+        order = rng.permutation(500)
+        shuffled.rate(periods[order], home[order], away[order], score[order])
+        for key, value in pool.rows().items():
+            np.testing.assert_allclose(value, shuffled.rows()[key])
+        # Elo 는 한 평가 기간 안에서 주고받은 점수의 합이 0 이다.
+        self.assertAlmostEqual(pool.elo.mean(), 1500.0)
+
+    def test_idle_periods_increase_deviation(self):
+        pool = RatingPool(np.arange(2))
+        pool.rate_period(0, np.array([0]), np.array([1]), np.array([1.0]))
+        after_game = pool.phi[0]
+        pool.rate_period(1, np.array([0]), np.array([1]), np.array([0.5]))
+        active = pool.phi[0]
+
+        idle = RatingPool(np.arange(2))
+        idle.rate_period(0, np.array([0]), np.array([1]), np.array([1.0]))
+        idle.rate_period(30, np.array([0]), np.array([1]), np.array([0.5]))
+        self.assertLess(active, after_game)
+        self.assertGreater(idle.phi[0], active)
+
+
+def create_rated_players(competition, count):
+    accounts = [
+        Account.objects.create_user(
+            email=f"player{i}@example.com", password="password", username=f"player{i}"
+        )
+        for i in range(count)
+    ]
+    participants = Participant.objects.bulk_create(
+        [
+            Participant(
+                competition=competition,
+                account=account,
+                order=i + 1,
+                displayed_name=f"p{i}",
+                hidden_name=f"p{i}",
+            )
+            for i, account in enumerate(accounts)
+        ]
+    )
+    return accounts, participants
+
+
+class UpdateRatingsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.competition = Competition.objects.create(title="Test Competition")
+        cls.accounts, cls.participants = create_rated_players(cls.competition, 8)
+        rng = random.Random(7)
+        period = timedelta(seconds=settings.RATING_PERIOD_SECONDS)
+        now = timezone.now()
+        matches = []
+        for weeks in range(6, -1, -1):
+            for slot in range(6):
+                home, away = rng.sample(cls.participants, 2)
+                matches.append(
+                    Match(
+                        competition=cls.competition,
+                        round=6 - weeks,
+                        slot=slot,
+                        home=home,
+                        away=away,
+                        home_score=0,
+                        away_score=0,
+                        winner=rng.choice([HOME, AWAY, DRAW]),
+                        reported_at=now - weeks * period,
+                    )
+                )
+        # 부전승과 계정 없는 참가자의 경기는 레이팅에 들어가지 않는다.
+        guest = Participant.objects.create(
+            competition=cls.competition, order=9, displayed_name="g", hidden_name="g"
+        )
+        matches.append(
+            Match(
+                competition=cls.competition,
+                round=1,
+                slot=6,
+                home=cls.participants[0],
+                away=guest,
+                winner=HOME,
+                reported_at=now - 6 * period,
+            )
+        )
+        matches.append(
+            Match(
+                competition=cls.competition,
+                round=1,
+                slot=7,
+                home=cls.participants[0],
+                bye=AWAY,
+                winner=HOME,
+                reported_at=now - 6 * period,
+            )
+        )
+        Match.objects.bulk_create(matches)
+
+    def snapshot(self):
+        return {
+            row[0]: row[1:]
+            for row in Rating.objects.values_list(
+                "account_id", "rating", "deviation", "volatility", "elo", "num_of_games"
+            )
+        }
+
+    def test_current_period_is_not_rated(self):
+        update_ratings(full=True)
+        self.assertEqual(sum(row[4] for row in self.snapshot().values()), 2 * 6 * 6)
+        self.assertLess(Rating.objects.latest("period").period, current_period())
+
+    def test_incremental_matches_full_recompute(self):
+        until = current_period() + 1
+        update_ratings(full=True, until=until - 4)
+        update_ratings(until=until - 2)
+        num_of_periods, _ = update_ratings(until=until)
+        incremental = self.snapshot()
+
+        self.assertGreater(num_of_periods, 0)
+        self.assertEqual(update_ratings(until=until), (0, 0))
+        update_ratings(full=True, until=until)
+        full = self.snapshot()
+        self.assertEqual(incremental.keys(), full.keys())
+        for account_id, row in full.items():
+            for have, want in zip(incremental[account_id], row):
+                self.assertAlmostEqual(have, want, places=6)
+
+
+class RatingSeedingTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.token = AccessToken.for_user(creator)
+        cls.competition = Competition.objects.create(
+            creator=creator, title="Test Competition"
+        )
+        cls.accounts, cls.participants = create_rated_players(cls.competition, 4)
+        for account, rating in zip(cls.accounts[1:], [1600.0, 1400.0, 1800.0]):
+            Rating.objects.create(account=account, rating=rating)
+
+    def test_bracket_seeded_by_rating(self):
+        res = self.client.post(
+            f"/api/competitions/{self.competition.pk}/bracket/",
+            {"format": "single_elimination", "seeding": "rating"},
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        p = self.participants
+        # 레이팅이 없는 참가자는 마지막 시드이다.
+        self.assertEqual(res.data["entrants"], [p[3].pk, p[1].pk, p[2].pk, p[0].pk])
+
+    def test_profile_shows_rating(self):
+        res = self.client.get(
+            f"/api/profiles/{self.accounts[3].profile.username}/",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["rating"]["rating"], 1800.0)
+        res = self.client.get(
+            f"/api/profiles/{self.accounts[0].profile.username}/",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertIsNone(res.data["rating"])
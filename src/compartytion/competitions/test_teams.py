@@ -0,0 +1,117 @@
+import random
+from collections import Counter
+
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .balancing import partition_balanced
+from .models import Competition, Match, Participant, Standing, Team
+from ..users.models import Account
+
+
+class PartitionBalancedTestCase(SimpleTestCase):
+    def test_sizes_differ_by_at_most_one(self):
+        assignment = partition_balanced([1.0] * 10, 3)
+        self.assertEqual(sorted(Counter(assignment).values()), [3, 3, 4])
+
+    def test_totals_are_balanced(self):
+        rng = random.Random(0)
+        weights = [rng.uniform(1000, 2000) for _ in range(5000)]
+        assignment = partition_balanced(weights, 8)
+        totals = [0.0] * 8
+        for weight, team in zip(weights, assignment):
+            totals[team] += weight
+        self.assertLess(max(totals) - min(totals), 2000)
+
+    def test_more_teams_than_items(self):
+        self.assertEqual(partition_balanced([3.0, 1.0], 4), [0, 1])
+
+
+class TeamViewSetTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.token = AccessToken.for_user(creator)
+        cls.competition = Competition.objects.create(
+            creator=creator, title="Team Competition", is_team_game=True
+        )
+        cls.solo_competition = Competition.objects.create(
+            creator=creator, title="Solo Competition"
+        )
+        Participant.objects.bulk_create(
+            [
+                Participant(
+                    competition=cls.competition,
+                    order=i,
+                    displayed_name=f"p{i}",
+                    hidden_name=f"p{i}",
+                )
+                for i in range(1, 9)
+            ]
+        )
+
+    def url(self, competition=None):
+        return f"/api/competitions/{(competition or self.competition).id}/teams/"
+
+    def post(self, url, data=None):
+        return self.client.post(
+            url, data, headers={"Authorization": f"Bearer {self.token}"}
+        )
+
+    def test_create_team(self):
+        res = self.post(self.url(), {"name": "A"})
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        res = self.post(self.url(), {"name": "B"})
+        self.assertEqual(res.data["order"], 2)
+
+    def test_reject_solo_competition(self):
+        res = self.post(self.url(self.solo_competition), {"name": "A"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_auto_assign_by_seed(self):
+        Team.objects.create(competition=self.competition, order=1, name="A")
+        res = self.post(f"{self.url()}auto_assign/", {"num_of_teams": 2})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        teams = Team.objects.filter(competition=self.competition)
+        self.assertEqual(list(teams.values_list("name", flat=True)), ["A", "팀 2"])
+        members = {
+            team.name: sorted(team.participant_set.values_list("order", flat=True))
+            for team in teams
+        }
+        self.assertEqual(members, {"A": [1, 4, 5, 8], "팀 2": [2, 3, 6, 7]})
+
+    def test_delete_team_with_standings(self):
+        teams = [
+            Team.objects.create(competition=self.competition, order=i, name=name)
+            for i, name in enumerate(["A", "B", "C"], start=1)
+        ]
+        Match.objects.create(
+            competition=self.competition,
+            round=1,
+            slot=0,
+            home_team=teams[0],
+            away_team=teams[1],
+        )
+        Standing.objects.create(competition=self.competition, team=teams[2])
+        for team in teams:
+            res = self.client.delete(
+                f"{self.url()}{team.id}/",
+                headers={"Authorization": f"Bearer {self.token}"},
+            )
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Team.objects.filter(competition=self.competition).count(), 3)
+        self.assertTrue(Standing.objects.filter(team=teams[2]).exists())
+
+    def test_delete_unused_team(self):
+        team = Team.objects.create(competition=self.competition, order=1, name="A")
+        res = self.client.delete(
+            f"{self.url()}{team.id}/",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Team.objects.filter(pk=team.pk).exists())
@@ -0,0 +1,599 @@
+import random
+from io import StringIO
+import threading
+import time
+from collections import Counter
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TransactionTestCase
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Competition, Participant, Match, Standing
+from .pagination import KeysetPagination
+from .tournament.bracket import Bracket, BYE, seeding_order
+from .tournament.swiss import Swiss, maximum_matching
+from .tournament.schedule import build_schedule, circle_rounds, split_groups
+from .tournament.matches import ResultReporter, save_bracket, save_swiss_round
+from .tournament.schedule import create_schedule
+from .tournament.standings import STAT_FIELDS, compute_standings
+from ..users.models import Account
+
+
+def play_out(bracket: Bracket, rng: random.Random) -> None:
+    pending = True
+    while pending:
+        pending = False
+        for match in range(bracket.num_of_matches):
+            home, away = bracket.slots[2 * match], bracket.slots[2 * match + 1]
+            if bracket.results[match] is None and None not in (home, away):
+                bracket.report(match, rng.randint(0, 1))
+                pending = True
+
+
+class BracketTestCase(SimpleTestCase):
+    def test_seeding_order(self):
+        self.assertEqual(seeding_order(8), [1, 8, 4, 5, 2, 7, 3, 6])
+
+    def test_single_elimination_byes(self):
+        bracket = Bracket.generate(
+            Bracket.SINGLE_ELIMINATION, ["a", "b", "c", "d", "e"]
+        )
+        self.assertEqual(bracket.size, 8)
+        self.assertEqual(bracket.num_of_matches, 7)
+        # 1~3번 시드는 부전승으로 2라운드에 올라간다.
+        self.assertEqual([bracket.winner(m) for m in range(4)], ["a", None, "b", "c"])
+        self.assertEqual(bracket.slots[8:12], [0, None, 1, 2])
+
+    def test_single_elimination_higher_seeds_win(self):
+        bracket = Bracket.generate(Bracket.SINGLE_ELIMINATION, list(range(16)))
+        for match in range(bracket.num_of_matches):
+            if bracket.results[match] is None:
+                home, away = bracket.slots[2 * match], bracket.slots[2 * match + 1]
+                bracket.report(match, 0 if home < away else 1)
+        self.assertEqual(bracket.winner(bracket.final), 0)
+        self.assertEqual(bracket.slots[-2:], [0, 1])
+
+    def test_double_elimination_every_match_is_played(self):
+        rng = random.Random(42)
+        for num_of_entrants in (2, 3, 5, 8, 13, 32):
+            bracket = Bracket.generate(
+                Bracket.DOUBLE_ELIMINATION, list(range(num_of_entrants))
+            )
+            play_out(bracket, rng)
+            self.assertNotIn(None, bracket.results)
+
+            losses = Counter()
+            for match in range(bracket.num_of_matches):
+                loser = bracket.slots[2 * match + 1 - bracket.results[match]]
+                if loser != BYE:
+                    losses[loser] += 1
+            champion = bracket.slots[2 * bracket.final + bracket.results[-1]]
+            self.assertLessEqual(losses[champion], 1)
+            self.assertEqual(set(losses) | {champion}, set(range(num_of_entrants)))
+            self.assertTrue(all(count <= 2 for count in losses.values()))
+
+    def test_json_round_trip(self):
+        bracket = Bracket.generate(Bracket.DOUBLE_ELIMINATION, list(range(6)))
+        restored = Bracket.from_json(bracket.to_json())
+        self.assertEqual(restored.to_json(), bracket.to_json())
+
+    def test_report_rejects_unready_match(self):
+        bracket = Bracket.generate(Bracket.SINGLE_ELIMINATION, list(range(4)))
+        with self.assertRaises(ValueError):
+            bracket.report(bracket.final, 0)
+
+    def test_generation_benchmark(self):
+        entrants = list(range(4096))
+        started = time.perf_counter()
+        for format in Bracket.FORMATS:
+            Bracket.generate(format, entrants).to_json()
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+
+def play_swiss_round(swiss: Swiss, rng: random.Random) -> None:
+    swiss.pair_next_round()
+    for match in range(swiss.num_of_matches):
+        if swiss.results[match] is None:
+            swiss.report(match, rng.choice([0, 1, 2]))
+
+
+class SwissTestCase(SimpleTestCase):
+    def test_no_rematches(self):
+        rng = random.Random(7)
+        for num_of_entrants in (8, 9, 16, 33):
+            swiss = Swiss.start(list(range(num_of_entrants)))
+            for _ in range(5):
+                play_swiss_round(swiss, rng)
+            games = [
+                frozenset(swiss.slots[2 * m : 2 * m + 2])
+                for m in range(swiss.num_of_matches)
+                if swiss.slots[2 * m + 1] != BYE
+            ]
+            self.assertEqual(len(games), len(set(games)))
+
+    def test_colors_are_balanced(self):
+        rng = random.Random(7)
+        swiss = Swiss.start(list(range(64)))
+        for _ in range(6):
+            play_swiss_round(swiss, rng)
+        _, balance, _, _ = swiss.standings()
+        # 홈/원정 경기 수 차이는 2를 넘지 않는다.
+        self.assertLessEqual(abs(balance).max(), 2)
+
+    def test_bye_goes_to_lowest_without_bye(self):
+        swiss = Swiss.start(list(range(5)))
+        swiss.pair_next_round()
+        self.assertEqual(swiss.slots[-2:], [4, BYE])
+        self.assertEqual(swiss.results[-1], 0)
+        for match in range(swiss.num_of_matches - 1):
+            swiss.report(match, 0)
+        swiss.pair_next_round()
+        self.assertEqual(len(swiss.had_bye()), 2)
+
+    def test_pairing_requires_finished_round(self):
+        swiss = Swiss.start(list(range(4)))
+        swiss.pair_next_round()
+        with self.assertRaises(ValueError):
+            swiss.pair_next_round()
+
+    def test_maximum_matching_augments_through_blossom(self):
+        # 0-1-2 삼각형의 각 꼭짓점에 3, 4, 5 가 매달린 그래프.
+        # 1-2 짝에서 출발해도 블라섬을 거쳐 완전 매칭을 찾는다.
+        adj = [[1, 2, 3], [0, 2, 5], [0, 1, 4], [0], [2], [1]]
+        match = maximum_matching(adj, [-1, 2, 1, -1, -1, -1])
+        self.assertNotIn(-1, match)
+
+    def test_pairing_benchmark(self):
+        rng = random.Random(7)
+        swiss = Swiss.start(list(range(2000)))
+        for _ in range(4):
+            play_swiss_round(swiss, rng)
+        started = time.perf_counter()
+        swiss.pair_next_round()
+        self.assertLess(time.perf_counter() - started, 1)
+
+
+class ScheduleTestCase(SimpleTestCase):
+    def test_circle_rounds_pair_everyone_once(self):
+        for num_of_entrants in (2, 5, 8):
+            rounds = circle_rounds(num_of_entrants)
+            games = [frozenset(pair) for pairs in rounds for pair in pairs]
+            self.assertEqual(len(games), num_of_entrants * (num_of_entrants - 1) // 2)
+            self.assertEqual(len(set(games)), len(games))
+            for pairs in rounds:
+                players = [player for pair in pairs for player in pair]
+                self.assertEqual(len(players), len(set(players)))
+
+    def test_split_groups_by_seed(self):
+        self.assertEqual(split_groups(8, 3), [[0, 5, 6], [1, 4, 7], [2, 3]])
+
+    def test_rest_and_capacity(self):
+        schedule = build_schedule(16, num_of_groups=2, rest=1, capacity=3)
+        last_slot = {}
+        per_slot = Counter()
+        for group, round, slot, venue, home, away in schedule:
+            for player in (home, away):
+                if player in last_slot:
+                    self.assertGreaterEqual(slot - last_slot[player], 2)
+                last_slot[player] = slot
+            per_slot[slot] += 1
+            self.assertLess(venue, 3)
+        self.assertLessEqual(max(per_slot.values()), 3)
+        self.assertEqual(len(schedule), 2 * 28)
+
+    def test_rest_gap_past_last_slot(self):
+        # 쉬는 시간대 때문에 지금까지 쓴 마지막 시간대보다 더 뒤로 건너뛰는 경우
+        for num_of_entrants, rest, capacity in [
+            (8, 1, None),
+            (8, 2, None),
+            (6, 3, None),
+            (8, 2, 1),
+            (6, 3, 2),
+        ]:
+            schedule = build_schedule(num_of_entrants, rest=rest, capacity=capacity)
+            last_slot = {}
+            per_slot = Counter()
+            for group, round, slot, venue, home, away in schedule:
+                for player in (home, away):
+                    if player in last_slot:
+                        self.assertGreater(slot - last_slot[player], rest)
+                    last_slot[player] = slot
+                per_slot[slot] += 1
+                if capacity is not None:
+                    self.assertLess(venue, capacity)
+            if capacity is not None:
+                self.assertLessEqual(max(per_slot.values()), capacity)
+            self.assertEqual(
+                len(schedule), num_of_entrants * (num_of_entrants - 1) // 2
+            )
+
+    def test_rejects_too_many_groups(self):
+        with self.assertRaises(ValueError):
+            build_schedule(5, num_of_groups=3)
+
+    def test_schedule_benchmark(self):
+        started = time.perf_counter()
+        schedule = build_schedule(64 * 8, num_of_groups=64, rest=1, capacity=32)
+        self.assertLess(time.perf_counter() - started, 0.1)
+        self.assertEqual(len(schedule), 64 * 28)
+
+
+class BracketViewTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.token = AccessToken.for_user(creator)
+        cls.competition = Competition.objects.create(
+            creator=creator, title="Test Competition"
+        )
+        cls.participants = Participant.objects.bulk_create(
+            [
+                Participant(
+                    competition=cls.competition,
+                    order=i,
+                    displayed_name=f"p{i}",
+                    hidden_name=f"p{i}",
+                )
+                for i in range(1, 4)
+            ]
+        )
+
+    def test_generate_bracket(self):
+        res = self.client.post(
+            f"/api/competitions/{self.competition.id}/bracket/",
+            {"format": Bracket.SINGLE_ELIMINATION},
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.competition.refresh_from_db()
+        self.assertEqual(
+            self.competition.tournament["entrants"],
+            [p.id for p in self.participants],
+        )
+        self.assertEqual(len(self.competition.tournament["rounds"]), 3)
+
+    def test_pair_swiss_rounds(self):
+        url = f"/api/competitions/{self.competition.id}/swiss/"
+        headers = {"Authorization": f"Bearer {self.token}"}
+        res = self.client.post(url, headers=headers)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["format"], Swiss.FORMAT)
+        self.assertEqual(res.data["rounds"], [1, 1])
+
+        res = self.client.post(url, headers=headers)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.competition.refresh_from_db()
+        swiss = Swiss.from_json(self.competition.tournament)
+        swiss.report(0, 0)
+        self.competition.tournament = swiss.to_json()
+        self.competition.save()
+        res = self.client.post(url, headers=headers)
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["rounds"], [1, 1, 2, 2])
+
+    def test_generate_bracket_requires_creator(self):
+        res = self.client.post(
+            f"/api/competitions/{self.competition.id}/bracket/",
+            {"format": Bracket.SINGLE_ELIMINATION},
+        )
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ScheduleViewTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.token = AccessToken.for_user(creator)
+        cls.competition = Competition.objects.create(
+            creator=creator, title="Test Competition"
+        )
+        Participant.objects.bulk_create(
+            [
+                Participant(
+                    competition=cls.competition,
+                    order=i,
+                    displayed_name=f"p{i}",
+                    hidden_name=f"p{i}",
+                )
+                for i in range(1, 9)
+            ]
+        )
+
+    def test_generate_and_list_by_round(self):
+        # 변경 기록을 같은 트랜잭션에서 쓰므로 SAVEPOINT 두 번과 기록 INSERT 한 번이 더해진다.
+        with self.assertNumQueries(15):
+            res = self.client.post(
+                f"/api/competitions/{self.competition.id}/schedule/",
+                {"num_of_groups": 2},
+                headers={"Authorization": f"Bearer {self.token}"},
+            )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Match.objects.filter(competition=self.competition).count(), 12)
+
+        url = f"/api/competitions/{self.competition.id}/matches/"
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["round"], 1)
+        self.assertEqual(res.data["last_round"], 3)
+        self.assertEqual(len(res.data["results"]), 4)
+        self.assertIsNone(res.data["previous"])
+
+        res = self.client.get(res.data["next"])
+        self.assertEqual(res.data["round"], 2)
+
+        res = self.client.get(url, {"round": 3, "group": 1})
+        self.assertEqual(len(res.data["results"]), 2)
+        self.assertIsNone(res.data["next"])
+
+    def test_too_many_groups(self):
+        res = self.client.post(
+            f"/api/competitions/{self.competition.id}/schedule/",
+            {"num_of_groups": 5},
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+def create_participants(competition, count):
+    return Participant.objects.bulk_create(
+        [
+            Participant(
+                competition=competition,
+                order=i,
+                displayed_name=f"p{i}",
+                hidden_name=f"p{i}",
+            )
+            for i in range(1, count + 1)
+        ]
+    )
+
+
+class MatchReportTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.token = AccessToken.for_user(creator)
+        cls.competition = Competition.objects.create(
+            creator=creator, title="Test Competition"
+        )
+        cls.participants = create_participants(cls.competition, 6)
+
+    def generate(self, format):
+        res = self.client.post(
+            f"/api/competitions/{self.competition.id}/bracket/",
+            {"format": format},
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        return Bracket.from_json(res.data)
+
+    def report(self, match_id, home_score, away_score, **data):
+        return self.client.post(
+            f"/api/competitions/{self.competition.id}/matches/{match_id}/report/",
+            {"home_score": home_score, "away_score": away_score, **data},
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+
+    def ready_matches(self):
+        return Match.objects.filter(
+            competition=self.competition,
+            winner__isnull=True,
+            bye__isnull=True,
+            home__isnull=False,
+            away__isnull=False,
+        ).order_by("position")
+
+    def test_bracket_is_materialized(self):
+        bracket = self.generate(Bracket.SINGLE_ELIMINATION)
+        matches = Match.objects.filter(competition=self.competition)
+        self.assertEqual(matches.count(), bracket.num_of_matches)
+        # 1, 2번 시드는 부전승으로 2라운드에 올라가 있다.
+        self.assertEqual(matches.filter(bye__isnull=False).count(), 2)
+        second_round = matches.filter(round=2).order_by("position")
+        self.assertEqual(second_round[0].home_id, self.participants[0].id)
+
+    def test_reports_match_engine_projection(self):
+        rng = random.Random(3)
+        bracket = self.generate(Bracket.DOUBLE_ELIMINATION)
+        while match := self.ready_matches().first():
+            side = rng.randint(0, 1)
+            res = self.report(match.id, 2 - side, 1 + side)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            bracket.report(match.position, side)
+
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.tournament, bracket.to_json())
+        self.assertNotIn(None, bracket.results)
+
+    def test_invalid_reports(self):
+        self.generate(Bracket.SINGLE_ELIMINATION)
+        match = self.ready_matches().first()
+        self.assertEqual(self.report(match.id, 1, 1).status_code, 400)
+        self.assertEqual(self.report(match.id, 2, 1, winner=1).status_code, 400)
+        self.assertEqual(self.report(match.id, 1, 1, winner=1).status_code, 200)
+        self.assertEqual(self.report(match.id, 2, 1).status_code, 400)
+
+        final = Match.objects.get(competition=self.competition, round=3)
+        self.assertEqual(self.report(final.id, 2, 1).status_code, 400)
+        self.assertEqual(self.report(0, 2, 1).status_code, 404)
+
+    def test_swiss_draw(self):
+        res = self.client.post(
+            f"/api/competitions/{self.competition.id}/swiss/",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        match = self.ready_matches().first()
+        res = self.report(match.id, 0, 0)
+        self.assertEqual(res.data["winner"], Match.SideChoices.DRAW)
+        self.competition.refresh_from_db()
+        self.assertEqual(
+            self.competition.tournament["results"][match.position],
+            Match.SideChoices.DRAW,
+        )
+
+    def test_report_requires_permission(self):
+        self.generate(Bracket.SINGLE_ELIMINATION)
+        match = self.ready_matches().first()
+        res = self.client.post(
+            f"/api/competitions/{self.competition.id}/matches/{match.id}/report/",
+            {"home_score": 1, "away_score": 0},
+        )
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ConcurrentReportTestCase(TransactionTestCase):
+    NUM_OF_ENTRANTS = 64
+
+    def test_concurrent_reports_keep_every_result(self):
+        competition = Competition.objects.create(title="Test Competition")
+        participants = create_participants(competition, self.NUM_OF_ENTRANTS)
+        bracket = Bracket.generate(
+            Bracket.SINGLE_ELIMINATION, [p.id for p in participants]
+        )
+        save_bracket(competition, bracket)
+        match_ids = list(
+            Match.objects.filter(competition=competition, round=1).values_list(
+                "id", flat=True
+            )
+        )
+        barrier = threading.Barrier(len(match_ids))
+        errors = []
+
+        def report(match_id):
+            try:
+                barrier.wait()
+                ResultReporter(competition.id).report(match_id, 1, 0)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=report, args=(i,)) for i in match_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        for match in range(len(match_ids)):
+            bracket.report(match, 0)
+        competition.refresh_from_db()
+        self.assertEqual(competition.tournament, bracket.to_json())
+        self.assertEqual(
+            Match.objects.filter(
+                competition=competition, round=2, home__isnull=False, away__isnull=False
+            ).count(),
+            len(match_ids) // 2,
+        )
+
+
+class StandingsTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.competition = Competition.objects.create(title="Test Competition")
+        cls.participants = create_participants(cls.competition, 7)
+
+    def play_all(self, rng):
+        for match in Match.objects.filter(
+            competition=self.competition, bye=None, winner=None
+        ):
+            ResultReporter(self.competition.id).report(
+                match.id, rng.randint(0, 3), rng.randint(0, 3)
+            )
+
+    def stored(self):
+        return {
+            row["participant_id"]: {key: row[key] for key in STAT_FIELDS}
+            for row in Standing.objects.filter(competition=self.competition).values(
+                "participant_id", *STAT_FIELDS
+            )
+        }
+
+    def test_incremental_standings_match_rebuild(self):
+        create_schedule(self.competition, rest=1)
+        self.play_all(random.Random(5))
+        self.assertEqual(self.stored(), compute_standings(self.competition))
+        call_command(
+            "rebuild_standings", str(self.competition.id), "--check", stdout=StringIO()
+        )
+
+        leader = Standing.objects.filter(competition=self.competition).first()
+        self.assertEqual(leader.played, 6)
+        self.assertEqual(
+            leader.score_difference, leader.score_for - leader.score_against
+        )
+
+    def test_swiss_rounds(self):
+        swiss = Swiss.start([p.id for p in self.participants])
+        rng = random.Random(9)
+        for _ in range(3):
+            round = swiss.pair_next_round()
+            save_swiss_round(self.competition, swiss, round)
+            self.play_all(rng)
+            self.competition.refresh_from_db()
+            swiss = Swiss.from_json(self.competition.tournament)
+        self.assertEqual(self.stored(), compute_standings(self.competition))
+
+    def test_swiss_bye_counts_as_win(self):
+        # 참가자가 홀수라 라운드마다 한 명이 부전승을 받는다.
+        swiss = Swiss.start([p.id for p in self.participants])
+        rng = random.Random(3)
+        for _ in range(3):
+            round = swiss.pair_next_round()
+            save_swiss_round(self.competition, swiss, round)
+            self.play_all(rng)
+            self.competition.refresh_from_db()
+            swiss = Swiss.from_json(self.competition.tournament)
+
+        score = swiss.standings()[0]
+        stored = self.stored()
+        self.assertEqual(len(swiss.had_bye()), 3)
+        for index, entrant_id in enumerate(swiss.entrants):
+            row = stored[entrant_id]
+            self.assertEqual(row["played"], 3)
+            self.assertEqual(row["wins"] + row["draws"] / 2, score[index])
+        self.assertEqual(stored, compute_standings(self.competition))
+        call_command(
+            "rebuild_standings", str(self.competition.id), "--check", stdout=StringIO()
+        )
+
+    def test_keyset_pagination(self):
+        create_schedule(self.competition)
+        self.play_all(random.Random(1))
+        url = f"/api/competitions/{self.competition.id}/standings/"
+        expected = list(
+            Standing.objects.filter(competition=self.competition).values_list(
+                "participant_id", flat=True
+            )
+        )
+        seen = []
+        while url:
+            res = self.client.get(url, {"page_size": 2} if not seen else None)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            seen += [row["participant"] for row in res.data["results"]]
+            url = res.data["next"]
+        self.assertEqual(seen, expected)
+
+        # 형식은 맞아도 값이 정렬 필드에 맞지 않는 커서도 거절한다.
+        for cursor in [
+            "x",
+            KeysetPagination().encode_cursor(["x", 0, 0, 0, 1]),
+            KeysetPagination().encode_cursor([0, 0, 0, 0, None]),
+            KeysetPagination().encode_cursor([0, 0, 0, 0, [1]]),
+        ]:
+            res = self.client.get(
+                f"/api/competitions/{self.competition.id}/standings/",
+                {"cursor": cursor},
+            )
+            self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND, cursor)
@@ -0,0 +1,158 @@
+import threading
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .models import Applicant, Competition
+from .transitions import advance_statuses
+from ..users.models import Account
+
+Status = Competition.StatusChoices
+
+
+class AdvanceStatusesTestCase(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        hour = timedelta(hours=1)
+        self.competitions = {
+            name: Competition.objects.create(title=name, **times)
+            for name, times in {
+                "open": {"recruit_end_at": self.now + hour},
+                "closed": {"recruit_end_at": self.now - hour},
+                "started": {
+                    "recruit_end_at": self.now - 2 * hour,
+                    "start_at": self.now - hour,
+                },
+                "no_deadline": {"start_at": self.now - hour},
+                "finished": {"end_at": self.now - hour},
+                "manual": {},
+            }.items()
+        }
+
+    def statuses(self):
+        return dict(Competition.objects.values_list("title", "status"))
+
+    def test_advance(self):
+        changed = advance_statuses(self.now)
+        self.assertEqual(len(changed), 4)
+        self.assertEqual(
+            self.statuses(),
+            {
+                "open": Status.RECRUIT,
+                "closed": Status.READY,
+                "started": Status.PLAY,
+                "no_deadline": Status.PLAY,
+                "finished": Status.DONE,
+                "manual": Status.RECRUIT,
+            },
+        )
+        # 같은 시각으로 다시 실행해도 바뀌지 않는다.
+        self.assertEqual(advance_statuses(self.now), [])
+
+    def test_status_never_goes_back(self):
+        Competition.objects.filter(title="closed").update(status=Status.DONE)
+        advance_statuses(self.now)
+        self.assertEqual(self.statuses()["closed"], Status.DONE)
+
+    def test_batch_size(self):
+        self.assertEqual(len(advance_statuses(self.now, batch_size=3)), 3)
+        self.assertEqual(len(advance_statuses(self.now, batch_size=3)), 1)
+
+    def test_uses_partial_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(
+                f"EXPLAIN SELECT id FROM {Competition._meta.db_table} "
+                "WHERE transition_at <= now() ORDER BY transition_at LIMIT 10"
+            )
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        self.assertIn("competition_transition_idx", plan)
+
+
+class SkipLockedTestCase(TransactionTestCase):
+    def test_locked_competition_is_skipped(self):
+        now = timezone.now()
+        locked = Competition.objects.create(title="locked", recruit_end_at=now)
+        other = Competition.objects.create(title="other", recruit_end_at=now)
+        is_locked, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            try:
+                with transaction.atomic():
+                    Competition.objects.select_for_update().get(pk=locked.pk)
+                    is_locked.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        is_locked.wait(10)
+        try:
+            self.assertEqual([row[0] for row in advance_statuses(now)], [other.pk])
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual([row[0] for row in advance_statuses(now)], [locked.pk])
+
+
+class ClosedRegistrationTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        cls.token = AccessToken.for_user(cls.account)
+
+    def register(self, competition):
+        return self.client.post(
+            "/api/applications/register/",
+            {
+                "competition": competition.pk,
+                "displayed_name": "d_name",
+                "hidden_name": "h_name",
+            },
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+
+    def test_register_after_status_changed(self):
+        competition = Competition.objects.create(title="ready", status=Status.READY)
+        res = self.register(competition)
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(Applicant.objects.exists())
+
+    def test_register_after_deadline_before_tick(self):
+        competition = Competition.objects.create(
+            title="closed", recruit_end_at=timezone.now() - timedelta(seconds=1)
+        )
+        # 인증 외에는 대회 행 하나만 읽는다.
+        with self.assertNumQueries(2):
+            res = self.register(competition)
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+
+    def test_register_while_recruiting(self):
+        competition = Competition.objects.create(
+            title="open", recruit_end_at=timezone.now() + timedelta(days=1)
+        )
+        res = self.register(competition)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_schedule_order_is_validated(self):
+        now = timezone.now()
+        res = self.client.post(
+            "/api/competitions/",
+            {
+                "title": "new",
+                "managers": [],
+                "start_at": now.isoformat(),
+                "end_at": (now - timedelta(days=1)).isoformat(),
+            },
+            format="json",
+            headers={"Authorization": f"Bearer {self.token}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
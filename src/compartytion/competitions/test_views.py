@@ -1,8 +1,17 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APITestCase, APIClient
 from rest_framework_simplejwt.tokens import AccessToken
 
-from .models import Competition, Participant, Applicant
+from .models import Competition, CompetitionManager, Participant, Applicant
+from .serializers import ApplicationSerializer
 from ..users.models import Account
 
 
@@ -193,3 +202,449 @@ class ApplicationViewSetTestCase(APITestCase):
         }
         res = self.client.post(url, data, headers={"Authorization": f"Bearer {token}"})
         self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+class ApplicationEligibilityTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        cls.token = AccessToken.for_user(cls.account)
+        cls.competition = Competition.objects.create(title="Test Competition")
+
+    def register(self, **data):
+        return self.client.post(
+            "/api/applications/register/",
+            {
+                "competition": self.competition.id,
+                "displayed_name": "d_name",
+                "hidden_name": "h_name",
+                **data,
+            },
+            headers={"Authorization": f"Bearer {self.token}"} if not data else {},
+        )
+
+    def test_rejection_does_not_depend_on_roster_size(self):
+        Applicant.objects.create(
+            account=self.account,
+            competition=self.competition,
+            displayed_name="applicant",
+            hidden_name="applicant",
+        )
+        # 인증, 대회와 신청 여부를 함께 읽는 쿼리 한 번
+        with self.assertNumQueries(2):
+            self.assertEqual(self.register().status_code, status.HTTP_409_CONFLICT)
+        Applicant.objects.bulk_create(
+            [
+                Applicant(
+                    competition=self.competition,
+                    access_id=f"access{i}",
+                    displayed_name=f"applicant{i}",
+                    hidden_name=f"applicant{i}",
+                )
+                for i in range(2000)
+            ]
+        )
+        with self.assertNumQueries(2):
+            self.assertEqual(self.register().status_code, status.HTTP_409_CONFLICT)
+        with self.assertNumQueries(1):
+            res = self.register(access_id="access7", access_password="password")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_eligibility_uses_partial_unique_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(
+                f"EXPLAIN SELECT 1 FROM {Applicant._meta.db_table} "
+                "WHERE competition_id = %s AND account_id = %s",
+                [self.competition.id, self.account.id],
+            )
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        self.assertIn("unique_applicant_account", plan)
+
+
+class ConcurrentApplicationTestCase(TransactionTestCase):
+    NUM_OF_THREADS = 8
+
+    def test_concurrent_submissions_create_one_applicant(self):
+        account = Account.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        competition = Competition.objects.create(title="Test Competition")
+        token = AccessToken.for_user(account)
+        barrier = threading.Barrier(self.NUM_OF_THREADS)
+        status_codes = []
+
+        def register():
+            try:
+                barrier.wait()
+                res = APIClient().post(
+                    "/api/applications/register/",
+                    {
+                        "competition": competition.id,
+                        "displayed_name": "d_name",
+                        "hidden_name": "h_name",
+                    },
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+                status_codes.append(res.status_code)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=register) for _ in range(self.NUM_OF_THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(status_codes.count(status.HTTP_200_OK), 1)
+        self.assertEqual(
+            status_codes.count(status.HTTP_409_CONFLICT), self.NUM_OF_THREADS - 1
+        )
+        self.assertEqual(Applicant.objects.filter(account=account).count(), 1)
+        competition.refresh_from_db()
+        self.assertEqual(competition.num_of_applicants, 1)
+
+
+class CapacityTestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.competition = Competition.objects.create(
+            title="Test Competition", capacity=2, waitlist_capacity=1
+        )
+
+    def register(self, i):
+        return self.client.post(
+            "/api/applications/register/",
+            {
+                "competition": self.competition.id,
+                "access_id": f"access{i}",
+                "access_password": "password",
+                "displayed_name": "d_name",
+                "hidden_name": "h_name",
+            },
+        )
+
+    def test_admit_waitlist_and_reject(self):
+        results = [self.register(i).data for i in range(3)]
+        self.assertEqual(
+            [(r["ticket"], r["is_waitlisted"]) for r in results],
+            [(1, False), (2, False), (3, True)],
+        )
+        with mock.patch(
+            "compartytion.competitions.models.make_password"
+        ) as hasher, self.assertNumQueries(1):
+            res = self.register(3)
+        hasher.assert_not_called()
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            list(Applicant.objects.order_by("ticket").values_list("is_waitlisted")),
+            [(False,), (False,), (True,)],
+        )
+
+    def test_full_after_stale_read(self):
+        self.register(0)
+        Competition.objects.filter(pk=self.competition.pk).update(num_of_applicants=3)
+        # 검증 때 읽은 인원 수로는 자리가 있어도 발급 UPDATE 가 막는다.
+        with mock.patch.object(Competition, "is_full", return_value=False):
+            res = self.register(1)
+        self.assertEqual(res.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(Applicant.objects.count(), 1)
+
+    def test_without_capacity(self):
+        Competition.objects.filter(pk=self.competition.pk).update(capacity=None)
+        res = self.register(0)
+        self.assertEqual(res.data["ticket"], None)
+        self.competition.refresh_from_db()
+        self.assertEqual(self.competition.last_ticket, 0)
+
+    def test_failed_insert_returns_seat(self):
+        self.register(0)
+        # 검증을 지나친 중복 신청은 유니크 인덱스에서 막히고, 받은 자리도 함께 롤백된다.
+        with mock.patch.object(
+            ApplicationSerializer, "validate", lambda self, data: data
+        ):
+            res = self.register(0)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.competition.refresh_from_db()
+        self.assertEqual(
+            (self.competition.last_ticket, self.competition.num_of_applicants), (1, 1)
+        )
+        self.assertEqual(self.register(1).data["is_waitlisted"], False)
+
+    def test_freed_seat_promotes_waitlist(self):
+        for i in range(3):
+            self.register(i)
+        self.assertEqual(self.register(3).status_code, status.HTTP_409_CONFLICT)
+        Applicant.objects.get(access_id="access0").delete()
+        self.assertEqual(
+            list(
+                Applicant.objects.order_by("ticket").values_list(
+                    "ticket", "is_waitlisted"
+                )
+            ),
+            [(2, False), (3, False)],
+        )
+        # 빈 대기 자리로 다시 받을 수 있다.
+        self.assertEqual(self.register(3).data["is_waitlisted"], True)
+
+    def test_deleting_waitlisted_keeps_seats(self):
+        for i in range(3):
+            self.register(i)
+        Applicant.objects.get(access_id="access2").delete()
+        self.assertFalse(Applicant.objects.filter(is_waitlisted=True).exists())
+        self.assertEqual(self.register(3).data["is_waitlisted"], True)
+
+    def test_raising_capacity_promotes_waitlist(self):
+        creator = Account.objects.create_user(
+            email="creator@example.com", password="password", username="creator"
+        )
+        Competition.objects.filter(pk=self.competition.pk).update(creator=creator)
+        for i in range(3):
+            self.register(i)
+        res = self.client.patch(
+            f"/api/competitions/{self.competition.id}/",
+            {"capacity": 3},
+            headers={"Authorization": f"Bearer {AccessToken.for_user(creator)}"},
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(Applicant.objects.filter(is_waitlisted=True).exists())
+
+    def test_hashes_before_taking_seat(self):
+        # 멱등 키가 있으면 뷰 전체가 한 트랜잭션이므로, 대회 행을 잠근 채 해싱하지 않아야 한다.
+        calls = []
+        admit = CompetitionManager.admit
+
+        def recording_admit(manager, competition_id):
+            calls.append("admit")
+            return admit(manager, competition_id)
+
+        def recording_make_password(*args, **kwargs):
+            calls.append("hash")
+            return make_password(*args, **kwargs)
+
+        with mock.patch.object(
+            CompetitionManager, "admit", recording_admit
+        ), mock.patch(
+            "compartytion.competitions.models.make_password", recording_make_password
+        ):
+            res = self.client.post(
+                "/api/applications/register/",
+                {
+                    "competition": self.competition.id,
+                    "access_id": "access0",
+                    "access_password": "password",
+                    "displayed_name": "d_name",
+                    "hidden_name": "h_name",
+                },
+                headers={"Idempotency-Key": "key"},
+            )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(calls, ["hash", "admit"])
+
+    def test_accept_skips_waitlisted(self):
+        for i in range(3):
+            self.register(i)
+        ids = list(Applicant.objects.order_by("ticket").values_list("id", flat=True))
+        accepted = Participant.objects.accept_applicants(self.competition.pk, ids)
+        self.assertEqual(len(accepted), 2)
+        self.assertEqual(
+            list(Applicant.objects.values_list("ticket", "is_waitlisted")),
+            [(3, True)],
+        )
+
+
+class ConcurrentCapacityTestCase(TransactionTestCase):
+    NUM_OF_REQUESTS = 100
+    NUM_OF_THREADS = 16
+
+    def test_concurrent_registrations_respect_capacity(self):
+        competition = Competition.objects.create(
+            title="Test Competition", capacity=8, waitlist_capacity=4
+        )
+        hashed = []
+
+        def counting_make_password(*args, **kwargs):
+            hashed.append(1)
+            return make_password(*args, **kwargs)
+
+        def register(i):
+            try:
+                return APIClient().post(
+                    "/api/applications/register/",
+                    {
+                        "competition": competition.id,
+                        "access_id": f"access{i}",
+                        "access_password": "password",
+                        "displayed_name": "d_name",
+                        "hidden_name": "h_name",
+                    },
+                )
+            finally:
+                connection.close()
+
+        with mock.patch(
+            "compartytion.competitions.models.make_password", counting_make_password
+        ), ThreadPoolExecutor(max_workers=self.NUM_OF_THREADS) as executor:
+            responses = list(executor.map(register, range(self.NUM_OF_REQUESTS)))
+
+        codes = [res.status_code for res in responses]
+        self.assertEqual(codes.count(status.HTTP_200_OK), 12)
+        self.assertEqual(codes.count(status.HTTP_409_CONFLICT), 88)
+        # 해싱은 자리를 받기 전에 하므로, 다 찬 것을 아직 읽지 못한 요청 몇 개도 해싱한다.
+        self.assertGreaterEqual(len(hashed), 12)
+        tickets = Applicant.objects.order_by("ticket").values_list(
+            "ticket", "is_waitlisted"
+        )
+        self.assertEqual(list(tickets), [(i, i > 8) for i in range(1, 13)])
+        competition.refresh_from_db()
+        self.assertEqual(competition.num_of_applicants, 12)
+
+
+class CompetitionConditionalGetTestCase(APITestCase):
+    URL_PREFIX = "/api/competitions"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.competition = Competition.objects.create(
+            creator=cls.creator, title="Test Competition"
+        )
+        cls.token = AccessToken.for_user(cls.creator)
+
+    def get(self, url, **headers):
+        return self.client.get(
+            url, headers={"Authorization": f"Bearer {self.token}", **headers}
+        )
+
+    def test_retrieve_not_modified(self):
+        url = f"{self.URL_PREFIX}/{self.competition.id}/"
+        res = self.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("Last-Modified", res.headers)
+        etag = res.headers["ETag"]
+
+        with self.assertNumQueries(2):
+            res = self.get(url, **{"If-None-Match": etag})
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res.headers["ETag"], etag)
+
+    def test_retrieve_modified_by_new_participant(self):
+        url = f"{self.URL_PREFIX}/{self.competition.id}/"
+        etag = self.get(url).headers["ETag"]
+        Participant.objects.create(
+            competition=self.competition,
+            order=1,
+            displayed_name="participant1",
+            hidden_name="participant1",
+        )
+        res = self.get(url, **{"If-None-Match": etag})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res.headers["ETag"], etag)
+
+    def test_preview_not_modified_since(self):
+        url = f"{self.URL_PREFIX}/{self.competition.id}/preview/"
+        last_modified = self.client.get(url).headers["Last-Modified"]
+        res = self.client.get(url, headers={"If-Modified-Since": last_modified})
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_preview_modified_by_registration(self):
+        url = f"{self.URL_PREFIX}/{self.competition.id}/preview/"
+        etag = self.client.get(url).headers["ETag"]
+        res = self.client.post(
+            "/api/applications/register/",
+            {
+                "competition": self.competition.id,
+                "access_id": "applicant1",
+                "access_password": "password",
+                "email": "user@example.com",
+                "displayed_name": "d_name",
+                "hidden_name": "h_name",
+            },
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        res = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["num_of_applicants"], 1)
+
+    def test_participant_list_ignores_applicant_changes(self):
+        url = f"{self.URL_PREFIX}/{self.competition.id}/participants/"
+        etag = self.get(url).headers["ETag"]
+        Applicant.objects.create(
+            competition=self.competition,
+            displayed_name="applicant1",
+            hidden_name="applicant1",
+        )
+        res = self.get(url, **{"If-None-Match": etag})
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        url = f"{self.URL_PREFIX}/{self.competition.id}/applicants/"
+        res = self.get(url, **{"If-None-Match": etag})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+class CompetitionColumnsTestCase(APITestCase):
+    URL_PREFIX = "/api/competitions"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.creator = Account.objects.create_user(
+            email="user1@example", password="password", username="user1"
+        )
+        cls.competition = Competition.objects.create(
+            creator=cls.creator,
+            title="Test Competition",
+            content={"body": "x" * 1000},
+            tournament={"format": "single_elimination", "rounds": []},
+        )
+        cls.token = AccessToken.for_user(cls.creator)
+
+    def get(self, url, **headers):
+        return self.client.get(
+            url, headers={"Authorization": f"Bearer {self.token}", **headers}
+        )
+
+    def competition_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res, [
+            q["sql"]
+            for q in queries.captured_queries
+            if 'FROM "competitions_competition"' in q["sql"]
+        ]
+
+    def test_list_reads_rendered_columns_only(self):
+        for url in [
+            f"{self.URL_PREFIX}/me/",
+            f"{self.URL_PREFIX}/{self.competition.id}/preview/",
+        ]:
+            _, queries = self.competition_queries(url)
+            for sql in queries:
+                self.assertNotIn('"competitions_competition"."tournament"', sql)
+                self.assertNotIn('"competitions_competition"."content"', sql)
+
+    def test_detail_reads_tournament_from_sub_resource(self):
+        res, queries = self.competition_queries(
+            f"{self.URL_PREFIX}/{self.competition.id}/"
+        )
+        self.assertEqual(res.data["content"], {"body": "x" * 1000})
+        for sql in queries:
+            self.assertNotIn('"competitions_competition"."tournament"', sql)
+
+        url = f"{self.URL_PREFIX}/{self.competition.id}/tournament/"
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, {"format": "single_elimination", "rounds": []})
+        res = self.client.get(url, headers={"If-None-Match": res.headers["ETag"]})
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        res = self.client.get(
+            f"{self.URL_PREFIX}/00000000-0000-0000-0000-000000000000/tournament/"
+        )
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,195 @@
+from typing import Any, Dict, List, Optional
+
+BYE = -1
+NONE = -1
+
+WINNERS = 0
+LOSERS = 1
+GRAND_FINAL = 2
+
+
+def seeding_order(size: int) -> List[int]:
+    """
+    대진표 크기 `size`(2의 거듭제곱)에 대한 표준 시드 배치.
+    1번과 2번 시드가 결승에서야 만나도록 [1, 8, 4, 5, 2, 7, 3, 6] 처럼 배치한다.
+    """
+    order = [1]
+    while len(order) < size:
+        total = len(order) * 2 + 1
+        order = [s for seed in order for s in (seed, total - seed)]
+    return order
+
+
+class Bracket:
+    """
+    배열 인덱스 기반의 토너먼트 대진표.
+
+    경기 m 의 두 자리는 slots[2m](홈), slots[2m + 1](원정)이다.
+    자리에는 entrants 의 인덱스(시드 - 1), 부전승(BYE) 또는 미정(None)이 들어간다.
+    winner_to/loser_to 는 승자/패자가 들어갈 자리 인덱스이고, 없으면 -1 이다.
+    results 는 이긴 쪽(0: 홈, 1: 원정)이며 아직 치르지 않은 경기는 None 이다.
+    """
+
+    SINGLE_ELIMINATION = "single_elimination"
+    DOUBLE_ELIMINATION = "double_elimination"
+    FORMATS = (SINGLE_ELIMINATION, DOUBLE_ELIMINATION)
+
+    def __init__(self, format: str, entrants: List[Any], size: int):
+        self.format = format
+        self.entrants = list(entrants)
+        self.size = size
+        self.stages: List[int] = []
+        self.rounds: List[int] = []
+        self.slots: List[Optional[int]] = []
+        self.results: List[Optional[int]] = []
+        self.winner_to: List[int] = []
+        self.loser_to: List[int] = []
+
+    @property
+    def num_of_matches(self) -> int:
+        return len(self.rounds)
+
+    def add_matches(self, stage: int, round: int, count: int) -> int:
+        start = len(self.rounds)
+        self.stages += [stage] * count
+        self.rounds += [round] * count
+        self.slots += [None] * (2 * count)
+        self.results += [None] * count
+        self.winner_to += [NONE] * count
+        self.loser_to += [NONE] * count
+        return start
+
+    @classmethod
+    def generate(cls, format: str, entrants: List[Any]) -> "Bracket":
+        if format not in cls.FORMATS:
+            raise ValueError(f"unknown bracket format: {format}")
+        if len(entrants) < 2:
+            raise ValueError("a bracket needs at least two entrants")
+        size = 1 << (len(entrants) - 1).bit_length()
+        bracket = cls(format, entrants, size)
+        winners = bracket.build_winners()
+        if format == cls.DOUBLE_ELIMINATION:
+            bracket.build_losers(winners)
+
+        for match, seed in enumerate(seeding_order(size)):
+            bracket.slots[match] = seed - 1 if seed <= len(entrants) else BYE
+        for match in range(size // 2):
+            bracket.resolve_bye(match)
+        return bracket
+
+    def build_winners(self) -> List[int]:
+        """승자조를 만들고 라운드별 첫 경기 인덱스를 반환한다."""
+        starts = []
+        count, round = self.size // 2, 1
+        while count:
+            starts.append(self.add_matches(WINNERS, round, count))
+            count, round = count // 2, round + 1
+        for round_index in range(len(starts) - 1):
+            start, next_start = starts[round_index], starts[round_index + 1]
+            for j in range(next_start - start):
+                self.winner_to[start + j] = 2 * (next_start + j // 2) + j % 2
+        return starts
+
+    def build_losers(self, winners: List[int]) -> None:
+        """
+        패자조와 그랜드 파이널을 만든다.
+        패자조 짝수 라운드에는 승자조에서 떨어진 참가자들이 합류하며,
+        같은 상대와 바로 다시 만나지 않도록 라운드마다 합류 순서를 뒤집는다.
+        그랜드 파이널의 리셋 경기는 두지 않는다.
+        """
+        k = len(winners)
+        previous = None
+        for i in range(1, k):
+            count = self.size >> (i + 1)
+            if i == 1:
+                odd = self.add_matches(LOSERS, 1, count)
+                for j in range(2 * count):
+                    self.loser_to[winners[0] + j] = 2 * (odd + j // 2) + j % 2
+            else:
+                odd = self.add_matches(LOSERS, 2 * i - 1, count)
+                for j in range(2 * count):
+                    self.winner_to[previous + j] = 2 * (odd + j // 2) + j % 2
+
+            even = self.add_matches(LOSERS, 2 * i, count)
+            for j in range(count):
+                self.winner_to[odd + j] = 2 * (even + j)
+                dropped = count - 1 - j if i % 2 else j
+                self.loser_to[winners[i] + dropped] = 2 * (even + j) + 1
+            previous = even
+
+        final = self.add_matches(GRAND_FINAL, k + 1, 1)
+        self.winner_to[winners[-1]] = 2 * final
+        if previous is None:
+            self.loser_to[winners[0]] = 2 * final + 1
+        else:
+            self.winner_to[previous] = 2 * final + 1
+
+    def place(self, slot: int, value: int) -> None:
+        if slot == NONE:
+            return
+        self.slots[slot] = value
+        self.resolve_bye(slot // 2)
+
+    def resolve_bye(self, match: int) -> None:
+        home, away = self.slots[2 * match], self.slots[2 * match + 1]
+        if self.results[match] is not None or home is None or away is None:
+            return
+        if home == BYE:
+            self.finish(match, 1)
+        elif away == BYE:
+            self.finish(match, 0)
+
+    def finish(self, match: int, winner_side: int) -> None:
+        self.results[match] = winner_side
+        winner = self.slots[2 * match + winner_side]
+        loser = self.slots[2 * match + 1 - winner_side]
+        self.place(self.winner_to[match], winner)
+        self.place(self.loser_to[match], loser)
+
+    def report(self, match: int, winner_side: int) -> None:
+        if winner_side not in (0, 1):
+            raise ValueError("winner_side must be 0 or 1")
+        home, away = self.slots[2 * match], self.slots[2 * match + 1]
+        if self.results[match] is not None:
+            raise ValueError("match already has a result")
+        if home is None or away is None:
+            raise ValueError("match is not ready")
+        self.finish(match, winner_side)
+
+    @property
+    def final(self) -> int:
+        """승자가 더 올라갈 자리가 없는 마지막 경기."""
+        return self.num_of_matches - 1
+
+    def winner(self, match: int) -> Optional[Any]:
+        if self.results[match] is None:
+            return None
+        index = self.slots[2 * match + self.results[match]]
+        return None if index == BYE else self.entrants[index]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "format": self.format,
+            "size": self.size,
+            "entrants": self.entrants,
+            "stages": self.stages,
+            "rounds": self.rounds,
+            "slots": self.slots,
+            "results": self.results,
+            "winner_to": self.winner_to,
+            "loser_to": self.loser_to,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Bracket":
+        bracket = cls(data["format"], data["entrants"], data["size"])
+        for key in (
+            "stages",
+            "rounds",
+            "slots",
+            "results",
+            "winner_to",
+            "loser_to",
+        ):
+            setattr(bracket, key, list(data[key]))
+        return bracket
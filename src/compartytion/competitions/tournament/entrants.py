@@ -0,0 +1,36 @@
+from typing import List, Tuple
+
+from django.db.models import Avg, F
+
+from ..models import Competition, Participant, Team
+
+ORDER = "order"
+RATING = "rating"
+
+
+def get_entrant_ids(competition: Competition, seeding: str = ORDER) -> List[int]:
+    """
+    팀 게임이면 팀, 아니면 참가자들의 id 를 시드 순서대로 반환한다.
+    `seeding` 이 rating 이면 계정 레이팅(팀은 팀원 평균)이 높은 순이고,
+    레이팅이 없으면 뒤로 가며 같으면 순서를 따른다.
+    """
+    model = Team if competition.is_team_game else Participant
+    queryset = model.objects.filter(competition_id=competition.pk)
+    if seeding == RATING:
+        if competition.is_team_game:
+            queryset = queryset.annotate(
+                strength=Avg("participant__account__rating__rating")
+            )
+        else:
+            queryset = queryset.annotate(strength=F("account__rating__rating"))
+        queryset = queryset.order_by(F("strength").desc(nulls_last=True), "order")
+    else:
+        queryset = queryset.order_by("order")
+    return list(queryset.values_list("id", flat=True))
+
+
+def get_side_fields(is_team_game: bool) -> Tuple[str, str]:
+    """경기의 홈/원정 자리로 쓸 Match 필드 이름."""
+    if is_team_game:
+        return "home_team", "away_team"
+    return "home", "away"
@@ -0,0 +1,216 @@
+import json
+from typing import Any, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+
+from ..exceptions import InvalidRequest
+from ..models import Competition, Match
+from ..ordering import lock_competition
+from .bracket import BYE, NONE, Bracket
+from .entrants import get_side_fields
+from .swiss import Swiss
+from .standings import apply_result, reset_standings
+
+HOME, AWAY, DRAW = Match.SideChoices.values
+
+
+def build_match(competition: Competition, data: Any, position: int, **fields) -> Match:
+    """배열 인덱스 표현의 경기 하나를 Match 로 만든다."""
+    match = Match(competition_id=competition.pk, position=position, **fields)
+    for side, field in enumerate(get_side_fields(competition.is_team_game)):
+        value = data.slots[2 * position + side]
+        if value == BYE:
+            match.bye = side if match.bye is None else match.bye
+        elif value is not None:
+            setattr(match, f"{field}_id", data.entrants[value])
+    return match
+
+
+def save_bracket(competition: Competition, bracket: Bracket) -> None:
+    """대회의 경기들을 대진표의 경기들로 바꾸고 tournament 에 대진표를 저장한다."""
+    with transaction.atomic():
+        lock_competition(competition.pk)
+        Match.objects.filter(competition_id=competition.pk).delete()
+        Match.objects.bulk_create(
+            [
+                build_match(
+                    competition,
+                    bracket,
+                    m,
+                    stage=bracket.stages[m],
+                    round=bracket.rounds[m],
+                    slot=m,
+                    winner=bracket.results[m],
+                    winner_to=(
+                        None if bracket.winner_to[m] == NONE else bracket.winner_to[m]
+                    ),
+                    loser_to=(
+                        None if bracket.loser_to[m] == NONE else bracket.loser_to[m]
+                    ),
+                )
+                for m in range(bracket.num_of_matches)
+            ],
+            batch_size=1000,
+        )
+        reset_standings(competition, bracket.entrants)
+        competition.tournament = bracket.to_json()
+        competition.save(update_fields=["tournament", "updated_at"])
+
+
+def save_swiss_round(competition: Competition, swiss: Swiss, round: int) -> None:
+    """새로 짝지은 스위스 라운드의 경기들을 추가하고 tournament 를 저장한다."""
+    with transaction.atomic():
+        if round == 1:
+            Match.objects.filter(competition_id=competition.pk).delete()
+            reset_standings(competition, swiss.entrants)
+        matches = Match.objects.bulk_create(
+            [
+                build_match(
+                    competition,
+                    swiss,
+                    m,
+                    round=round,
+                    slot=m,
+                    winner=swiss.results[m],
+                )
+                for m in range(swiss.num_of_matches)
+                if swiss.rounds[m] == round
+            ],
+            batch_size=1000,
+        )
+        # 부전승은 결과가 정해진 채로 만들어지므로 여기서 순위표에 반영한다.
+        for match in matches:
+            if match.bye is not None:
+                apply_result(competition.pk, competition.is_team_game, match)
+        competition.tournament = swiss.to_json()
+        competition.save(update_fields=["tournament", "updated_at"])
+
+
+class ResultReporter:
+    """
+    경기 결과를 입력하고, 대진표라면 승자/패자를 다음 경기 자리로 올린다.
+
+    대회 행은 FOR KEY SHARE 로만 잠가 서로 다른 경기의 결과 입력은 동시에 진행되고,
+    대진표를 새로 만드는 작업(FOR UPDATE)과는 겹치지 않는다.
+    경기 행들은 진출 방향(앞 라운드 → 뒤 라운드)으로만 잠그므로 교착이 생기지 않는다.
+    tournament 는 바뀐 배열 원소만 jsonb_set 으로 고친다.
+    """
+
+    def __init__(self, competition_id):
+        self.competition_id = competition_id
+        self.edits: List[Tuple[List[str], Any]] = []
+        self._entrants: Optional[List[Any]] = None
+        self.is_team_game = False
+        self.side_fields = get_side_fields(False)
+        self.now = timezone.now()
+
+    def lock_match(self, **lookup) -> Match:
+        return Match.objects.select_for_update().get(
+            competition_id=self.competition_id, **lookup
+        )
+
+    @property
+    def entrants(self) -> List[Any]:
+        if self._entrants is None:
+            self._entrants = (
+                Competition.objects.filter(pk=self.competition_id)
+                .values_list("tournament__entrants", flat=True)
+                .get()
+            )
+        return self._entrants
+
+    def side_ids(self, match: Match) -> Tuple[Optional[int], Optional[int]]:
+        home, away = self.side_fields
+        return getattr(match, f"{home}_id"), getattr(match, f"{away}_id")
+
+    def is_ready(self, match: Match) -> bool:
+        home, away = self.side_ids(match)
+        return (home is not None or match.bye == HOME) and (
+            away is not None or match.bye == AWAY
+        )
+
+    def report(
+        self,
+        match_id: int,
+        home_score: int,
+        away_score: int,
+        winner: Optional[int] = None,
+    ) -> Match:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT is_team_game, tournament ->> 'format' "
+                    f"FROM {Competition._meta.db_table} WHERE id = %s FOR KEY SHARE",
+                    [self.competition_id],
+                )
+                row = cursor.fetchone()
+            if row is None:
+                raise NotFound
+            self.is_team_game, format = row
+            self.side_fields = get_side_fields(self.is_team_game)
+            try:
+                match = self.lock_match(pk=match_id)
+            except Match.DoesNotExist:
+                raise NotFound
+            if match.winner is not None:
+                raise InvalidRequest(_("이미 결과가 입력된 경기입니다."))
+            if match.bye is not None or not self.is_ready(match):
+                raise InvalidRequest(_("아직 상대가 정해지지 않은 경기입니다."))
+
+            if winner is None:
+                if home_score == away_score:
+                    winner = DRAW
+                else:
+                    winner = HOME if home_score > away_score else AWAY
+            if winner == DRAW and format in Bracket.FORMATS:
+                raise InvalidRequest(_("토너먼트 경기는 무승부로 끝날 수 없습니다."))
+
+            match.home_score, match.away_score = home_score, away_score
+            self.finish(match, winner)
+            apply_result(self.competition_id, self.is_team_game, match)
+            self.save_projection()
+        return match
+
+    def finish(self, match: Match, winner: int) -> None:
+        match.winner = winner
+        match.reported_at = self.now
+        match.save(update_fields=["home_score", "away_score", "winner", "reported_at"])
+        if match.position is not None:
+            self.edits.append((["results", str(match.position)], winner))
+        if winner == DRAW:
+            return
+
+        sides = self.side_ids(match)
+        self.place(match.winner_to, sides[winner])
+        if match.bye is None:
+            self.place(match.loser_to, sides[1 - winner])
+
+    def place(self, slot: Optional[int], entrant_id: Optional[int]) -> None:
+        if slot is None or entrant_id is None:
+            return
+        target = self.lock_match(position=slot // 2)
+        field = self.side_fields[slot % 2]
+        setattr(target, f"{field}_id", entrant_id)
+        target.save(update_fields=[field])
+        self.edits.append((["slots", str(slot)], self.entrants.index(entrant_id)))
+
+        # 상대 자리가 부전승이면 곧바로 다음 경기로 올라간다.
+        if target.bye is not None and target.winner is None:
+            self.finish(target, 1 - target.bye)
+
+    def save_projection(self) -> None:
+        if not self.edits:
+            return
+        expression, params = "tournament", []
+        for path, value in self.edits:
+            expression = f"jsonb_set({expression}, %s, %s::jsonb)"
+            params += [path, json.dumps(value)]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {Competition._meta.db_table} "
+                f"SET tournament = {expression}, updated_at = %s WHERE id = %s",
+                params + [self.now, self.competition_id],
+            )
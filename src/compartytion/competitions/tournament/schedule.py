@@ -0,0 +1,161 @@
+from typing import List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import Competition, Match
+from ..ordering import lock_competition
+from .entrants import ORDER, get_entrant_ids, get_side_fields
+from .standings import reset_standings
+
+ROUND_ROBIN = "round_robin"
+
+
+def circle_rounds(num_of_entrants: int) -> List[List[Tuple[int, int]]]:
+    """
+    서클 방식의 풀리그 대진. 라운드별 (홈, 원정) 인덱스 쌍 목록을 반환한다.
+    0번을 고정하고 나머지를 한 칸씩 돌린다. 인원이 홀수면 쉬는 자리를 하나 두고
+    그 자리와의 경기는 빼므로, 라운드마다 한 명씩 쉰다.
+    고정된 0번은 라운드마다 홈/원정을 번갈아 맡는다.
+    """
+    players: List[Optional[int]] = list(range(num_of_entrants))
+    if num_of_entrants % 2:
+        players.append(None)
+    n = len(players)
+    rounds = []
+    for round in range(n - 1):
+        pairs = []
+        for i in range(n // 2):
+            home, away = players[i], players[n - 1 - i]
+            if i == 0 and round % 2:
+                home, away = away, home
+            if home is not None and away is not None:
+                pairs.append((home, away))
+        rounds.append(pairs)
+        players = [players[0], players[-1]] + players[1:-1]
+    return rounds
+
+
+def split_groups(num_of_entrants: int, num_of_groups: int) -> List[List[int]]:
+    """
+    시드 순서대로 뱀 모양(1→G, G→1 ...)으로 조를 나눠 조별 전력을 맞춘다.
+    각 조에 속한 인덱스 목록을 반환한다.
+    """
+    groups: List[List[int]] = [[] for _ in range(num_of_groups)]
+    for index in range(num_of_entrants):
+        line, position = divmod(index, num_of_groups)
+        group = position if line % 2 == 0 else num_of_groups - 1 - position
+        groups[group].append(index)
+    return groups
+
+
+def assign_slots(
+    matches: List[Tuple[int, int, int, int]],
+    rest: int = 0,
+    capacity: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """
+    (라운드, 조, 홈, 원정) 순으로 정렬된 경기들에 (시간대, 경기장)을 정해준다.
+    한 참가자는 경기 사이에 `rest` 개 이상의 시간대를 쉬고,
+    한 시간대에는 `capacity` 경기까지만 열린다. 가능한 가장 이른 시간대를 고르는 greedy 방식이다.
+    """
+    last_slot = {}
+    usage: List[int] = []
+    first_open = 0
+    assigned = []
+    for _, _, home, away in matches:
+        slot = max(
+            first_open,
+            last_slot.get(home, -rest - 1) + rest + 1,
+            last_slot.get(away, -rest - 1) + rest + 1,
+        )
+        while True:
+            if slot >= len(usage):
+                usage.extend([0] * (slot - len(usage) + 1))
+            if capacity is None or usage[slot] < capacity:
+                break
+            slot += 1
+        assigned.append((slot, usage[slot]))
+        usage[slot] += 1
+        last_slot[home] = last_slot[away] = slot
+        while capacity is not None and first_open < len(usage):
+            if usage[first_open] < capacity:
+                break
+            first_open += 1
+    return assigned
+
+
+def build_schedule(
+    num_of_entrants: int,
+    num_of_groups: int = 1,
+    rest: int = 0,
+    capacity: Optional[int] = None,
+) -> List[Tuple[int, int, int, int, int, int]]:
+    """
+    조별 풀리그 일정을 만든다. (조, 라운드, 시간대, 경기장, 홈, 원정) 목록을 반환하며
+    홈/원정은 시드 순서의 인덱스이다.
+    같은 라운드의 경기가 모든 조에 걸쳐 먼저 배정되도록 라운드 순으로 섞는다.
+    """
+    if num_of_groups < 1 or num_of_entrants < 2 * num_of_groups:
+        raise ValueError("each group needs at least two entrants")
+
+    matches = []
+    for group, members in enumerate(split_groups(num_of_entrants, num_of_groups)):
+        for round, pairs in enumerate(circle_rounds(len(members)), start=1):
+            for home, away in pairs:
+                matches.append((round, group, members[home], members[away]))
+    matches.sort(key=lambda match: match[:2])
+
+    return [
+        (group, round, slot, venue, home, away)
+        for (round, group, home, away), (slot, venue) in zip(
+            matches, assign_slots(matches, rest, capacity)
+        )
+    ]
+
+
+def create_schedule(
+    competition: Competition,
+    num_of_groups: int = 1,
+    rest: int = 0,
+    capacity: Optional[int] = None,
+    seeding: str = ORDER,
+) -> int:
+    """
+    대회의 기존 경기들을 지우고 조별 풀리그 일정을 만든다.
+    참가자(팀) 명단은 id 만 한 번 읽는다.
+    """
+    with transaction.atomic():
+        lock_competition(competition.pk)
+        entrant_ids = get_entrant_ids(competition, seeding)
+        schedule = build_schedule(len(entrant_ids), num_of_groups, rest, capacity)
+        home_field, away_field = get_side_fields(competition.is_team_game)
+        Match.objects.filter(competition_id=competition.pk).delete()
+        Match.objects.bulk_create(
+            [
+                Match(
+                    competition_id=competition.pk,
+                    group=group,
+                    round=round,
+                    slot=slot,
+                    venue=venue,
+                    **{
+                        f"{home_field}_id": entrant_ids[home],
+                        f"{away_field}_id": entrant_ids[away],
+                    },
+                )
+                for group, round, slot, venue, home, away in schedule
+            ],
+            batch_size=1000,
+        )
+        reset_standings(competition, entrant_ids)
+        Competition.objects.filter(pk=competition.pk).update(
+            tournament={
+                "format": ROUND_ROBIN,
+                "groups": num_of_groups,
+                "rest": rest,
+                "capacity": capacity,
+            },
+            updated_at=timezone.now(),
+        )
+    return len(schedule)
@@ -0,0 +1,263 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from ..models import Competition, Match, Standing
+from ..ordering import lock_competition
+from .swiss import Swiss
+
+HOME, AWAY, DRAW = Match.SideChoices.values
+
+STAT_FIELDS = [
+    "played",
+    "wins",
+    "draws",
+    "losses",
+    "points",
+    "score_for",
+    "score_against",
+    "buchholz",
+    "head_to_head",
+]
+
+
+def get_points() -> Dict[str, int]:
+    return getattr(settings, "STANDINGS_POINTS", {"win": 3, "draw": 1, "loss": 0})
+
+
+def get_entrant_field(is_team_game: bool) -> str:
+    return "team" if is_team_game else "participant"
+
+
+def get_match_columns(is_team_game: bool) -> Tuple[str, str]:
+    return ("home_team_id", "away_team_id") if is_team_game else ("home_id", "away_id")
+
+
+def gained_points(winner: int) -> Tuple[int, int]:
+    """결과에 따른 (홈, 원정) 승점."""
+    points = get_points()
+    if winner == DRAW:
+        return points["draw"], points["draw"]
+    if winner == HOME:
+        return points["win"], points["loss"]
+    return points["loss"], points["win"]
+
+
+def result_fields(winner: int) -> Tuple[str, str]:
+    """결과에 따라 (홈, 원정) 쪽에서 하나 늘릴 전적 필드."""
+    if winner == DRAW:
+        return "draws", "draws"
+    if winner == HOME:
+        return "wins", "losses"
+    return "losses", "wins"
+
+
+def reset_standings(competition: Competition, entrant_ids: Iterable[int]) -> None:
+    """새 일정/대진표에 맞춰 순위표를 0 으로 다시 만든다."""
+    field = get_entrant_field(competition.is_team_game)
+    Standing.objects.filter(competition_id=competition.pk).delete()
+    Standing.objects.bulk_create(
+        [
+            Standing(competition_id=competition.pk, **{f"{field}_id": entrant_id})
+            for entrant_id in entrant_ids
+        ],
+        batch_size=1000,
+    )
+
+
+def apply_result(competition_id, is_team_game: bool, match: Match) -> None:
+    """
+    결과가 입력된 경기 하나만큼 순위표를 고친다.
+    두 참가자의 전적과 승점을 더하고, 부크홀츠는 바뀐 승점만큼
+    두 참가자의 예전 상대들에게 더한다. 승자승은 승점이 바뀐 점수대만 다시 계산한다.
+    스위스 부전승은 상대 없이 이긴 쪽만 1승으로 센다.
+    결과 입력은 동시에 진행되므로, 순위표를 고치는 동안만 대회 행을
+    FOR NO KEY UPDATE 로 잠가 순서를 맞춘다. (다른 결과 입력의 KEY SHARE 와는 충돌하지 않는다.)
+    """
+    table = Standing._meta.db_table
+    entrant = f"{get_entrant_field(is_team_game)}_id"
+    home_column, away_column = get_match_columns(is_team_game)
+    home_id = getattr(match, home_column)
+    away_id = getattr(match, away_column)
+    home_gain, away_gain = gained_points(match.winner)
+    home_result, away_result = result_fields(match.winner)
+    sides = [
+        (home_id, home_result, home_gain, match.home_score, match.away_score),
+        (away_id, away_result, away_gain, match.away_score, match.home_score),
+    ]
+    if match.bye is not None:
+        sides = [sides[1 - match.bye]]
+    entrant_ids = [side[0] for side in sides]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT 1 FROM {Competition._meta.db_table} "
+            "WHERE id = %s FOR NO KEY UPDATE",
+            [competition_id],
+        )
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (competition_id, {entrant}, {", ".join(STAT_FIELDS)})
+            SELECT %s, e, {", ".join(["0"] * len(STAT_FIELDS))}
+            FROM unnest(%s::bigint[]) AS e
+            ON CONFLICT (competition_id, {entrant}) WHERE {entrant} IS NOT NULL
+            DO NOTHING
+            """,
+            [competition_id, entrant_ids],
+        )
+
+        rows = {}
+        for entrant_id, result, gain, scored, conceded in sides:
+            cursor.execute(
+                f"""
+                UPDATE {table}
+                SET played = played + 1, {result} = {result} + 1,
+                    points = points + %s,
+                    score_for = score_for + %s, score_against = score_against + %s
+                WHERE competition_id = %s AND {entrant} = %s
+                RETURNING points
+                """,
+                [gain, scored or 0, conceded or 0, competition_id, entrant_id],
+            )
+            rows[entrant_id] = cursor.fetchone()[0]
+
+        # 예전 상대들(이번 경기 제외, 여러 번 만났으면 그만큼)의 부크홀츠가 바뀐 승점만큼 오른다.
+        cursor.execute(
+            f"""
+            SELECT {home_column}, {away_column} FROM {Match._meta.db_table}
+            WHERE competition_id = %s AND winner IS NOT NULL AND bye IS NULL
+                AND id <> %s
+                AND ({home_column} = ANY(%s) OR {away_column} = ANY(%s))
+            """,
+            [competition_id, match.id, entrant_ids, entrant_ids],
+        )
+        gains = {entrant_id: gain for entrant_id, _, gain, _, _ in sides}
+        deltas: Dict[int, int] = defaultdict(int)
+        for home, away in cursor.fetchall():
+            if home in gains:
+                deltas[away] += gains[home]
+            if away in gains:
+                deltas[home] += gains[away]
+        if match.bye is None:
+            deltas[home_id] += rows[away_id]
+            deltas[away_id] += rows[home_id]
+        cursor.execute(
+            f"""
+            UPDATE {table} AS s SET buchholz = s.buchholz + d.delta
+            FROM unnest(%s::bigint[], %s::integer[]) AS d(entrant, delta)
+            WHERE s.competition_id = %s AND s.{entrant} = d.entrant
+            """,
+            [list(deltas.keys()), list(deltas.values()), competition_id],
+        )
+
+        # 승점이 바뀐 두 참가자의 예전/지금 점수대에서만 동률 상대가 달라진다.
+        points = set(rows.values())
+        points |= {rows[entrant_id] - gains[entrant_id] for entrant_id in rows}
+        update_head_to_head(cursor, competition_id, is_team_game, points)
+
+
+def update_head_to_head(cursor, competition_id, is_team_game: bool, points) -> None:
+    """승점이 `points` 중 하나인 참가자들의 승자승 승점을 다시 계산한다."""
+    table = Standing._meta.db_table
+    entrant = f"{get_entrant_field(is_team_game)}_id"
+    home_column, away_column = get_match_columns(is_team_game)
+    points_of = get_points()
+    cursor.execute(
+        f"""
+        WITH tied AS (
+            SELECT id, {entrant} AS entrant, points FROM {table}
+            WHERE competition_id = %(competition_id)s AND points = ANY(%(points)s)
+        ), earned AS (
+            SELECT x.entrant, x.opponent, x.gain
+            FROM {Match._meta.db_table} AS m
+            CROSS JOIN LATERAL (VALUES
+                (m.{home_column}, m.{away_column},
+                 CASE m.winner WHEN 0 THEN %(win)s WHEN 2 THEN %(draw)s ELSE %(loss)s END),
+                (m.{away_column}, m.{home_column},
+                 CASE m.winner WHEN 1 THEN %(win)s WHEN 2 THEN %(draw)s ELSE %(loss)s END)
+            ) AS x(entrant, opponent, gain)
+            WHERE m.competition_id = %(competition_id)s
+                AND m.winner IS NOT NULL AND m.bye IS NULL
+        ), totals AS (
+            SELECT me.id, SUM(e.gain) AS total
+            FROM earned AS e
+            JOIN tied AS me ON me.entrant = e.entrant
+            JOIN tied AS other ON other.entrant = e.opponent AND other.points = me.points
+            GROUP BY me.id
+        )
+        UPDATE {table} AS s SET head_to_head = COALESCE(totals.total, 0)
+        FROM tied LEFT JOIN totals ON totals.id = tied.id
+        WHERE s.id = tied.id AND s.head_to_head <> COALESCE(totals.total, 0)
+        """,
+        {
+            "competition_id": competition_id,
+            "points": list(points),
+            "win": points_of["win"],
+            "draw": points_of["draw"],
+            "loss": points_of["loss"],
+        },
+    )
+
+
+def compute_standings(competition: Competition) -> Dict[int, Dict[str, int]]:
+    """입력된 모든 경기 결과로 순위표를 처음부터 계산한다. (검증/복구용)"""
+    home_column, away_column = get_match_columns(competition.is_team_game)
+    field = get_entrant_field(competition.is_team_game)
+    stats: Dict[int, Dict[str, int]] = {
+        entrant_id: dict.fromkeys(STAT_FIELDS, 0)
+        for entrant_id in Standing.objects.filter(
+            competition_id=competition.pk
+        ).values_list(f"{field}_id", flat=True)
+    }
+    matches = Match.objects.filter(competition_id=competition.pk, winner__isnull=False)
+    # 대진표의 부전승은 경기로 치지 않지만, 스위스 부전승은 1승으로 센다.
+    if (competition.tournament or {}).get("format") != Swiss.FORMAT:
+        matches = matches.filter(bye__isnull=True)
+    results: List[Tuple[int, int, int]] = []
+    for home, away, winner, bye, home_score, away_score in matches.values_list(
+        home_column, away_column, "winner", "bye", "home_score", "away_score"
+    ).iterator():
+        home_gain, away_gain = gained_points(winner)
+        home_result, away_result = result_fields(winner)
+        sides = [
+            (home, home_result, home_gain, home_score, away_score),
+            (away, away_result, away_gain, away_score, home_score),
+        ]
+        if bye is not None:
+            sides = [sides[1 - bye]]
+        else:
+            results.append((home, away, home_gain))
+            results.append((away, home, away_gain))
+        for entrant_id, result, gain, scored, conceded in sides:
+            row = stats.setdefault(entrant_id, dict.fromkeys(STAT_FIELDS, 0))
+            row["played"] += 1
+            row[result] += 1
+            row["points"] += gain
+            row["score_for"] += scored or 0
+            row["score_against"] += conceded or 0
+
+    for entrant_id, opponent_id, gain in results:
+        stats[entrant_id]["buchholz"] += stats[opponent_id]["points"]
+        if stats[entrant_id]["points"] == stats[opponent_id]["points"]:
+            stats[entrant_id]["head_to_head"] += gain
+    return stats
+
+
+def rebuild_standings(competition: Competition) -> int:
+    field = get_entrant_field(competition.is_team_game)
+    with transaction.atomic():
+        lock_competition(competition.pk)
+        stats = compute_standings(competition)
+        Standing.objects.filter(competition_id=competition.pk).delete()
+        Standing.objects.bulk_create(
+            [
+                Standing(
+                    competition_id=competition.pk, **{f"{field}_id": entrant_id}, **row
+                )
+                for entrant_id, row in stats.items()
+            ],
+            batch_size=1000,
+        )
+    return len(stats)
@@ -0,0 +1,329 @@
+from collections import deque
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from .bracket import BYE
+
+HOME_WIN = 0
+AWAY_WIN = 1
+DRAW = 2
+RESULTS = (HOME_WIN, AWAY_WIN, DRAW)
+
+# 재대결은 다른 어떤 비용보다 커서, 피할 수 있으면 항상 피한다.
+REMATCH_COST = 1e12
+
+
+class Swiss:
+    """
+    스위스 방식 대진.
+
+    대진표(Bracket)와 같은 배열 인덱스 표현을 쓴다.
+    경기 m 의 홈/원정은 slots[2m], slots[2m + 1] 이고 라운드는 rounds[m] 이다.
+    results 는 0(홈 승), 1(원정 승), 2(무승부) 이며, 부전승은 원정 자리가 BYE 이다.
+    라운드가 진행될 때마다 경기들이 배열 뒤에 이어 붙는다.
+    """
+
+    FORMAT = "swiss"
+
+    def __init__(self, entrants: List[Any]):
+        self.entrants = list(entrants)
+        self.rounds: List[int] = []
+        self.slots: List[int] = []
+        self.results: List[Optional[int]] = []
+
+    @classmethod
+    def start(cls, entrants: List[Any]) -> "Swiss":
+        if len(entrants) < 2:
+            raise ValueError("swiss pairing needs at least two entrants")
+        return cls(entrants)
+
+    @property
+    def num_of_matches(self) -> int:
+        return len(self.rounds)
+
+    @property
+    def current_round(self) -> int:
+        return self.rounds[-1] if self.rounds else 0
+
+    def standings(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Set[int]]]:
+        """
+        지금까지의 결과로 (점수, 색 균형, 직전 색, 상대 목록)을 계산한다.
+        점수는 승 1, 무 0.5 이고, 색 균형은 홈 경기 수 - 원정 경기 수이다.
+        """
+        n = len(self.entrants)
+        score = np.zeros(n)
+        balance = np.zeros(n, dtype=int)
+        last = np.zeros(n, dtype=int)
+        opponents: List[Set[int]] = [set() for _ in range(n)]
+        for match, result in enumerate(self.results):
+            home, away = self.slots[2 * match], self.slots[2 * match + 1]
+            if away == BYE:
+                score[home] += 1
+                continue
+            opponents[home].add(away)
+            opponents[away].add(home)
+            balance[home] += 1
+            balance[away] -= 1
+            last[home], last[away] = 1, -1
+            if result == HOME_WIN:
+                score[home] += 1
+            elif result == AWAY_WIN:
+                score[away] += 1
+            elif result == DRAW:
+                score[home] += 0.5
+                score[away] += 0.5
+        return score, balance, last, opponents
+
+    def had_bye(self) -> Set[int]:
+        return {
+            self.slots[2 * match]
+            for match in range(self.num_of_matches)
+            if self.slots[2 * match + 1] == BYE
+        }
+
+    def pair_next_round(self) -> int:
+        """다음 라운드 대진을 만들어 붙이고 라운드 번호를 반환한다."""
+        if None in self.results:
+            raise ValueError("current round is not finished")
+        score, balance, last, opponents = self.standings()
+        ranked = sorted(range(len(self.entrants)), key=lambda i: (-score[i], i))
+
+        bye = None
+        if len(ranked) % 2:
+            had_bye = self.had_bye()
+            bye = next((i for i in reversed(ranked) if i not in had_bye), ranked[-1])
+            ranked.remove(bye)
+
+        groups = [list(group) for _, group in groupby(ranked, key=lambda i: score[i])]
+        pairs, floaters = [], []
+        for index, group in enumerate(groups):
+            matched, floaters = match_group(
+                floaters + group,
+                2 * balance + last,
+                opponents,
+                allow_rematch=index == len(groups) - 1,
+            )
+            pairs += matched
+
+        round = self.current_round + 1
+        position = {player: rank for rank, player in enumerate(ranked)}
+
+        def by_rank(pair):
+            return min(position[pair[0]], position[pair[1]])
+
+        # 재대결 보정은 순위가 낮은 짝부터 손대므로 순위 순으로 정렬해 넘긴다.
+        pairs = repair_rematches(sorted(pairs, key=by_rank), opponents)
+        pairs.sort(key=by_rank)
+        for a, b in pairs:
+            home, away = orient(a, b, balance, last)
+            self.add_match(round, home, away, None)
+        if bye is not None:
+            self.add_match(round, bye, BYE, HOME_WIN)
+        return round
+
+    def add_match(self, round: int, home: int, away: int, result) -> None:
+        self.rounds.append(round)
+        self.slots += [home, away]
+        self.results.append(result)
+
+    def report(self, match: int, result: int) -> None:
+        if result not in RESULTS:
+            raise ValueError("result must be one of 0, 1, 2")
+        if self.results[match] is not None:
+            raise ValueError("match already has a result")
+        self.results[match] = result
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "format": self.FORMAT,
+            "entrants": self.entrants,
+            "rounds": self.rounds,
+            "slots": self.slots,
+            "results": self.results,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Swiss":
+        swiss = cls(data["entrants"])
+        swiss.rounds = list(data["rounds"])
+        swiss.slots = list(data["slots"])
+        swiss.results = list(data["results"])
+        return swiss
+
+
+def match_group(
+    players: List[int],
+    preference: np.ndarray,
+    opponents: List[Set[int]],
+    allow_rematch: bool,
+) -> Tuple[List[Tuple[int, int]], List[int]]:
+    """
+    같은 점수대 선수들을 상위 절반(S1)과 하위 절반(S2)으로 나눠
+    S1[i] 가 S2[i] 와 만나는 것을 기준으로 최소 비용 이분 매칭(헝가리안)을 구한다.
+    비용은 순위 차이의 제곱, 색 선호 충돌, 재대결 순으로 커진다.
+    짝을 찾지 못한 선수(홀수 인원의 남는 선수, 피할 수 없는 재대결)는
+    아래 점수대로 내려보낸다. 마지막 점수대라면 재대결을 허용한다.
+    """
+    if len(players) < 2:
+        return [], players
+    half = len(players) // 2
+    upper, lower = np.array(players[:half]), np.array(players[half:])
+
+    cost = np.subtract.outer(np.arange(len(upper)), np.arange(len(lower))) ** 2.0
+    # 색 선호가 같은 방향인 두 선수는 한쪽이 원하는 색을 받지 못한다.
+    upper_pref, lower_pref = preference[upper][:, None], preference[lower][None, :]
+    clash = (np.sign(upper_pref) == np.sign(lower_pref)) & (upper_pref != 0)
+    cost += clash * np.minimum(abs(upper_pref), abs(lower_pref)) * len(players) ** 2
+
+    lower_index = {player: j for j, player in enumerate(players[half:])}
+    for i, player in enumerate(players[:half]):
+        for opponent in opponents[player]:
+            j = lower_index.get(opponent)
+            if j is not None:
+                cost[i, j] = REMATCH_COST
+
+    rows, cols = linear_sum_assignment(cost)
+    pairs = [(int(upper[i]), int(lower[j])) for i, j in zip(rows, cols)]
+
+    matched, floaters = [], []
+    paired = set()
+    for a, b in pairs:
+        if b in opponents[a] and not allow_rematch:
+            continue
+        matched.append((a, b))
+        paired.update((a, b))
+    floaters = [player for player in players if player not in paired]
+    if floaters and allow_rematch:
+        # 남은 선수들은 서로 짝지을 수밖에 없다.
+        matched += list(zip(floaters[::2], floaters[1::2]))
+        floaters = floaters[len(floaters) // 2 * 2 :]
+    return matched, floaters
+
+
+def maximum_matching(adj: List[List[int]], match: List[int]) -> List[int]:
+    """
+    일반 그래프의 최대 매칭(Edmonds blossom).
+    `match` 의 기존 짝에서 출발해 증가 경로만 찾으므로, 이미 있는 짝은 대부분 유지된다.
+    O(V^3)
+    """
+    n = len(adj)
+    match = list(match)
+
+    for root in range(n):
+        if match[root] != -1:
+            continue
+        used = [False] * n
+        parent = [-1] * n
+        base = list(range(n))
+
+        def lca(a: int, b: int) -> int:
+            seen = [False] * n
+            while True:
+                a = base[a]
+                seen[a] = True
+                if match[a] == -1:
+                    break
+                a = parent[match[a]]
+            while True:
+                b = base[b]
+                if seen[b]:
+                    return b
+                b = parent[match[b]]
+
+        def mark_path(v: int, b: int, child: int, blossom: List[bool]) -> None:
+            while base[v] != b:
+                blossom[base[v]] = blossom[base[match[v]]] = True
+                parent[v] = child
+                child = match[v]
+                v = parent[match[v]]
+
+        end = -1
+        used[root] = True
+        queue = deque([root])
+        while queue and end == -1:
+            v = queue.popleft()
+            for to in adj[v]:
+                if base[v] == base[to] or match[v] == to:
+                    continue
+                if to == root or (match[to] != -1 and parent[match[to]] != -1):
+                    current = lca(v, to)
+                    blossom = [False] * n
+                    mark_path(v, current, to, blossom)
+                    mark_path(to, current, v, blossom)
+                    for i in range(n):
+                        if blossom[base[i]]:
+                            base[i] = current
+                            if not used[i]:
+                                used[i] = True
+                                queue.append(i)
+                elif parent[to] == -1:
+                    parent[to] = v
+                    if match[to] == -1:
+                        end = to
+                        break
+                    used[match[to]] = True
+                    queue.append(match[to])
+
+        # 증가 경로를 따라 짝을 뒤집는다.
+        while end != -1:
+            previous = parent[end]
+            following = match[previous]
+            match[end], match[previous] = previous, end
+            end = following
+    return match
+
+
+def repair_rematches(
+    pairs: List[Tuple[int, int]], opponents: List[Set[int]]
+) -> List[Tuple[int, int]]:
+    """
+    점수대별 매칭 뒤에도 남은 재대결을 없앤다.
+    순위가 낮은 쪽 짝들부터 범위를 두 배씩 넓혀 가며, 그 안의 선수들로
+    재대결 없는 완전 매칭을 찾는다. 범위 밖의 짝은 그대로 둔다.
+    """
+    rematches = [k for k, (a, b) in enumerate(pairs) if b in opponents[a]]
+    if not rematches:
+        return pairs
+
+    length = len(pairs) - rematches[0]
+    while True:
+        start = max(len(pairs) - length, 0)
+        players = [player for pair in pairs[start:] for player in pair]
+        index = {player: i for i, player in enumerate(players)}
+        adj = [
+            [
+                j
+                for j, other in enumerate(players)
+                if j != i and other not in opponents[a]
+            ]
+            for i, a in enumerate(players)
+        ]
+        match = [-1] * len(players)
+        for a, b in pairs[start:]:
+            if b not in opponents[a]:
+                match[index[a]], match[index[b]] = index[b], index[a]
+        match = maximum_matching(adj, match)
+
+        if -1 not in match or start == 0:
+            break
+        length *= 2
+
+    repaired = [
+        (players[i], players[j]) for i, j in enumerate(match) if j != -1 and i < j
+    ]
+    # 재대결을 피할 수 없는 선수들끼리는 그대로 짝짓는다.
+    left = [players[i] for i, j in enumerate(match) if j == -1]
+    repaired += list(zip(left[::2], left[1::2]))
+    return pairs[:start] + repaired
+
+
+def orient(a: int, b: int, balance: np.ndarray, last: np.ndarray) -> Tuple[int, int]:
+    """홈 경기가 적었던 쪽, 같으면 직전에 원정이었던 쪽, 그래도 같으면 상위 선수가 홈이다."""
+    if balance[a] != balance[b]:
+        return (a, b) if balance[a] < balance[b] else (b, a)
+    if last[a] != last[b]:
+        return (a, b) if last[a] < last[b] else (b, a)
+    return a, b
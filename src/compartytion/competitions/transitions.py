@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .broadcast import publish_competition_event
+from .models import Competition
+
+
+def get_batch_size() -> int:
+    return getattr(settings, "COMPETITION_TRANSITION_BATCH_SIZE", 1000)
+
+
+def advance_statuses(
+    now: Optional[datetime] = None, batch_size: Optional[int] = None
+) -> List[Tuple[str, int]]:
+    """
+    기한이 지난 대회들의 상태를 한 문장의 UPDATE 로 다음 상태로 넘긴다.
+    여러 시각이 한꺼번에 지났으면 가장 늦은 상태로 바로 넘어가고, 상태는 앞으로만 간다.
+    후보는 transition_at 부분 인덱스의 범위 검색 한 번으로 찾는다.
+    다른 작업자나 대진표 작업이 잠근 행은 SKIP LOCKED 로 건너뛰어 다음 주기에 처리하며,
+    같은 시각으로 다시 실행해도 바뀌는 것이 없다.
+    바뀐 (대회 id, 새 상태) 목록을 반환한다.
+    """
+    now = now or timezone.now()
+    table = Competition._meta.db_table
+    target = "CASE {} END".format(
+        " ".join(
+            f"WHEN {field} <= %(now)s THEN {status}"
+            for field, status in reversed(Competition.TRANSITIONS.items())
+        )
+    )
+    sql = f"""
+        WITH due AS (
+            SELECT id FROM {table}
+            WHERE transition_at <= %(now)s
+            ORDER BY transition_at
+            LIMIT %(batch_size)s
+            FOR NO KEY UPDATE SKIP LOCKED
+        )
+        UPDATE {table} AS c
+        SET status = GREATEST(c.status, {target}), updated_at = %(now)s
+        FROM due WHERE c.id = due.id
+        RETURNING c.id, c.status
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(sql, {"now": now, "batch_size": batch_size or get_batch_size()})
+        changed = cursor.fetchall()
+        for competition_id, status in changed:
+            publish_competition_event(
+                competition_id, "competition.status", {"status": status}
+            )
+    return changed
@@ -1,12 +1,16 @@
 from typing import List
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import Http404, StreamingHttpResponse
 from django.utils.translation import gettext_lazy as _
-from rest_framework import viewsets, mixins, status
+from rest_framework import viewsets, mixins, status, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.generics import get_object_or_404
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import (
     IsAuthenticatedOrReadOnly,
     IsAuthenticated,
@@ -17,7 +21,18 @@ from drf_spectacular.utils import (
 )
 from rest_framework_simplejwt.views import TokenViewBase
 
-from .models import Competition, Management, Applicant, Participant
+from .models import (
+    Competition,
+    Management,
+    Applicant,
+    Participant,
+    Team,
+    Match,
+    Standing,
+    Rule,
+    AuditEvent,
+    ArchivedParticipant,
+)
 from .serializers import (
     CompetitionSerializer,
     CompetitionCreateSerializer,
@@ -28,16 +43,96 @@ from .serializers import (
     ApplicantSerializer,
     ParticipantSerializer,
     ManagerPermissionsSerializer,
+    ParticipantImportFileSerializer,
+    ReorderSerializer,
+    TeamSerializer,
+    TeamAutoAssignSerializer,
+    SeedingSerializer,
+    BracketGenerateSerializer,
+    ScheduleGenerateSerializer,
+    MatchSerializer,
+    MatchReportSerializer,
+    StandingSerializer,
+    RuleSerializer,
+    AuditEventSerializer,
+)
+from .permissions import (
+    CanEditContent,
+    IsCreator,
+    ManagementPermission,
+    ParticipantManagementPermission,
+    RuleManagementPermission,
+)
+from .importers import ParticipantImporter, read_rows
+from .ordering import ParticipantReorderer, Reorderer
+from .teams import create_team, delete_team, assign_teams
+from .exceptions import InvalidRequest, InvalidPatch, ContentVersionConflict
+from .patches import (
+    JSONPatchParser,
+    MergePatchParser,
+    PatchError,
+    apply_json_patch,
+    apply_merge_patch,
 )
-from .permissions import IsCreator, ManagementPermission
+from .tournament.bracket import Bracket
+from .tournament.swiss import Swiss
+from .tournament.schedule import create_schedule
+from .tournament.matches import ResultReporter, save_bracket, save_swiss_round
+from .pagination import RoundPagination, KeysetPagination, ChangeFeedPagination
+from .tournament.entrants import get_entrant_ids
+from .exporters import (
+    ExportMixin,
+    PARTICIPANT_EXPORT_COLUMNS,
+    APPLICANT_EXPORT_COLUMNS,
+)
+from .conditional import condition_on_competition
+from .archive import ArchiveReadMixin
+from .audit import AuditMixin
+from .idempotency import idempotent
+from .broadcast import get_broker, competition_channel, publish_competition_event
 
 JWT_SETTINGS = getattr(settings, "SIMPLE_JWT", {})
 
+# If-Match 없이 보낸 패치가 동시 수정과 부딪혔을 때 최신 본문에 다시 적용하는 횟수
+CONTENT_PATCH_RETRIES = 3
+
+
+def get_if_match_version(request):
+    value = request.headers.get("If-Match")
+    if value is None:
+        return None
+    try:
+        return int(value.removeprefix("W/").strip('"'))
+    except ValueError:
+        raise InvalidRequest(_("If-Match 에는 내용의 판 번호를 보내야 합니다."))
+
 
 class ParticipantAccessTokenView(TokenViewBase):
     _serializer_class = JWT_SETTINGS.get("PARTICIPANT_ACCESS_TOKEN_SERIALIZER")
 
 
+async def competition_events(request, pk):
+    if not await Competition.objects.filter(pk=pk).aexists():
+        raise Http404
+    heartbeat = getattr(settings, "COMPETITION_EVENT_HEARTBEAT_SECONDS", 15)
+
+    async def stream():
+        subscription = get_broker().subscribe(competition_channel(pk))
+        try:
+            yield f"retry: {heartbeat * 1000}\n\n"
+            while True:
+                message = await subscription.get(timeout=heartbeat)
+                yield message if message is not None else ": heartbeat\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingHttpResponse(
+        stream(),
+        content_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 class ApplicationViewSet(viewsets.GenericViewSet):
     queryset = Applicant.objects.all()
     serializer_class = ApplicantSerializer
@@ -52,38 +147,66 @@ class ApplicationViewSet(viewsets.GenericViewSet):
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(methods=["POST"], detail=False, serializer_class=ApplicationSerializer)
+    @idempotent
     def register(self, request):
         serializer = ApplicationSerializer(
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        applicant = serializer.save()
         return Response(
-            {"detail": _("참가 신청을 완료했습니다.")}, status=status.HTTP_200_OK
+            {
+                "detail": (
+                    _("대기 신청을 완료했습니다.")
+                    if applicant.is_waitlisted
+                    else _("참가 신청을 완료했습니다.")
+                ),
+                "ticket": applicant.ticket,
+                "is_waitlisted": applicant.is_waitlisted,
+            },
+            status=status.HTTP_200_OK,
         )
 
 
-class CompetitionViewSet(viewsets.GenericViewSet, mixins.DestroyModelMixin):
+class CompetitionViewSet(AuditMixin, viewsets.GenericViewSet, mixins.DestroyModelMixin):
     queryset = Competition.objects.all()
     serializer_class = CompetitionSerializer
     pagination_class = LimitOffsetPagination
     permission_classes = [IsAuthenticatedOrReadOnly]
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ("me", "preview"):
+            # 목록/미리보기는 그리는 열만 읽고, 큰 JSON 열(content, tournament)은 읽지 않는다.
+            return queryset.only(*SimpleCompetitionSerializer.Meta.fields)
+        if self.action in ("retrieve", "partial_update"):
+            # 토너먼트는 상세 화면에 그리지 않으므로 tournament 하위 자원에서 따로 읽는다.
+            return queryset.defer("tournament")
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "create":
             return CompetitionCreateSerializer
         return self.serializer_class
 
+    @idempotent
     def create(self, request):
         serializer = self.get_serializer(
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        competition = serializer.save()
+        self.audit(competition.pk, "competition.created", title=competition.title)
         return Response(
             {"detail": _("새 대회가 생성됐습니다.")}, status=status.HTTP_201_CREATED
         )
 
+    @condition_on_competition(
+        "updated_at",
+        "participants_updated_at",
+        "applicants_updated_at",
+        per_user=True,
+    )
     def retrieve(self, request, pk=None):
         competition = self.get_object()
         serializer = self.get_serializer(competition, context={"request": request})
@@ -93,15 +216,92 @@ class CompetitionViewSet(viewsets.GenericViewSet, mixins.DestroyModelMixin):
         competition = self.get_object()
         serializer = self.get_serializer(competition, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        version = serializer.validated_data.pop(
+            "content_version", competition.content_version
+        )
+        fields = sorted(serializer.validated_data)
+        with transaction.atomic():
+            if "content" in serializer.validated_data:
+                # 본문은 읽은 판 그대로일 때만 바꾼다. (UPDATE ... WHERE content_version = ?)
+                content = serializer.validated_data.pop("content")
+                if Competition.objects.set_content(pk, content, version) is None:
+                    raise ContentVersionConflict(
+                        Competition.objects.values_list(
+                            "content_version", flat=True
+                        ).get(pk=pk)
+                    )
+                publish_competition_event(
+                    competition.pk,
+                    "competition.updated",
+                    {"id": competition.pk, "fields": {"content": content}},
+                )
+            if serializer.validated_data:
+                serializer.save()
+        # 본문(content)이 클 수 있으므로 바뀐 필드 이름만 남긴다.
+        self.audit(competition.pk, "competition.updated", fields=fields)
         return Response(status=status.HTTP_200_OK)
 
+    @extend_schema(
+        request={JSONPatchParser.media_type: list, MergePatchParser.media_type: dict}
+    )
+    @action(
+        methods=["PATCH"],
+        detail=True,
+        parser_classes=[JSONPatchParser, MergePatchParser],
+        permission_classes=[IsAuthenticated, CanEditContent],
+    )
+    def content(self, request, pk=None):
+        """
+        본문에 JSON Patch(application/json-patch+json) 나
+        JSON Merge Patch(application/merge-patch+json) 를 적용한다.
+        If-Match 로 판 번호를 보내면 그 판일 때만 적용하고, 아니면 409 를 돌려준다.
+        보내지 않으면 그 사이에 바뀐 최신 본문에 다시 적용한다.
+        """
+        competition = self.get_object()
+        expected = get_if_match_version(request)
+        if request.content_type.startswith(JSONPatchParser.media_type):
+            apply_patch = apply_json_patch
+        else:
+            apply_patch = apply_merge_patch
+        for _attempt in range(CONTENT_PATCH_RETRIES):
+            version = competition.content_version if expected is None else expected
+            try:
+                content = apply_patch(competition.content, request.data)
+            except PatchError as e:
+                raise InvalidPatch(str(e))
+            new_version = Competition.objects.set_content(pk, content, version)
+            if new_version is not None:
+                break
+            competition.refresh_from_db(fields=["content", "content_version"])
+            if expected is not None:
+                break
+        if new_version is None:
+            raise ContentVersionConflict(competition.content_version)
+
+        self.audit(competition.pk, "competition.updated", fields=["content"])
+        publish_competition_event(
+            competition.pk,
+            "competition.updated",
+            {"id": competition.pk, "fields": {"content": content}},
+        )
+        return Response(
+            {"content": content, "content_version": new_version},
+            headers={"ETag": f'"{new_version}"'},
+        )
+
+    def perform_destroy(self, instance):
+        self.audit(instance.pk, "competition.deleted", title=instance.title)
+        super().perform_destroy(instance)
+
     @action(
         methods=["GET"],
         detail=True,
         serializer_class=SimpleCompetitionSerializer,
         permission_classes=[AllowAny],
     )
+    @condition_on_competition(
+        "updated_at", "participants_updated_at", "applicants_updated_at"
+    )
     def preview(self, request, pk=None):
         competition = self.get_object()
         serializer = SimpleCompetitionSerializer(
@@ -109,6 +309,15 @@ class CompetitionViewSet(viewsets.GenericViewSet, mixins.DestroyModelMixin):
         )
         return Response(serializer.data)
 
+    @extend_schema(responses=dict)
+    @action(methods=["GET"], detail=True, permission_classes=[AllowAny])
+    @condition_on_competition("updated_at")
+    def tournament(self, request, pk=None):
+        tournament = get_object_or_404(
+            Competition.objects.values_list("tournament", flat=True), pk=pk
+        )
+        return Response(tournament)
+
     @extend_schema(responses=SimpleCompetitionSerializer(many=True))
     @action(
         methods=["GET"],
@@ -116,8 +325,11 @@ class CompetitionViewSet(viewsets.GenericViewSet, mixins.DestroyModelMixin):
         permission_classes=[IsAuthenticated],
     )
     def me(self, request):
-        my_competitions = self.queryset.filter(creator=request.user).order_by(
-            "-created_at"
+        my_competitions = (
+            self.get_queryset()
+            .filter(creator=request.user)
+            .select_related("creator__profile")
+            .order_by("-created_at")
         )
         page = self.paginate_queryset(my_competitions)
         if page is not None:
@@ -143,32 +355,145 @@ class CompetitionViewSet(viewsets.GenericViewSet, mixins.DestroyModelMixin):
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        self.audit(
+            competition.pk,
+            "management.invited",
+            usernames=serializer.validated_data["usernames"],
+        )
         return Response(
             data={"detail": _("매니저가 추가됐습니다.")}, status=status.HTTP_200_OK
         )
 
+    @action(
+        methods=["POST"],
+        detail=True,
+        serializer_class=BracketGenerateSerializer,
+        permission_classes=[IsCreator],
+    )
+    def bracket(self, request, pk=None):
+        competition = self.get_object()
+        serializer = BracketGenerateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            bracket = Bracket.generate(
+                serializer.validated_data["format"],
+                get_entrant_ids(competition, serializer.validated_data["seeding"]),
+            )
+        except ValueError:
+            raise InvalidRequest(_("대진표를 만들 참가자가 부족합니다."))
+        save_bracket(competition, bracket)
+        self.audit(competition.pk, "tournament.updated", format=bracket.format)
+        publish_competition_event(
+            competition.pk, "tournament.updated", {"format": bracket.format}
+        )
+        return Response(competition.tournament, status=status.HTTP_201_CREATED)
+
+    @action(
+        methods=["POST"],
+        detail=True,
+        serializer_class=SeedingSerializer,
+        permission_classes=[IsCreator],
+    )
+    def swiss(self, request, pk=None):
+        competition = self.get_object()
+        serializer = SeedingSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            # 같은 라운드가 두 번 만들어지지 않도록 대회 행을 잠근다.
+            competition = Competition.objects.select_for_update().get(pk=competition.pk)
+            tournament = competition.tournament or {}
+            if tournament.get("format") == Swiss.FORMAT:
+                swiss = Swiss.from_json(tournament)
+            else:
+                try:
+                    swiss = Swiss.start(
+                        get_entrant_ids(
+                            competition, serializer.validated_data["seeding"]
+                        )
+                    )
+                except ValueError:
+                    raise InvalidRequest(_("대진표를 만들 참가자가 부족합니다."))
+            try:
+                round = swiss.pair_next_round()
+            except ValueError:
+                raise InvalidRequest(_("아직 결과가 입력되지 않은 경기가 있습니다."))
+            save_swiss_round(competition, swiss, round)
+        self.audit(
+            competition.pk, "tournament.updated", format=Swiss.FORMAT, round=round
+        )
+        publish_competition_event(
+            competition.pk,
+            "tournament.updated",
+            {"format": Swiss.FORMAT, "round": round},
+        )
+        return Response(competition.tournament, status=status.HTTP_201_CREATED)
+
+    @action(
+        methods=["POST"],
+        detail=True,
+        serializer_class=ScheduleGenerateSerializer,
+        permission_classes=[IsCreator],
+    )
+    def schedule(self, request, pk=None):
+        competition = self.get_object()
+        serializer = ScheduleGenerateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            num_of_matches = create_schedule(competition, **serializer.validated_data)
+        except ValueError:
+            raise InvalidRequest(_("조마다 두 명(팀) 이상이 있어야 합니다."))
+        self.audit(competition.pk, "match.scheduled", count=num_of_matches)
+        publish_competition_event(
+            competition.pk, "match.scheduled", {"count": num_of_matches}
+        )
+        return Response(
+            {"detail": f"{num_of_matches}개의 경기가 생성됐습니다."},
+            status=status.HTTP_201_CREATED,
+        )
+
 
 class ManagementViewSet(
-    viewsets.GenericViewSet, mixins.ListModelMixin, mixins.DestroyModelMixin
+    AuditMixin,
+    ArchiveReadMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.DestroyModelMixin,
 ):
     serializer_class = ManagementSerializer
     permission_classes = [ManagementPermission]
 
     def get_queryset(self):
-        return Management.objects.filter(competition__id=self.kwargs["competition_pk"])
+        return self.get_source(Management).objects.filter(
+            competition__id=self.kwargs["competition_pk"]
+        )
 
     def get_permission_classes(self):
         if self.action == "create":
             return [IsCreator]
         return self.permission_classes
 
-    def partial_update(self, request, pk=None):
+    def partial_update(self, request, pk=None, competition_pk=None):
         management = self.get_object()
         serializer = self.get_serializer(management, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        self.audit(
+            management.competition_id,
+            "management.updated",
+            target_id=management.pk,
+            fields={name: serializer.data[name] for name in serializer.validated_data},
+        )
         return Response(status=status.HTTP_200_OK)
 
+    def perform_destroy(self, instance):
+        self.audit(
+            instance.competition_id,
+            "management.deleted",
+            target_id=instance.pk,
+            account_id=instance.account_id,
+        )
+        super().perform_destroy(instance)
+
     @action(
         methods=["GET"], detail=False, serializer_class=ManagerPermissionsSerializer
     )
@@ -183,50 +508,294 @@ class ManagementViewSet(
 
 
 class ApplicantViewSet(
-    viewsets.GenericViewSet, mixins.ListModelMixin, mixins.DestroyModelMixin
+    AuditMixin,
+    ArchiveReadMixin,
+    ExportMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.DestroyModelMixin,
 ):
     queryset = Applicant.objects.all()
     serializer_class = ApplicantSerializer
     permission_classes = [ManagementPermission]
+    export_columns = APPLICANT_EXPORT_COLUMNS
+    export_name = "applicants"
 
     def get_queryset(self):
-        return Applicant.objects.filter(competition__id=self.kwargs["competition_pk"])
+        return self.get_source(Applicant).objects.filter(
+            competition__id=self.kwargs["competition_pk"]
+        )
+
+    def get_export_queryset(self):
+        return self.get_queryset().order_by("applied_at", "id")
+
+    @condition_on_competition("applicants_updated_at", lookup="competition_pk")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    def perform_destroy(self, instance):
+        self.audit(
+            instance.competition_id,
+            "applicant.deleted",
+            target_id=instance.pk,
+            displayed_name=instance.displayed_name,
+        )
+        super().perform_destroy(instance)
 
     @extend_schema(request=List[int])
     @action(detail=False, methods=["POST"])
     def accept(self, request, competition_pk=None):
-        applicant_ids = request.data
-        applicants = self.get_queryset().filter(id__in=applicant_ids)
-        num_of_participant = Participant.objects.filter(
-            competition_id=competition_pk
-        ).count()
-        new_participants = []
-        for i, applicant in enumerate(applicants, start=1):
-            new_participants.append(
-                Participant(
-                    account=applicant.account,
-                    competition=applicant.competition,
-                    access_id=applicant.access_id,
-                    access_password=applicant.access_password,
-                    email=applicant.email,
-                    displayed_name=applicant.displayed_name,
-                    hidden_name=applicant.hidden_name,
-                    introduction=applicant.introduction,
-                    order=num_of_participant + i,
-                )
-            )
-        Participant.objects.bulk_create(new_participants)
-        applicants.delete()
+        applicant_ids = serializers.ListField(
+            child=serializers.IntegerField(min_value=1)
+        ).run_validation(request.data)
+        participant_ids = Participant.objects.accept_applicants(
+            competition_pk, applicant_ids
+        )
+        self.audit(
+            competition_pk,
+            "applicant.accepted",
+            applicant_ids=applicant_ids,
+            participant_ids=participant_ids,
+        )
+        publish_competition_event(
+            competition_pk,
+            "applicant.accepted",
+            {"participant_ids": participant_ids},
+        )
         return Response(
-            {"detail": f"{len(new_participants)}명의 참가자들이 추가됐습니다."},
+            {"detail": f"{len(participant_ids)}명의 참가자들이 추가됐습니다."},
             status=status.HTTP_200_OK,
         )
 
 
-class ParticipantViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
+class ParticipantViewSet(
+    AuditMixin,
+    ArchiveReadMixin,
+    ExportMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+):
     queryset = Participant.objects.all()
     serializer_class = ParticipantSerializer
     permission_classes = [ManagementPermission]
+    export_columns = PARTICIPANT_EXPORT_COLUMNS
+    export_name = "participants"
+
+    def get_queryset(self):
+        return self.get_source(Participant).objects.filter(
+            competition_id=self.kwargs["competition_pk"]
+        )
+
+    @condition_on_competition("participants_updated_at", lookup="competition_pk")
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @action(
+        methods=["POST"],
+        detail=False,
+        url_path="import",
+        parser_classes=[MultiPartParser],
+        permission_classes=[ParticipantManagementPermission],
+        serializer_class=ParticipantImportFileSerializer,
+    )
+    def import_file(self, request, competition_pk=None):
+        serializer = ParticipantImportFileSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        num_of_created = ParticipantImporter(competition_pk).run(
+            read_rows(serializer.validated_data["file"])
+        )
+        self.audit(competition_pk, "participant.imported", count=num_of_created)
+        return Response(
+            {"detail": f"{num_of_created}명의 참가자들이 추가됐습니다."},
+            status=status.HTTP_201_CREATED,
+        )
+
+    @action(
+        methods=["POST"],
+        detail=False,
+        permission_classes=[ParticipantManagementPermission],
+        serializer_class=ReorderSerializer,
+    )
+    def reorder(self, request, competition_pk=None):
+        serializer = ReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        num_of_updated = ParticipantReorderer(competition_pk).reorder(
+            **serializer.validated_data
+        )
+        self.audit(competition_pk, "participant.reordered", count=num_of_updated)
+        return Response(
+            {"detail": _("참가자 순서가 변경됐습니다.")}, status=status.HTTP_200_OK
+        )
+
+    @extend_schema(request=None)
+    @action(
+        methods=["POST"],
+        detail=False,
+        permission_classes=[ParticipantManagementPermission],
+    )
+    def compact(self, request, competition_pk=None):
+        num_of_updated = ParticipantReorderer(competition_pk).compact()
+        self.audit(competition_pk, "participant.compacted", count=num_of_updated)
+        return Response(
+            {"detail": _("참가자 순서가 정리됐습니다.")}, status=status.HTTP_200_OK
+        )
+
+
+class TeamViewSet(
+    ArchiveReadMixin,
+    viewsets.GenericViewSet,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.DestroyModelMixin,
+):
+    serializer_class = TeamSerializer
+    permission_classes = [ParticipantManagementPermission]
+
+    def get_queryset(self):
+        queryset = Team.objects.filter(competition_id=self.kwargs["competition_pk"])
+        if self.get_source(Participant) is ArchivedParticipant:
+            return queryset.prefetch_related(
+                Prefetch(
+                    "archivedparticipant_set",
+                    queryset=ArchivedParticipant.objects.select_related(
+                        "account__profile"
+                    ),
+                    to_attr="archived_members",
+                )
+            )
+        return queryset.prefetch_related("participant_set__account__profile")
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if not Competition.objects.filter(
+            pk=self.kwargs["competition_pk"], is_team_game=True
+        ).exists():
+            raise InvalidRequest(_("팀 게임이 아닌 대회입니다."))
+
+    def create(self, request, competition_pk=None):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        team = create_team(competition_pk, **serializer.validated_data)
+        return Response(self.get_serializer(team).data, status=status.HTTP_201_CREATED)
+
+    def perform_destroy(self, instance):
+        delete_team(instance)
+
+    def partial_update(self, request, pk=None, competition_pk=None):
+        team = self.get_object()
+        serializer = self.get_serializer(team, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(methods=["POST"], detail=False, serializer_class=ReorderSerializer)
+    def reorder(self, request, competition_pk=None):
+        serializer = ReorderSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        Reorderer(Team, competition_pk).reorder(**serializer.validated_data)
+        return Response(
+            {"detail": _("팀 순서가 변경됐습니다.")}, status=status.HTTP_200_OK
+        )
+
+    @action(methods=["POST"], detail=False, serializer_class=TeamAutoAssignSerializer)
+    def auto_assign(self, request, competition_pk=None):
+        serializer = TeamAutoAssignSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        num_of_assigned = assign_teams(competition_pk, **serializer.validated_data)
+        return Response(
+            {"detail": f"{num_of_assigned}명의 참가자들이 팀에 배정됐습니다."},
+            status=status.HTTP_200_OK,
+        )
+
+
+class MatchViewSet(ArchiveReadMixin, viewsets.GenericViewSet, mixins.ListModelMixin):
+    serializer_class = MatchSerializer
+    pagination_class = RoundPagination
+    lookup_value_regex = r"\d+"
+    permission_classes = [AllowAny]
+
+    def get_queryset(self):
+        queryset = self.get_source(Match).objects.filter(
+            competition_id=self.kwargs["competition_pk"]
+        )
+        group = self.request.query_params.get("group")
+        if group is not None and group.isdigit():
+            queryset = queryset.filter(group=group)
+        return queryset
+
+    @action(
+        methods=["POST"],
+        detail=True,
+        serializer_class=MatchReportSerializer,
+        permission_classes=[ParticipantManagementPermission],
+    )
+    def report(self, request, pk=None, competition_pk=None):
+        serializer = MatchReportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        match = ResultReporter(competition_pk).report(pk, **serializer.validated_data)
+        publish_competition_event(
+            competition_pk,
+            "match.reported",
+            {"id": match.id, "winner": match.winner},
+        )
+        return Response(MatchSerializer(match).data, status=status.HTTP_200_OK)
+
+
+class StandingViewSet(ArchiveReadMixin, viewsets.GenericViewSet, mixins.ListModelMixin):
+    serializer_class = StandingSerializer
+    pagination_class = KeysetPagination
+    permission_classes = [AllowAny]
+    ordering = Standing._meta.ordering
+
+    def get_queryset(self):
+        return (
+            self.get_source(Standing)
+            .objects.filter(competition_id=self.kwargs["competition_pk"])
+            .select_related("participant", "team")
+        )
+
+
+class RuleViewSet(AuditMixin, ArchiveReadMixin, viewsets.GenericViewSet):
+    serializer_class = RuleSerializer
+    permission_classes = [RuleManagementPermission]
+
+    def get_permissions(self):
+        if self.action == "list":
+            return [AllowAny()]
+        return super().get_permissions()
+
+    def list(self, request, competition_pk=None):
+        rules = self.get_source(Rule).objects.get_latest(competition_pk)
+        return Response(RuleSerializer(rules, many=True).data)
+
+    @extend_schema(request=RuleSerializer(many=True))
+    def create(self, request, competition_pk=None):
+        serializer = RuleSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+        rules = Rule.objects.add_versions(competition_pk, serializer.validated_data)
+        for rule in rules:
+            self.audit(
+                competition_pk,
+                "rule.created",
+                target_id=rule.pk,
+                order=rule.order,
+                depth=rule.depth,
+                content=rule.content,
+            )
+        return Response(
+            RuleSerializer(rules, many=True).data, status=status.HTTP_201_CREATED
+        )
+
+
+class ChangeViewSet(viewsets.GenericViewSet, mixins.ListModelMixin):
+    """대회의 변경 기록을 `?cursor=` 뒤로 이어 읽는다."""
+
+    serializer_class = AuditEventSerializer
+    pagination_class = ChangeFeedPagination
+    permission_classes = [ManagementPermission]
+    ordering = ["id"]
 
     def get_queryset(self):
-        return Participant.objects.filter(competition_id=self.kwargs["competition_pk"])
+        return AuditEvent.objects.filter(
+            competition_id=self.kwargs["competition_pk"]
+        ).select_related("actor__profile")
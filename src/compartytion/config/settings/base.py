@@ -133,6 +133,9 @@ STATIC_URL = "static/"
 
 MEDIA_URL = "media/"
 
+# 내용 해시 이름의 미디어 파일을 캐시할 시간(초)
+MEDIA_CACHE_SECONDS = 365 * 24 * 60 * 60
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -178,3 +181,42 @@ SPECTACULAR_SETTINGS = {
 OTP_SECONDS = 5 * 60  # 5 minutes
 
 PROFILE_AVATAR_SIZE = (200, 200)
+
+COMPETITION_EVENT_BROKER = "compartytion.competitions.broadcast.LocalBroker"
+COMPETITION_EVENT_QUEUE_SIZE = 100
+COMPETITION_EVENT_HEARTBEAT_SECONDS = 15
+
+PARTICIPANT_IMPORT_CHUNK_SIZE = 1000
+PARTICIPANT_IMPORT_MAX_WORKERS = None  # None 이면 CPU 수에 맞춘다.
+PARTICIPANT_IMPORT_MAX_ERRORS = 100
+
+EXPORT_CHUNK_SIZE = 2000
+
+STANDINGS_POINTS = {"win": 3, "draw": 1, "loss": 0}
+STANDINGS_PAGE_SIZE = 50
+
+# 레이팅 평가 기간(초)과 Glicko-2 의 타우, Elo 의 K 계수
+RATING_PERIOD_SECONDS = 7 * 24 * 60 * 60
+RATING_TAU = 0.5
+RATING_ELO_K = 32.0
+
+COMPETITION_TRANSITION_INTERVAL_SECONDS = 10
+COMPETITION_TRANSITION_BATCH_SIZE = 1000
+
+# 완료된 대회의 하위 목록을 보관 테이블로 옮기기까지의 기간(일)과 한 번에 옮기는 대회 수
+COMPETITION_ARCHIVE_AFTER_DAYS = 90
+COMPETITION_ARCHIVE_BATCH_SIZE = 100
+COMPETITION_ARCHIVE_INTERVAL_SECONDS = 60 * 60
+
+# Idempotency-Key 로 보관한 생성 응답을 재사용하는 기간(초)
+IDEMPOTENCY_KEY_TTL_SECONDS = 24 * 60 * 60
+
+# 마지막 접속 시각을 모아서 쓰는 간격(초)과, 그 전에라도 바로 쓰는 밀린 건수.
+# 프로세스가 갑자기 죽으면 이만큼의 접속 기록을 잃을 수 있다. 간격이 0 이면 바로 쓴다.
+LAST_LOGIN_FLUSH_INTERVAL_SECONDS = 30
+LAST_LOGIN_MAX_PENDING = 1000
+
+# 대회 변경 기록을 한 번에 읽는 개수
+AUDIT_FEED_PAGE_SIZE = 100
+# 먼저 번호를 받은 기록이 늦게 커밋될 수 있으므로, 이 시간(초)보다 최근의 기록은 아직 내주지 않는다.
+AUDIT_FEED_SETTLE_SECONDS = 5
@@ -15,15 +15,18 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+import re
+from urllib.parse import urlsplit
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
-from django.conf.urls.static import static
 from rest_framework_nested.routers import SimpleRouter, NestedSimpleRouter
 from rest_framework_simplejwt.views import TokenRefreshView
 from debug_toolbar.toolbar import debug_toolbar_urls
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from .views import serve_media
 from ..users.views import AuthViewSet, AccountViewSet, ProfileViewSet
 from ..competitions.views import (
     CompetitionViewSet,
@@ -32,6 +35,12 @@ from ..competitions.views import (
     ParticipantAccessTokenView,
     ApplicantViewSet,
     ParticipantViewSet,
+    TeamViewSet,
+    MatchViewSet,
+    StandingViewSet,
+    RuleViewSet,
+    ChangeViewSet,
+    competition_events,
 )
 
 router = SimpleRouter()
@@ -47,6 +56,11 @@ competition_router.register(r"applicants", ApplicantViewSet, basename="applicant
 competition_router.register(
     r"participants", ParticipantViewSet, basename="participants"
 )
+competition_router.register(r"teams", TeamViewSet, basename="teams")
+competition_router.register(r"matches", MatchViewSet, basename="matches")
+competition_router.register(r"standings", StandingViewSet, basename="standings")
+competition_router.register(r"rules", RuleViewSet, basename="rules")
+competition_router.register(r"changes", ChangeViewSet, basename="changes")
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -56,9 +70,24 @@ urlpatterns = [
         ParticipantAccessTokenView.as_view(),
         name="participant-access-token",
     ),
+    path(
+        "api/competitions/<uuid:pk>/events/",
+        competition_events,
+        name="competition-events",
+    ),
     path("api/", include(router.urls)),
     path("api/", include(competition_router.urls)),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+]
+
+# MEDIA_URL 이 다른 호스트(CDN 등)를 가리키면 그쪽에서 내려준다.
+if settings.MEDIA_URL and not urlsplit(settings.MEDIA_URL).netloc:
+    urlpatterns += [
+        re_path(
+            rf"^{re.escape(settings.MEDIA_URL.lstrip('/'))}(?P<path>.+)$",
+            serve_media,
+            name="media",
+        ),
+    ]
 
 if settings.DEBUG:
     urlpatterns += [
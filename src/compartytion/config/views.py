@@ -0,0 +1,57 @@
+import mimetypes
+import posixpath
+import re
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+from django.views.static import was_modified_since
+
+# 내용 해시를 이름으로 쓰는 파일(예: avatar/<sha256>.jpg)
+HASHED_NAME = re.compile(r"(^|/)[0-9a-f]{64}\.\w+$")
+
+
+@require_safe
+def serve_media(request, path):
+    """
+    업로드된 미디어 파일을 내려준다. 파일은 FileResponse 로 열어 둔 채 넘기므로
+    WSGI 서버가 wsgi.file_wrapper(sendfile) 로 메모리에 올리지 않고 보낸다.
+    내용 해시 이름의 파일은 내용이 바뀌지 않으므로 MEDIA_CACHE_SECONDS 동안 immutable 로 캐시한다.
+    """
+    path = posixpath.normpath(path).lstrip("/")
+    try:
+        if not default_storage.exists(path):
+            raise Http404
+        modified_time = default_storage.get_modified_time(path)
+    except (SuspiciousFileOperation, IsADirectoryError):
+        raise Http404
+
+    last_modified = http_date(modified_time.timestamp())
+    if not was_modified_since(
+        request.META.get("HTTP_IF_MODIFIED_SINCE"), modified_time.timestamp()
+    ):
+        response = HttpResponseNotModified()
+    else:
+        try:
+            file = default_storage.open(path, "rb")
+        except IsADirectoryError:
+            raise Http404
+        content_type, encoding = mimetypes.guess_type(path)
+        response = FileResponse(
+            file, content_type=content_type or "application/octet-stream"
+        )
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+    response.headers["Last-Modified"] = last_modified
+    if HASHED_NAME.search(path):
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=getattr(settings, "MEDIA_CACHE_SECONDS", 365 * 24 * 60 * 60),
+            immutable=True,
+        )
+    return response
@@ -0,0 +1,51 @@
+# Generated by Django 5.1.2 on 2026-10-19 07:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Rating",
+            fields=[
+                (
+                    "account",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rating",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("rating", models.FloatField(default=1500.0, verbose_name="레이팅")),
+                (
+                    "deviation",
+                    models.FloatField(default=350.0, verbose_name="레이팅 편차"),
+                ),
+                ("volatility", models.FloatField(default=0.06, verbose_name="변동성")),
+                ("elo", models.FloatField(default=1500.0, verbose_name="Elo")),
+                (
+                    "num_of_games",
+                    models.PositiveIntegerField(default=0, verbose_name="경기 수"),
+                ),
+                ("period", models.BigIntegerField(default=0, verbose_name="평가 기간")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="갱신일"),
+                ),
+            ],
+            options={
+                "verbose_name": "레이팅",
+                "verbose_name_plural": "레이팅들",
+                "indexes": [models.Index(fields=["-rating"], name="rating_rank_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.2 on 2026-10-19 08:34
+
+import hashlib
+
+from django.core.files.base import ContentFile
+from django.db import migrations, models
+
+
+def rename_avatars(apps, schema_editor):
+    """계정 id 이름으로 저장된 아바타를 내용 해시 이름으로 옮긴다."""
+    Profile = apps.get_model("users", "Profile")
+    storage = Profile._meta.get_field("avatar").storage
+    for profile in Profile.objects.exclude(avatar="").exclude(avatar__isnull=True):
+        old_name = profile.avatar.name
+        if not storage.exists(old_name):
+            continue
+        with storage.open(old_name, "rb") as file:
+            content = file.read()
+        profile.avatar_hash = hashlib.sha256(content).hexdigest()
+        name = f"avatar/{profile.avatar_hash}.{old_name.split('.')[-1].lower()}"
+        if not storage.exists(name):
+            name = storage.save(name, ContentFile(content))
+        profile.avatar = name
+        profile.save(update_fields=["avatar", "avatar_hash"])
+        storage.delete(old_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_rating"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="avatar_hash",
+            field=models.CharField(
+                blank=True, max_length=64, verbose_name="아바타 해시"
+            ),
+        ),
+        migrations.RunPython(rename_avatars, migrations.RunPython.noop),
+    ]
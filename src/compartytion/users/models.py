@@ -1,5 +1,6 @@
+import hashlib
 from datetime import timedelta
-from django.db import models
+from django.db import connection, models, transaction
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
@@ -7,11 +8,14 @@ from django.contrib.auth.models import (
 )
 from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.conf import settings
+from django.core.files.base import ContentFile
 from django.core.mail import send_mail
 from django.core.validators import RegexValidator, MinLengthValidator
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from django_cleanup import cleanup
 
+from .tracking import get_tracker
 from .utils import generate_otp, avatar_directory_path
 
 
@@ -129,6 +133,8 @@ class UnauthenticatedEmail(models.Model):
         )
 
 
+# 같은 아바타 파일을 여러 프로필이 함께 쓰므로 django_cleanup 대신 직접 지운다.
+@cleanup.ignore
 class Profile(models.Model):
     account = models.OneToOneField(Account, on_delete=models.CASCADE, primary_key=True)
     username = models.CharField(
@@ -145,6 +151,7 @@ class Profile(models.Model):
         },
     )
     avatar = models.ImageField("아바타", upload_to=avatar_directory_path, null=True)
+    avatar_hash = models.CharField("아바타 해시", max_length=64, blank=True)
     displayed_name = models.CharField(
         "공개 이름", validators=[UnicodeUsernameValidator()], blank=True, max_length=30
     )
@@ -159,3 +166,82 @@ class Profile(models.Model):
     class Meta:
         verbose_name = "프로필"
         verbose_name_plural = "프로필들"
+
+    def save(self, *args, **kwargs):
+        if not self.avatar or self.avatar._committed:
+            return super().save(*args, **kwargs)
+        # 파일 저장과 행 저장을 한 트랜잭션에 묶어, 커밋될 때까지 아바타 잠금을 쥔다.
+        with transaction.atomic():
+            replaced = (
+                Profile.objects.filter(pk=self.pk)
+                .values_list("avatar", flat=True)
+                .first()
+            )
+            self.store_avatar()
+            super().save(*args, **kwargs)
+        if replaced and replaced != self.avatar.name:
+            transaction.on_commit(lambda: delete_unused_avatar(replaced))
+
+    def store_avatar(self):
+        """
+        새 아바타 파일을 내용의 SHA-256 해시 이름으로 저장한다.
+        같은 내용의 파일이 이미 있으면 다시 저장하지 않고 그 파일을 함께 쓴다.
+        """
+        self.avatar.seek(0)
+        content = self.avatar.read()
+        self.avatar_hash = hashlib.sha256(content).hexdigest()
+        name = self.avatar.field.generate_filename(self, self.avatar.name)
+        storage = self.avatar.storage
+        lock_avatar(name)
+        if not storage.exists(name):
+            name = storage.save(name, ContentFile(content))
+        self.avatar.name = name
+        self.avatar._committed = True
+
+
+def lock_avatar(name: str):
+    """
+    현재 트랜잭션이 끝날 때까지 아바타 파일 이름에 잠금을 건다.
+    같은 내용을 올리는 쪽과 지우는 쪽이 서로의 커밋을 보고 판단하게 한다.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [name])
+
+
+def delete_unused_avatar(name: str):
+    """어떤 프로필도 쓰지 않는 아바타 파일을 지운다."""
+    if not name:
+        return
+    with transaction.atomic():
+        lock_avatar(name)
+        if not Profile.objects.filter(avatar=name).exists():
+            Profile._meta.get_field("avatar").storage.delete(name)
+
+
+class Rating(models.Model):
+    """
+    대회를 가리지 않고 이어지는 계정의 실력 점수.
+    Glicko-2 (rating, deviation, volatility) 와 Elo 를 함께 둔다.
+    deviation 은 period(마지막으로 경기를 치른 평가 기간)까지의 값이며,
+    쉬는 기간만큼의 불확실성 증가는 다음 계산 때 한꺼번에 더한다.
+    """
+
+    account = models.OneToOneField(
+        Account, on_delete=models.CASCADE, primary_key=True, related_name="rating"
+    )
+    rating = models.FloatField("레이팅", default=1500.0)
+    deviation = models.FloatField("레이팅 편차", default=350.0)
+    volatility = models.FloatField("변동성", default=0.06)
+    elo = models.FloatField("Elo", default=1500.0)
+    num_of_games = models.PositiveIntegerField("경기 수", default=0)
+    period = models.BigIntegerField("평가 기간", default=0)
+    updated_at = models.DateTimeField("갱신일", auto_now=True)
+
+    class Meta:
+        verbose_name = "레이팅"
+        verbose_name_plural = "레이팅들"
+        indexes = [models.Index(fields=["-rating"], name="rating_rank_idx")]
+
+
+# 로그인마다 Account 를 save() 하지 않고 마지막 접속 시각을 모아서 쓴다.
+account_logins = get_tracker(Account, "last_login")
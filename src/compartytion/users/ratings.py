@@ -0,0 +1,211 @@
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from .models import Rating
+
+# Glicko-2 내부 척도와 레이팅 척도 사이의 비율
+SCALE = 173.7178
+DEFAULT_RATING = Rating._meta.get_field("rating").default
+DEFAULT_DEVIATION = Rating._meta.get_field("deviation").default
+DEFAULT_VOLATILITY = Rating._meta.get_field("volatility").default
+NEVER = -1
+
+
+def solve_volatility(
+    phi: np.ndarray,
+    sigma: np.ndarray,
+    v: np.ndarray,
+    delta: np.ndarray,
+    tau: float,
+    epsilon: float = 1e-6,
+    max_iterations: int = 100,
+) -> np.ndarray:
+    """
+    Glicko-2 의 새 변동성을 모든 선수에 대해 한꺼번에 구한다. (Illinois 방식)
+    이미 수렴한 선수는 그대로 두고 남은 선수만 다음 반복에서 고친다.
+    """
+    a = np.log(sigma**2)
+    phi2, delta2 = phi**2, delta**2
+
+    def f(x):
+        ex = np.exp(x)
+        return (
+            ex * (delta2 - phi2 - v - ex) / (2 * (phi2 + v + ex) ** 2)
+            - (x - a) / tau**2
+        )
+
+    upper = delta2 > phi2 + v
+    A = a.copy()
+    B = np.where(upper, np.log(np.where(upper, delta2 - phi2 - v, 1.0)), a - tau)
+    pending = ~upper & (f(B) < 0)
+    k = 1
+    while pending.any():
+        k += 1
+        B = np.where(pending, a - k * tau, B)
+        pending &= f(B) < 0
+
+    fA, fB = f(A), f(B)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(max_iterations):
+            active = np.abs(B - A) > epsilon
+            if not active.any():
+                break
+            C = np.where(active, A + (A - B) * fA / (fB - fA), B)
+            fC = f(C)
+            swap = active & (fC * fB <= 0)
+            A = np.where(swap, B, A)
+            fA = np.where(swap, fB, np.where(active, fA / 2, fA))
+            B, fB = np.where(active, C, B), np.where(active, fC, fB)
+    return np.exp(A / 2)
+
+
+class RatingPool:
+    """
+    계정들의 레이팅을 배열로 들고 평가 기간 단위로 한꺼번에 갱신한다.
+    한 평가 기간의 경기들은 모두 기간 시작 시점의 레이팅으로 계산하므로
+    경기 순서와 관계없이 같은 결과가 나오고, 선수별 합은 bincount 로 구한다.
+    """
+
+    def __init__(self, account_ids: np.ndarray):
+        size = len(account_ids)
+        self.account_ids = np.asarray(account_ids, dtype=np.int64)
+        self.mu = np.zeros(size)
+        self.phi = np.full(size, DEFAULT_DEVIATION / SCALE)
+        self.sigma = np.full(size, DEFAULT_VOLATILITY)
+        self.elo = np.full(size, DEFAULT_RATING)
+        self.games = np.zeros(size, dtype=np.int64)
+        self.period = np.full(size, NEVER, dtype=np.int64)
+        self.tau = getattr(settings, "RATING_TAU", 0.5)
+        self.k = getattr(settings, "RATING_ELO_K", 32.0)
+
+    def rate_period(
+        self, period: int, home: np.ndarray, away: np.ndarray, score: np.ndarray
+    ) -> None:
+        """
+        한 평가 기간의 경기들을 반영한다.
+        home/away 는 선수 인덱스, score 는 홈 쪽 점수(승 1, 무 0.5, 패 0)이다.
+        """
+        players = np.concatenate([home, away])
+        opponents = np.concatenate([away, home])
+        scores = np.concatenate([score, 1 - score])
+        rated, index = np.unique(players, return_inverse=True)
+
+        # 경기 없이 지난 평가 기간만큼 불확실성이 커진다.
+        idle = np.where(self.period[rated] == NEVER, 0, period - self.period[rated] - 1)
+        phi = np.minimum(
+            np.sqrt(self.phi[rated] ** 2 + idle * self.sigma[rated] ** 2),
+            DEFAULT_DEVIATION / SCALE,
+        )
+        self.phi[rated] = phi
+
+        g = 1 / np.sqrt(1 + 3 * self.phi[opponents] ** 2 / np.pi**2)
+        expected = 1 / (1 + np.exp(-g * (self.mu[players] - self.mu[opponents])))
+        v = 1 / np.bincount(index, g * g * expected * (1 - expected), len(rated))
+        total = np.bincount(index, g * (scores - expected), len(rated))
+        sigma = solve_volatility(phi, self.sigma[rated], v, v * total, self.tau)
+        phi = 1 / np.sqrt(1 / (phi**2 + sigma**2) + 1 / v)
+
+        elo_expected = 1 / (1 + 10 ** ((self.elo[opponents] - self.elo[players]) / 400))
+        self.elo[rated] += np.bincount(
+            index, self.k * (scores - elo_expected), len(rated)
+        )
+
+        self.mu[rated] += phi**2 * total
+        self.phi[rated] = phi
+        self.sigma[rated] = sigma
+        self.games[rated] += np.bincount(index, minlength=len(rated))
+        self.period[rated] = period
+
+    def rate(
+        self,
+        periods: np.ndarray,
+        home: np.ndarray,
+        away: np.ndarray,
+        score: np.ndarray,
+    ) -> int:
+        """여러 평가 기간의 경기들을 기간 순서대로 반영하고 처리한 기간 수를 반환한다."""
+        order = np.argsort(periods, kind="stable")
+        periods = periods[order]
+        home, away, score = home[order], away[order], score[order]
+        boundaries = np.flatnonzero(np.diff(periods)) + 1
+        starts = np.concatenate([[0], boundaries])
+        ends = np.concatenate([boundaries, [len(periods)]])
+        for start, end in zip(starts, ends):
+            self.rate_period(
+                int(periods[start]), home[start:end], away[start:end], score[start:end]
+            )
+        return len(starts) if len(periods) else 0
+
+    def load(self) -> None:
+        """이 풀의 계정들 중 이미 레이팅이 있는 계정의 값을 불러온다."""
+        position = {
+            account_id: i for i, account_id in enumerate(self.account_ids.tolist())
+        }
+        for account_id, rating, deviation, volatility, elo, games, period in (
+            Rating.objects.filter(account_id__in=position.keys())
+            .values_list(
+                "account_id",
+                "rating",
+                "deviation",
+                "volatility",
+                "elo",
+                "num_of_games",
+                "period",
+            )
+            .iterator(chunk_size=10000)
+        ):
+            i = position[account_id]
+            self.mu[i] = (rating - DEFAULT_RATING) / SCALE
+            self.phi[i] = deviation / SCALE
+            self.sigma[i] = volatility
+            self.elo[i] = elo
+            self.games[i] = games
+            self.period[i] = period
+
+    def rows(self) -> Dict[str, np.ndarray]:
+        rated = self.period != NEVER
+        return {
+            "account_id": self.account_ids[rated],
+            "rating": self.mu[rated] * SCALE + DEFAULT_RATING,
+            "deviation": self.phi[rated] * SCALE,
+            "volatility": self.sigma[rated],
+            "elo": self.elo[rated],
+            "num_of_games": self.games[rated],
+            "period": self.period[rated],
+        }
+
+    def save(self, batch_size: int = 50000) -> int:
+        """경기를 치른 계정들의 레이팅을 unnest 배열로 한꺼번에 upsert 한다."""
+        rows = self.rows()
+        columns = list(rows.keys())
+        types = ["bigint", "float8", "float8", "float8", "float8", "integer", "bigint"]
+        table = Rating._meta.db_table
+        sql = f"""
+            INSERT INTO {table} ({", ".join(columns)}, updated_at)
+            SELECT *, %s FROM unnest({", ".join(f"%s::{t}[]" for t in types)})
+            ON CONFLICT (account_id) DO UPDATE SET
+            {", ".join(f"{c} = EXCLUDED.{c}" for c in columns[1:])},
+            updated_at = EXCLUDED.updated_at
+        """
+        now = timezone.now()
+        size = len(rows["account_id"])
+        with connection.cursor() as cursor:
+            for start in range(0, size, batch_size):
+                cursor.execute(
+                    sql,
+                    [now]
+                    + [rows[c][start : start + batch_size].tolist() for c in columns],
+                )
+        return size
+
+
+def index_accounts(
+    *columns: np.ndarray,
+) -> Tuple[np.ndarray, Iterable[np.ndarray]]:
+    """계정 id 열들을 0 부터의 인덱스로 바꾼다. (고유 계정 id, 인덱스 열들)"""
+    account_ids, inverse = np.unique(np.concatenate(columns), return_inverse=True)
+    return account_ids, np.split(inverse, len(columns))
@@ -9,7 +9,7 @@ from django.utils import timezone
 from rest_framework import serializers
 from PIL import Image, ImageOps
 
-from .models import Account, UnauthenticatedEmail, Profile
+from .models import Account, UnauthenticatedEmail, Profile, Rating
 from .utils import mask_email
 
 
@@ -19,6 +19,20 @@ class SimpleProfileSerializer(serializers.ModelSerializer):
         fields = ["username", "avatar"]
 
 
+class RatingSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Rating
+        fields = ["rating", "deviation", "volatility", "elo", "num_of_games"]
+        read_only_fields = fields
+
+
+class RatedProfileSerializer(SimpleProfileSerializer):
+    rating = RatingSerializer(source="account.rating", read_only=True, default=None)
+
+    class Meta(SimpleProfileSerializer.Meta):
+        fields = SimpleProfileSerializer.Meta.fields + ["rating"]
+
+
 class AccountCreationSerializer(serializers.ModelSerializer):
     username = serializers.CharField(
         max_length=30,
@@ -0,0 +1,22 @@
+from django.contrib.auth.models import update_last_login
+from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Profile, account_logins, delete_unused_avatar
+
+# 기본 수신자는 로그인마다 Account 를 save() 하므로 write-behind 기록기로 바꾼다.
+user_logged_in.disconnect(update_last_login, dispatch_uid="update_last_login")
+
+
+@receiver(user_logged_in, dispatch_uid="update_last_login")
+def track_last_login(sender, user, **kwargs):
+    user.last_login = account_logins.touch(user.pk)
+
+
+@receiver(post_delete, sender=Profile)
+def delete_avatar(sender, instance, **kwargs):
+    name = instance.avatar.name
+    if name:
+        transaction.on_commit(lambda: delete_unused_avatar(name))
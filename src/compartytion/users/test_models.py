@@ -1,10 +1,17 @@
+import hashlib
+import shutil
+import tempfile
+import threading
 from datetime import timedelta
-from django.test import TestCase
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.core import mail
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
 from django.conf import settings
 from django.utils import timezone
 
-from .models import Account, Profile, UnauthenticatedEmail
+from .models import Account, Profile, UnauthenticatedEmail, delete_unused_avatar
 
 
 class AccountTestCase(TestCase):
@@ -99,3 +106,105 @@ class ProfileTestCase(TestCase):
             self.assertTrue(False)
         except Profile.DoesNotExist:
             self.assertTrue(True)
+
+
+class ProfileAvatarTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.profiles = [
+            Account.objects.create_user(
+                email=f"user{i}@example.com", username=f"user{i}", password="password"
+            ).profile
+            for i in range(2)
+        ]
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def upload(self, profile, content: bytes, name="avatar.JPG"):
+        profile.avatar = ContentFile(content, name=name)
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+        return profile.avatar.name
+
+    def test_avatar_is_named_by_content_hash(self):
+        profile = self.profiles[0]
+        name = self.upload(profile, b"first")
+        digest = hashlib.sha256(b"first").hexdigest()
+        self.assertEqual(profile.avatar_hash, digest)
+        self.assertEqual(name, f"avatar/{digest}.jpg")
+        self.assertTrue(default_storage.exists(name))
+
+    def test_identical_uploads_share_file(self):
+        first = self.upload(self.profiles[0], b"same")
+        second = self.upload(self.profiles[1], b"same")
+        self.assertEqual(first, second)
+        self.assertEqual(len(default_storage.listdir("avatar")[1]), 1)
+
+        # 다른 프로필이 쓰는 파일은 지우지 않고, 아무도 쓰지 않게 되면 지운다.
+        self.upload(self.profiles[0], b"changed")
+        self.assertTrue(default_storage.exists(first))
+        with self.captureOnCommitCallbacks(execute=True):
+            Account.objects.filter(pk=self.profiles[1].pk).delete()
+        self.assertFalse(default_storage.exists(first))
+        self.assertTrue(default_storage.exists(self.profiles[0].avatar.name))
+
+
+class ConcurrentAvatarTestCase(TransactionTestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.profiles = [
+            Account.objects.create_user(
+                email=f"user{i}@example.com", username=f"user{i}", password="password"
+            ).profile
+            for i in range(2)
+        ]
+
+    def test_delete_waits_for_upload_sharing_file(self):
+        owner, uploader = self.profiles
+        owner.avatar = ContentFile(b"same", name="avatar.jpg")
+        owner.save()
+        name = owner.avatar.name
+        # 원래 주인은 파일을 더 이상 쓰지 않고, 지우는 쪽의 커밋 후 정리만 남았다.
+        Profile.objects.filter(pk=owner.pk).update(avatar="", avatar_hash="")
+
+        def delete():
+            try:
+                delete_unused_avatar(name)
+            finally:
+                connection.close()
+
+        with transaction.atomic():
+            # 같은 내용을 올리는 쪽은 파일이 있으니 다시 저장하지 않는다.
+            uploader.avatar = ContentFile(b"same", name="avatar.jpg")
+            uploader.save()
+            self.assertEqual(uploader.avatar.name, name)
+            thread = threading.Thread(target=delete)
+            thread.start()
+            thread.join(timeout=0.5)
+            self.assertTrue(thread.is_alive())
+        thread.join()
+
+        self.assertTrue(default_storage.exists(name))
+
+    def test_upload_after_delete_saves_file_again(self):
+        owner, uploader = self.profiles
+        owner.avatar = ContentFile(b"same", name="avatar.jpg")
+        owner.save()
+        name = owner.avatar.name
+        Profile.objects.filter(pk=owner.pk).update(avatar="", avatar_hash="")
+        delete_unused_avatar(name)
+        self.assertFalse(default_storage.exists(name))
+
+        uploader.avatar = ContentFile(b"same", name="avatar.jpg")
+        uploader.save()
+        self.assertEqual(uploader.avatar.name, name)
+        self.assertTrue(default_storage.exists(name))
@@ -0,0 +1,96 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Account, account_logins
+from .tracking import LastSeenTracker
+
+
+@override_settings(LAST_LOGIN_FLUSH_INTERVAL_SECONDS=3600, LAST_LOGIN_MAX_PENDING=100)
+class LastSeenTrackerTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.accounts = [
+            Account.objects.create_user(
+                email=f"user{i}@example.com", password="password", username=f"user{i}"
+            )
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        self.tracker = LastSeenTracker(Account, "last_login")
+        self.now = timezone.now()
+
+    def last_logins(self):
+        return list(Account.objects.order_by("pk").values_list("last_login", flat=True))
+
+    def test_touch_is_buffered_until_flush(self):
+        with self.assertNumQueries(0):
+            for account in self.accounts[:2]:
+                self.tracker.touch(account.pk, self.now)
+        self.assertEqual(self.last_logins(), [None, None, None])
+        with self.assertNumQueries(1):
+            self.assertEqual(self.tracker.flush(), 2)
+        self.assertEqual(self.last_logins(), [self.now, self.now, None])
+        self.assertEqual(self.tracker.flush(), 0)
+
+    def test_latest_time_wins(self):
+        account = self.accounts[0]
+        earlier = self.now - timedelta(minutes=1)
+        self.tracker.touch(account.pk, self.now)
+        self.tracker.touch(account.pk, earlier)
+        self.tracker.flush()
+        # 다른 프로세스가 쓴 더 늦은 시각을 되돌리지 않는다.
+        self.tracker.touch(account.pk, earlier)
+        self.assertEqual(self.tracker.flush(), 0)
+        self.assertEqual(self.last_logins()[0], self.now)
+
+    def test_batches(self):
+        self.tracker.BATCH_SIZE = 2
+        for account in self.accounts:
+            self.tracker.touch(account.pk, self.now)
+        with self.assertNumQueries(2):
+            self.assertEqual(self.tracker.flush(), 3)
+
+    @override_settings(LAST_LOGIN_MAX_PENDING=2)
+    def test_flush_when_too_many_pending(self):
+        self.tracker.touch(self.accounts[0].pk, self.now)
+        self.assertEqual(self.last_logins()[0], None)
+        self.tracker.touch(self.accounts[1].pk, self.now)
+        self.assertEqual(self.last_logins(), [self.now, self.now, None])
+
+    @override_settings(LAST_LOGIN_FLUSH_INTERVAL_SECONDS=0)
+    def test_write_through(self):
+        self.tracker.touch(self.accounts[2].pk, self.now)
+        self.assertEqual(self.last_logins()[2], self.now)
+
+    @override_settings(LAST_LOGIN_FLUSH_INTERVAL_SECONDS=0)
+    def test_failed_flush_does_not_raise(self):
+        account = self.accounts[0]
+        with mock.patch(
+            "compartytion.users.tracking.connection.cursor", side_effect=DatabaseError
+        ), self.assertLogs("compartytion.users.tracking", "ERROR"):
+            self.assertEqual(self.tracker.touch(account.pk, self.now), self.now)
+        self.assertEqual(self.last_logins()[0], None)
+        # 못 쓴 시각은 남겨 두었다가 다음에 쓴다.
+        self.assertEqual(self.tracker.flush(), 1)
+        self.assertEqual(self.last_logins()[0], self.now)
+
+
+class LoginTrackingTestCase(APITestCase):
+    def test_login_records_last_login(self):
+        account = Account.objects.create_user(
+            email="user@example.com", password="password", username="user"
+        )
+        res = self.client.post(
+            "/api/auth/login/", {"email": "user@example.com", "password": "password"}
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        account_logins.flush()
+        account.refresh_from_db()
+        self.assertIsNotNone(account.last_login)
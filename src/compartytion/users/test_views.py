@@ -1,6 +1,11 @@
 from datetime import timedelta
 import random
+import shutil
+import tempfile
 from django.core import mail
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import override_settings
 from django.conf import settings
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -263,3 +268,43 @@ class ProfileViewSetTestCase(APITestCase):
         authorization = f"Bearer {self.token}"
         res = self.client.get(url, headers={"Authorization": authorization})
         self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+
+class MediaViewTestCase(APITestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        profile = Account.objects.create_user(
+            email="user@example.com", password="password", username="test-user"
+        ).profile
+        profile.avatar = ContentFile(b"avatar", name="avatar.png")
+        profile.save()
+        self.url = settings.MEDIA_URL + profile.avatar.name
+
+    def test_hashed_file_is_cached_forever(self):
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(res.streaming_content), b"avatar")
+        self.assertEqual(res["Content-Type"], "image/png")
+        self.assertIn("immutable", res["Cache-Control"])
+        self.assertIn(f"max-age={settings.MEDIA_CACHE_SECONDS}", res["Cache-Control"])
+
+        res = self.client.get(
+            self.url, headers={"If-Modified-Since": res["Last-Modified"]}
+        )
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_unhashed_file_is_not_cached_forever(self):
+        default_storage.save("avatar/plain.png", ContentFile(b"plain"))
+        res = self.client.get(settings.MEDIA_URL + "avatar/plain.png")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(res.streaming_content), b"plain")
+        self.assertNotIn("Cache-Control", res)
+
+    def test_missing_or_outside_file(self):
+        for path in ["avatar/missing.png", "avatar/", "../manage.py"]:
+            res = self.client.get(settings.MEDIA_URL + path)
+            self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND, path)
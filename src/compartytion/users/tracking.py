@@ -0,0 +1,138 @@
+import atexit
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Type
+
+from django.conf import settings
+from django.db import connection, models
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def get_flush_interval() -> float:
+    return getattr(settings, "LAST_LOGIN_FLUSH_INTERVAL_SECONDS", 30)
+
+
+def get_max_pending() -> int:
+    return getattr(settings, "LAST_LOGIN_MAX_PENDING", 1000)
+
+
+class LastSeenTracker:
+    """
+    행마다의 마지막 접속 시각을 프로세스 메모리에 모았다가
+    한 번의 UPDATE ... FROM (VALUES ...) 로 모아서 쓰는 write-behind 기록기.
+    해당 열만 바꾸고 더 이른 시각으로는 덮어쓰지 않으므로 다른 수정이나 다른 프로세스와 부딪히지 않는다.
+    프로세스가 갑자기 죽으면 최대 LAST_LOGIN_FLUSH_INTERVAL_SECONDS 초,
+    LAST_LOGIN_MAX_PENDING 건까지의 기록을 잃을 수 있다. 간격이 0 이면 바로 쓴다.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, model, field: str):
+        self.model = model
+        self.field = field
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._last_flushed = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+
+    def touch(self, pk, seen_at: Optional[datetime] = None) -> datetime:
+        """`pk` 행의 접속 시각을 모아 두고 그 시각을 반환한다."""
+        seen_at = seen_at or timezone.now()
+        with self._lock:
+            if pk not in self._pending or self._pending[pk] < seen_at:
+                self._pending[pk] = seen_at
+            due = (
+                len(self._pending) >= get_max_pending()
+                or time.monotonic() - self._last_flushed >= get_flush_interval()
+            )
+        if due:
+            # 접속 기록을 못 써도 로그인/토큰 발급은 실패시키지 않는다. 못 쓴 시각은 다음에 다시 쓴다.
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush %s", self)
+        else:
+            self._start()
+        return seen_at
+
+    def flush(self) -> int:
+        """모아 둔 시각을 쓰고 바뀐 행 수를 반환한다. 실패하면 다음 기회에 다시 쓴다."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flushed = time.monotonic()
+        if not pending:
+            return 0
+
+        table = self.model._meta.db_table
+        pk_column = self.model._meta.pk.column
+        column = self.model._meta.get_field(self.field).column
+        items = list(pending.items())
+        updated = 0
+        try:
+            with connection.cursor() as cursor:
+                for start in range(0, len(items), self.BATCH_SIZE):
+                    batch = items[start : start + self.BATCH_SIZE]
+                    cursor.execute(
+                        f"""
+                        UPDATE {table} AS t SET {column} = v.seen_at
+                        FROM (VALUES {", ".join(["(%s, %s)"] * len(batch))})
+                            AS v(id, seen_at)
+                        WHERE t.{pk_column} = v.id
+                            AND (t.{column} IS NULL OR t.{column} < v.seen_at)
+                        """,
+                        [value for item in batch for value in item],
+                    )
+                    updated += cursor.rowcount
+        except Exception:
+            with self._lock:
+                for pk, seen_at in pending.items():
+                    if pk not in self._pending or self._pending[pk] < seen_at:
+                        self._pending[pk] = seen_at
+            raise
+        return updated
+
+    def _start(self) -> None:
+        # 접속이 끊긴 프로세스에도 기록이 남지 않도록 주기적으로 쓰는 스레드를 하나 띄운다.
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name=f"{self} flusher", daemon=True
+                    )
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(max(get_flush_interval(), 1))
+            try:
+                if self._pending:
+                    self.flush()
+            except Exception:
+                logger.exception("Failed to flush %s", self)
+            finally:
+                connection.close()
+
+    def __str__(self) -> str:
+        return f"{self.model._meta.label}.{self.field}"
+
+
+_trackers = []
+
+
+def get_tracker(model: Type[models.Model], field: str) -> LastSeenTracker:
+    tracker = LastSeenTracker(model, field)
+    _trackers.append(tracker)
+    return tracker
+
+
+@atexit.register
+def flush_all() -> None:
+    for tracker in _trackers:
+        try:
+            tracker.flush()
+        except Exception:
+            logger.exception("Failed to flush %s", tracker)
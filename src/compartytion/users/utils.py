@@ -12,8 +12,9 @@ def generate_otp(length=6) -> str:
 
 
 def avatar_directory_path(instance, filename: str) -> str:
-    file_format = filename.split(".")[-1]
-    return f"avatar/{instance.account.id}.{file_format}"
+    # 내용이 바뀌면 주소도 바뀌므로 브라우저/CDN 이 파일을 오래 캐시할 수 있다.
+    file_format = filename.split(".")[-1].lower()
+    return f"avatar/{instance.avatar_hash}.{file_format}"
 
 
 def mask_email(email: str) -> str:
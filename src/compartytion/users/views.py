@@ -1,3 +1,4 @@
+from django.contrib.auth.signals import user_logged_in
 from django.utils.translation import gettext_lazy as _
 from rest_framework import viewsets, status, mixins
 from rest_framework.response import Response
@@ -17,7 +18,7 @@ from .serializers import (
     AccountSerializer,
     PasswordChangeSerializer,
     ProfileSerializer,
-    SimpleProfileSerializer,
+    RatedProfileSerializer,
     ProfileAvatarUploadSerializer,
 )
 
@@ -38,6 +39,9 @@ class AuthViewSet(viewsets.GenericViewSet):
     def login(self, request):
         serializer = TokenObtainPairSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        user_logged_in.send(
+            sender=serializer.user.__class__, request=request, user=serializer.user
+        )
         return Response(serializer.validated_data, status=status.HTTP_200_OK)
 
     @action(methods=["POST"], detail=False, serializer_class=EmailWithOTPSerializer)
@@ -139,8 +143,8 @@ class AccountViewSet(viewsets.GenericViewSet):
 
 
 class ProfileViewSet(viewsets.GenericViewSet, mixins.RetrieveModelMixin):
-    serializer_class = SimpleProfileSerializer
-    queryset = Profile.objects.all()
+    serializer_class = RatedProfileSerializer
+    queryset = Profile.objects.select_related("account__rating")
     permission_classes = [IsAuthenticated]
     lookup_field = "username"
 